@@ -8,13 +8,14 @@ import argparse
 import json
 import logging
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from mlbstatsapi import Mlb
 
+from instrumentation import add_run_arguments, count, run_report
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -283,9 +284,10 @@ def add_player(
     if fetch_stats:
         logger.info(f"Fetching stats for {player['mlbId']}...")
         try:
-            from fetch_stats import fetch_player_stats, save_game_logs
+            from fetch_stats import APIClient, fetch_player_stats, save_game_logs
 
-            stats = fetch_player_stats(mlb, int(mlb_id), year)
+            # Paced by the shared Stats API rate limiter
+            stats = fetch_player_stats(APIClient(), int(mlb_id), year)
             if stats:
                 # Save to stats file
                 stats_file = STATS_DIR / f'{year}.json'
@@ -332,8 +334,6 @@ def add_players_bulk(mlb: Mlb, players_data: list[dict], fetch_stats: bool = Fal
                 year=year
             )
             added.append(player)
-            if fetch_stats:
-                time.sleep(2)  # Rate limiting
         except Exception as e:
             logger.error(f"Failed to add player {player_data}: {e}")
 
@@ -366,50 +366,54 @@ def main():
                         help='Season year')
     parser.add_argument('--output', type=str,
                         help='Output file for results (default: stdout)')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
 
-    # Initialize MLB API client
-    mlb = Mlb()
-
-    results = []
-
-    if args.bulk:
-        # Bulk add mode
-        with open(args.bulk) as f:
-            players_data = json.load(f)
-        results = add_players_bulk(mlb, players_data, args.fetch_stats, args.year)
-    else:
-        # Single player mode
-        if not args.name and not args.mlb_id:
-            parser.error("Either --name or --id is required")
-
-        try:
-            player = add_player(
-                mlb,
-                mlb_id=args.mlb_id,
-                name=args.name,
-                team=args.team,
-                org=args.org,
-                level=args.level,
-                position=args.position,
-                lookup=args.lookup,
-                fetch_stats=args.fetch_stats,
-                year=args.year
-            )
-            results.append(player)
-        except Exception as e:
-            logger.error(f"Failed to add player: {e}")
-            sys.exit(1)
-
-    # Output results
-    output = json.dumps(results, indent=2)
-    if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output)
-        logger.info(f"Results written to {args.output}")
-    else:
-        print(output)
+    with run_report('add_player', args):
+        # Initialize MLB API client
+        mlb = Mlb()
+
+        results = []
+
+        if args.bulk:
+            # Bulk add mode
+            with open(args.bulk) as f:
+                players_data = json.load(f)
+            results = add_players_bulk(mlb, players_data, args.fetch_stats, args.year)
+        else:
+            # Single player mode
+            if not args.name and not args.mlb_id:
+                parser.error("Either --name or --id is required")
+
+            try:
+                player = add_player(
+                    mlb,
+                    mlb_id=args.mlb_id,
+                    name=args.name,
+                    team=args.team,
+                    org=args.org,
+                    level=args.level,
+                    position=args.position,
+                    lookup=args.lookup,
+                    fetch_stats=args.fetch_stats,
+                    year=args.year
+                )
+                results.append(player)
+            except Exception as e:
+                logger.error(f"Failed to add player: {e}")
+                sys.exit(1)
+
+        count('players_added', len(results))
+
+        # Output results
+        output = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output)
+            logger.info(f"Results written to {args.output}")
+        else:
+            print(output)
 
 
 if __name__ == '__main__':
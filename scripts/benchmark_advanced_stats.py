@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the advanced stats engine (calculate_advanced_stats.py).
+
+Times each stage of calculate_for_month over the archived play-by-play:
+  load_pbp_for_month       - Read the month's PBP files
+  process_games_for_stats  - Monthly and per-level accumulators
+  process_games_per_game   - Per-game accumulators
+  update_players           - update_players_advanced_stats (get_stats/get_split_stats into the player records)
+  inject_per_game_stats    - Per-game stats into the game logs
+  save_monthly_stats       - Write the month file (to a scratch directory)
+
+Each month runs in a fresh worker process and reports that process's peak RSS
+(VmHWM, which unlike ru_maxrss isn't inherited from the parent). When a month
+has no stats file, player records with game logs are built from the PBP so the
+update and inject stages have the same amount of work.
+
+Results are appended to a history file (benchmarks/advanced_stats.json, created
+by the first run; timings only mean something on the machine that produced
+them, so no runs are committed). Each month is compared with the same month in
+recent runs of the same season and machine type on the baseline host (this
+host unless --baseline-host names another, or 'any'); a month whose total time
+(or any stage's) exceeds that median by more than --threshold is reported as a
+regression and exits non-zero.
+
+Usage:
+  python benchmark_advanced_stats.py                     # All 2025 months
+  python benchmark_advanced_stats.py --months 6,7 --repeat 3
+  python benchmark_advanced_stats.py --no-record          # Compare without appending
+  python benchmark_advanced_stats.py --baseline-host ci-runner  # Compare with another host's runs
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import calculate_advanced_stats as engine
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Paths
+REPO_DIR = Path(__file__).parent.parent
+HISTORY_FILE = REPO_DIR / 'benchmarks' / 'advanced_stats.json'
+
+STAGES = [
+    'load_pbp_for_month',
+    'process_games_for_stats',
+    'process_games_per_game',
+    'update_players',
+    'inject_per_game_stats',
+    'save_monthly_stats',
+]
+
+# Short column headers for the report
+STAGE_LABELS = {
+    'load_pbp_for_month': 'load',
+    'process_games_for_stats': 'monthly',
+    'process_games_per_game': 'per-game',
+    'update_players': 'update',
+    'inject_per_game_stats': 'inject',
+    'save_monthly_stats': 'save',
+}
+
+# Regression check defaults
+DEFAULT_THRESHOLD = 0.10
+HISTORY_WINDOW = 5
+
+
+def build_players_fixture(batter_per_game: dict, pitcher_per_game: dict) -> dict:
+    """Player records with a game log entry for every game a player appears in the PBP."""
+    players = {}
+    for log_key, per_game in (('battingGameLog', batter_per_game), ('pitchingGameLog', pitcher_per_game)):
+        for player_id, games in per_game.items():
+            player = players.setdefault(player_id, {})
+            player[log_key] = [{'gameId': game_pk, 'stats': {}} for game_pk in sorted(games)]
+    return players
+
+
+def benchmark_month(year: int, month: int, repeat: int) -> Optional[dict]:
+    """
+    Time the stages of one month (runs in a worker process).
+
+    Returns:
+        Stage timings (best of `repeat`), game/at-bat counts, at-bats/sec and peak RSS,
+        or None when the month has no PBP data
+    """
+    # Keep the engine's own progress logging out of the timings
+    logging.getLogger().setLevel(logging.WARNING)
+
+    best: dict[str, float] = {}
+    games_count = at_bats = 0
+
+    for _ in range(repeat):
+        timings = {}
+
+        started = time.perf_counter()
+        games = engine.load_pbp_for_month(year, month)
+        timings['load_pbp_for_month'] = time.perf_counter() - started
+        if not games:
+            return None
+        games_count = len(games)
+        at_bats = sum(len(game.get('atBats', [])) for game in games)
+
+        started = time.perf_counter()
+        batter_stats, pitcher_stats, batter_by_level, pitcher_by_level = engine.process_games_for_stats(games)
+        timings['process_games_for_stats'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batter_per_game, pitcher_per_game = engine.process_games_per_game(games)
+        timings['process_games_per_game'] = time.perf_counter() - started
+
+        monthly_data = engine.load_monthly_stats(year, month)
+        if not monthly_data.get('players'):
+            monthly_data['players'] = build_players_fixture(batter_per_game, pitcher_per_game)
+        players = monthly_data['players']
+
+        started = time.perf_counter()
+        engine.update_players_advanced_stats(players, batter_stats, pitcher_stats,
+                                             batter_by_level, pitcher_by_level)
+        timings['update_players'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        engine.inject_per_game_stats(players, batter_per_game, pitcher_per_game)
+        timings['inject_per_game_stats'] = time.perf_counter() - started
+
+        # A fresh scratch directory each time, so the write is never skipped as unchanged.
+        # STATS_DIR is restored so the next repeat loads the real month file again.
+        stats_dir = engine.STATS_DIR
+        with tempfile.TemporaryDirectory(prefix='milb-bench-') as scratch:
+            engine.STATS_DIR = Path(scratch)
+            try:
+                started = time.perf_counter()
+                engine.save_monthly_stats(monthly_data, year, month)
+                timings['save_monthly_stats'] = time.perf_counter() - started
+            finally:
+                engine.STATS_DIR = stats_dir
+
+        for stage, seconds in timings.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+        del games, batter_stats, pitcher_stats, batter_by_level, pitcher_by_level
+        del batter_per_game, pitcher_per_game, monthly_data, players
+
+    total = sum(best.values())
+    compute = best['process_games_for_stats'] + best['process_games_per_game']
+    return {
+        'games': games_count,
+        'atBats': at_bats,
+        'stages': {stage: round(best[stage], 4) for stage in STAGES},
+        'total': round(total, 4),
+        'atBatsPerSec': round(at_bats / total) if total else None,
+        'computeAtBatsPerSec': round(at_bats / compute) if compute else None,
+        'peakRssMb': peak_rss_mb(),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in MB."""
+    # Linux carries ru_maxrss over from the parent across exec, so a spawned
+    # worker would report the parent's peak; VmHWM is this process's own
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    # ru_maxrss is bytes on macOS, KB elsewhere
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_month(year: int, month: int, repeat: int) -> Optional[dict]:
+    """Benchmark a month in a fresh process, so peak RSS isn't carried over from other months."""
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(benchmark_month, (year, month, repeat))
+
+
+def summarize_run(months: dict[str, dict]) -> dict:
+    """Totals across months."""
+    at_bats = sum(result['atBats'] for result in months.values())
+    stages = {stage: round(sum(result['stages'][stage] for result in months.values()), 4) for stage in STAGES}
+    total = round(sum(stages.values()), 4)
+    return {
+        'games': sum(result['games'] for result in months.values()),
+        'atBats': at_bats,
+        'stages': stages,
+        'total': total,
+        'atBatsPerSec': round(at_bats / total) if total else None,
+        'peakRssMb': max(result['peakRssMb'] for result in months.values()),
+    }
+
+
+def get_commit() -> Optional[str]:
+    """Short hash of the checked-out commit, if this is a git checkout."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(path: Path) -> list[dict]:
+    """Benchmark history, oldest first."""
+    if not path.exists():
+        return []
+    try:
+        with open(path) as f:
+            return json.load(f).get('runs', [])
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to read {path}: {e}")
+        return []
+
+
+def save_history(path: Path, runs: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'runs': runs}, f, indent=2)
+
+
+def is_comparable(past: dict, run: dict, baseline_host: str) -> bool:
+    """True if a history run benchmarked the same season and machine type on the baseline host ('any': all hosts)."""
+    if baseline_host != 'any' and past.get('host') != baseline_host:
+        return False
+    return all(past.get(key) == run[key] for key in ('year', 'machine'))
+
+
+def find_regressions(run: dict, history: list[dict], threshold: float, window: int,
+                     baseline_host: str) -> tuple[list[str], list[str]]:
+    """
+    Compare each month of a run with the median of that month in the last `window` comparable runs.
+
+    Args:
+        baseline_host: Host whose runs are the baseline, or 'any'
+
+    Returns:
+        (descriptions of the month totals/stages that are slower than baseline * (1 + threshold),
+         months with no comparable run to compare against)
+    """
+    comparable = [past for past in history if is_comparable(past, run, baseline_host)]
+
+    regressions = []
+    unmatched = []
+    for month, result in run['months'].items():
+        past_months = [past['months'][month] for past in comparable if month in past.get('months', {})][-window:]
+        if not past_months:
+            unmatched.append(month)
+            continue
+
+        checks = [('total', [past['total'] for past in past_months], result['total'])]
+        for stage in STAGES:
+            checks.append((stage, [past['stages'].get(stage, 0) for past in past_months], result['stages'][stage]))
+
+        for name, past_values, current in checks:
+            baseline = statistics.median(past_values)
+            # Stages this short are dominated by noise
+            if baseline < 0.05:
+                continue
+            if current > baseline * (1 + threshold):
+                regressions.append(f"{month} {name}: {current:.2f}s vs baseline {baseline:.2f}s "
+                                   f"(+{current / baseline - 1:.0%}, threshold {threshold:.0%})")
+    return regressions, unmatched
+
+
+def print_report(run: dict) -> None:
+    """Print per-month and total timings."""
+    header = f"{'month':<8}{'games':>7}{'at-bats':>10}" + ''.join(f'{STAGE_LABELS[stage]:>10}' for stage in STAGES) \
+        + f"{'total s':>10}{'AB/s':>10}{'RSS MB':>9}"
+    print(header)
+    print('-' * len(header))
+    rows = list(run['months'].items()) + [('total', run['summary'])]
+    for name, row in rows:
+        print(f"{name:<8}{row['games']:>7}{row['atBats']:>10}"
+              + ''.join(f"{row['stages'][stage]:>10.3f}" for stage in STAGES)
+              + f"{row['total']:>10.2f}{row['atBatsPerSec'] or 0:>10}{row['peakRssMb']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the advanced stats calculation over the PBP archive')
+    parser.add_argument('--year', type=int, default=2025, help='Season to benchmark (default: 2025)')
+    parser.add_argument('--months', type=str, default=None,
+                        help='Comma-separated months (default: all season months with PBP data)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per month; the best time is kept (default: 1)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Allowed slowdown vs the history baseline (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--history', type=Path, default=HISTORY_FILE, help='History file')
+    parser.add_argument('--baseline-host', type=str, default=platform.node(),
+                        help="Host whose runs are the baseline, or 'any' (default: this host)")
+    parser.add_argument('--no-record', action='store_true', help="Don't append this run to the history")
+    args = parser.parse_args()
+
+    if args.months:
+        months = [int(month) for month in args.months.split(',')]
+    else:
+        months = [month for month in engine.SEASON_MONTHS
+                  if (engine.PBP_DIR / str(args.year) / f'{month:02d}').exists()]
+
+    results = {}
+    for month in months:
+        logger.info(f"Benchmarking {args.year}-{month:02d}...")
+        result = run_month(args.year, month, args.repeat)
+        if result is None:
+            logger.info(f"No PBP data for {args.year}-{month:02d}")
+            continue
+        results[f'{month:02d}'] = result
+        logger.info(f"  {result['atBats']} at-bats in {result['total']:.2f}s "
+                    f"({result['atBatsPerSec']} at-bats/sec, peak RSS {result['peakRssMb']} MB)")
+
+    if not results:
+        logger.error("Nothing to benchmark")
+        sys.exit(1)
+
+    run = {
+        'run': datetime.now().isoformat(),
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'host': platform.node(),
+        'machine': platform.machine(),
+        'year': args.year,
+        'repeat': args.repeat,
+        'months': results,
+        'summary': summarize_run(results),
+    }
+    print_report(run)
+
+    history = load_history(args.history)
+    regressions, unmatched = find_regressions(run, history, args.threshold, HISTORY_WINDOW, args.baseline_host)
+
+    if not args.no_record:
+        save_history(args.history, history + [run])
+        logger.info(f"Appended run to {args.history}")
+
+    if regressions:
+        for regression in regressions:
+            logger.warning(f"Regression - {regression}")
+        sys.exit(1)
+    if len(unmatched) == len(run['months']):
+        hosts = 'any host' if args.baseline_host == 'any' else args.baseline_host
+        logger.info(f"No comparable baseline: no earlier {args.year} runs of these months "
+                    f"on {hosts} ({run['machine']})")
+        return
+    if unmatched:
+        logger.info(f"No comparable baseline for months {', '.join(unmatched)}")
+    logger.info("No regressions against the history baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark of the fetch scripts against the local Stats API stand-in.
+
+Starts mock_statsapi.py in-process, replaying data/pbp for the benchmarked
+date, then runs each fetch stage as a subprocess pointed at it (MLB_API_BASE):
+  fetch_stats_by_date  --date D
+  fetch_pbp            --date D
+  fetch_stats          --season Y --month M
+
+The stages run from a scratch copy of scripts/ with an empty data directory,
+so the real data/ is never touched. For each stage the report has the requests
+served, requests/sec, p50/p99 server latency, status counts and wall time,
+overall and per endpoint class.
+
+Usage:
+  python benchmark_fetch.py --date 2025-06-03
+  python benchmark_fetch.py --date 2025-06-03 --latency 80 --jitter 40 --error-rate 0.02
+  python benchmark_fetch.py --date 2025-06-03 --throttle-rps 50 --output bench.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from mock_statsapi import ReplayData, StandInServer, add_fault_arguments, faults_from_args
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = Path(__file__).parent
+
+STAGES = ['fetch_stats_by_date', 'fetch_pbp', 'fetch_stats']
+
+
+def stage_command(stage: str, date_str: str, workers: int) -> list[str]:
+    """Command line for a benchmarked stage."""
+    date = datetime.strptime(date_str, '%Y-%m-%d')
+    if stage == 'fetch_stats_by_date':
+        args = ['--date', date_str, '--workers', str(workers)]
+    elif stage == 'fetch_pbp':
+        args = ['--date', date_str, '--workers', str(workers)]
+    else:
+        args = ['--season', str(date.year), '--month', str(date.month), '--workers', str(workers)]
+    return [sys.executable, f'{stage}.py', *args]
+
+
+def run_stage(server: StandInServer, scripts_dir: Path, stage: str, date_str: str, workers: int) -> dict:
+    """Run one stage against the server and summarize the requests it made."""
+    command = stage_command(stage, date_str, workers)
+    env = dict(os.environ, MLB_API_BASE=server.base_url)
+
+    server.log.reset()
+    logger.info(f"Running {' '.join(command[1:])}...")
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=scripts_dir, env=env, capture_output=True, text=True)
+    wall_time = time.perf_counter() - started
+
+    if result.returncode != 0:
+        logger.warning(f"{stage} exited with {result.returncode}:\n{result.stderr[-2000:]}")
+
+    summary = server.log.summary(wall_time)
+    summary['exitCode'] = result.returncode
+    return summary
+
+
+def print_report(results: dict[str, dict]) -> None:
+    """Print a table of per-stage (and per-endpoint) results."""
+    header = f"{'stage / endpoint':<32}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'wall s':>10}  statuses"
+    print(header)
+    print('-' * len(header))
+    for stage, summary in results.items():
+        rows = [(stage, summary)] + [(f'  {name}', endpoint) for name, endpoint in summary['endpoints'].items()]
+        for name, row in rows:
+            wall = f"{row['wallTime']:.2f}" if 'wallTime' in row else ''
+            statuses = ' '.join(f'{status}:{count}' for status, count in row['statuses'].items())
+            print(f"{name:<32}{row['requests']:>10}{row['requestsPerSec'] or 0:>10}"
+                  f"{row['p50Ms'] or 0:>10}{row['p99Ms'] or 0:>10}{wall:>10}  {statuses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the fetch scripts against a local Stats API stand-in')
+    parser.add_argument('--date', type=str, required=True, help='Archived date to replay (YYYY-MM-DD)')
+    parser.add_argument('--stages', type=str, default=','.join(STAGES),
+                        help=f"Comma-separated stages to run (default: {','.join(STAGES)})")
+    parser.add_argument('--workers', type=int, default=10, help='--workers passed to every stage (default: 10)')
+    add_fault_arguments(parser)
+    parser.add_argument('--output', type=Path, default=None, help='Also write the results as JSON')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch directory')
+    args = parser.parse_args()
+
+    stages = [stage for stage in args.stages.split(',') if stage]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    data = ReplayData([args.date])
+    if not data.games:
+        logger.error(f"No archived play-by-play for {args.date}")
+        return
+
+    scratch = Path(tempfile.mkdtemp(prefix='milb-bench-'))
+    scripts_dir = scratch / 'scripts'
+    shutil.copytree(SCRIPTS_DIR, scripts_dir, ignore=shutil.ignore_patterns('__pycache__'))
+    (scratch / 'data').mkdir()
+
+    server = StandInServer(data, faults_from_args(args), port=0)
+    server.start()
+    results = {}
+    try:
+        for stage in stages:
+            results[stage] = run_stage(server, scripts_dir, stage, args.date, args.workers)
+    finally:
+        server.stop()
+        if args.keep:
+            logger.info(f"Scratch directory kept at {scratch}")
+        else:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    print_report(results)
+
+    if args.output:
+        report = {
+            'date': args.date,
+            'run': datetime.now().isoformat(),
+            'config': {
+                'workers': args.workers,
+                'latencyMs': args.latency,
+                'jitterMs': args.jitter,
+                'errorRate': args.error_rate,
+                'throttleRps': args.throttle_rps,
+                'seed': args.seed,
+            },
+            'stages': results,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
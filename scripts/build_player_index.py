@@ -16,6 +16,10 @@ from pathlib import Path
 
 from mlbstatsapi import Mlb
 
+from fetch_stats import APIClient, harvest_level_rosters
+from instrumentation import add_run_arguments, count, run_report, span
+from player_activity import get_activity_summary
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -47,7 +51,10 @@ SPORT_ID_TO_LEVEL = {v: k for k, v in MILB_LEVELS.items()}
 
 def get_player_activity_by_year() -> dict[str, dict]:
     """
-    Scan all stats files to find activity information for each player.
+    Read activity information for each player from the activity summary.
+
+    The summary is maintained incrementally by the stats writers (see
+    player_activity.py) and rebuilt from the stats files only if missing.
 
     Returns:
         Dict mapping player_id -> {
@@ -56,77 +63,28 @@ def get_player_activity_by_year() -> dict[str, dict]:
             'player_info': basic info from stats if available
         }
     """
-    player_activity = {}
-
-    if not STATS_DIR.exists():
-        logger.warning(f"Stats directory not found: {STATS_DIR}")
-        return player_activity
+    summary = get_activity_summary()
 
-    # Scan all year directories
-    for year_dir in STATS_DIR.iterdir():
-        if not year_dir.is_dir() or not year_dir.name.isdigit():
-            continue
-
-        year = int(year_dir.name)
+    player_activity = {}
+    for player_id, entry in summary.get('players', {}).items():
+        info = entry.get('info', {})
+        if entry.get('lastGameDate') or not info:
+            player_info = {
+                'team': entry.get('team', 'Unknown'),
+                'level': entry.get('level', 'Unknown'),
+                'type': entry.get('type', 'batter'),
+            }
+            if info.get('name'):
+                player_info['name'] = info['name']
+        else:
+            # Legacy stats files without game logs: their explicit info block
+            player_info = dict(info)
 
-        # Scan all month files in the year
-        for month_file in year_dir.glob('[0-9][0-9].json'):
-            try:
-                with open(month_file) as f:
-                    data = json.load(f)
-
-                players = data.get('players', {})
-                for player_id, player_data in players.items():
-                    if player_id not in player_activity:
-                        player_activity[player_id] = {
-                            'last_game_date': None,
-                            'years_active': set(),
-                            'player_info': None,
-                        }
-
-                    player_type = player_data.get('type', 'batter')
-
-                    # Check batting game logs
-                    for log in player_data.get('battingGameLog', []):
-                        game_date = log.get('date', '')
-                        if game_date:
-                            player_activity[player_id]['years_active'].add(year)
-                            if (player_activity[player_id]['last_game_date'] is None or
-                                    game_date > player_activity[player_id]['last_game_date']):
-                                player_activity[player_id]['last_game_date'] = game_date
-                            # Extract player info from game log if not already set
-                            if player_activity[player_id]['player_info'] is None:
-                                player_activity[player_id]['player_info'] = {
-                                    'team': log.get('team', 'Unknown'),
-                                    'level': log.get('level', 'Unknown'),
-                                    'type': player_type,
-                                }
-
-                    # Check pitching game logs
-                    for log in player_data.get('pitchingGameLog', []):
-                        game_date = log.get('date', '')
-                        if game_date:
-                            player_activity[player_id]['years_active'].add(year)
-                            if (player_activity[player_id]['last_game_date'] is None or
-                                    game_date > player_activity[player_id]['last_game_date']):
-                                player_activity[player_id]['last_game_date'] = game_date
-                            # Extract player info from game log if not already set
-                            if player_activity[player_id]['player_info'] is None:
-                                player_activity[player_id]['player_info'] = {
-                                    'team': log.get('team', 'Unknown'),
-                                    'level': log.get('level', 'Unknown'),
-                                    'type': player_type,
-                                }
-
-                    # Also check for explicit info field (legacy support)
-                    if player_activity[player_id]['player_info'] is None:
-                        info = player_data.get('info', {})
-                        if info:
-                            player_activity[player_id]['player_info'] = info
-
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to read {month_file}: {e}")
-                continue
+        player_activity[player_id] = {
+            'last_game_date': entry.get('lastGameDate'),
+            'years_active': set(entry.get('years', [])),
+            'player_info': player_info,
+        }
 
     logger.info(f"Found activity data for {len(player_activity)} players")
     return player_activity
@@ -239,8 +197,42 @@ def prune_inactive_players(players: list[dict], last_game_dates: dict[str, str],
     return active_players
 
 
+def get_milb_players_for_level_bulk(client: APIClient, year: int, sport_id: int) -> list[dict]:
+    """Fetch all players for a specific MiLB level using bulk roster requests."""
+    players = []
+    level_name = SPORT_ID_TO_LEVEL.get(sport_id, 'Unknown')
+
+    for team, roster in harvest_level_rosters(client, sport_id, year):
+        team_name = team.get('name') or 'Unknown'
+
+        parent_org = ''
+        if team.get('parentOrgName'):
+            parent_org = team['parentOrgName'][:3].upper()
+
+        for player in roster:
+            person = player.get('person', {})
+            player_id = person.get('id')
+            if not player_id:
+                continue
+
+            pos_abbrev = player.get('position', {}).get('abbreviation') or 'UTIL'
+            player_type = 'pitcher' if pos_abbrev == 'P' else 'batter'
+
+            players.append({
+                'player_id': str(player_id),
+                'name': person.get('fullName', ''),
+                'team': team_name,
+                'org': parent_org,
+                'level': level_name,
+                'position': pos_abbrev,
+                'type': player_type,
+            })
+
+    return players
+
+
 def get_milb_players_for_level(mlb: Mlb, year: int, sport_id: int) -> list[dict]:
-    """Fetch all players for a specific MiLB level using MLB Stats API."""
+    """Fetch all players for a specific MiLB level, one roster request per team."""
     players = []
     level_name = SPORT_ID_TO_LEVEL.get(sport_id, 'Unknown')
 
@@ -310,10 +302,15 @@ def get_milb_players_for_level(mlb: Mlb, year: int, sport_id: int) -> list[dict]
 def get_milb_players(mlb: Mlb, year: int) -> list[dict]:
     """Fetch all MiLB players for a year using MLB Stats API."""
     all_players = []
+    client = APIClient()
 
     for level_name, sport_id in MILB_LEVELS.items():
         logger.info(f"Fetching {level_name} players for {year}...")
-        players = get_milb_players_for_level(mlb, year, sport_id)
+        with span('rosters', level=level_name, year=year):
+            players = get_milb_players_for_level_bulk(client, year, sport_id)
+            if not players:
+                logger.info(f"  Bulk roster fetch returned no {level_name} players, falling back to per-team rosters")
+                players = get_milb_players_for_level(mlb, year, sport_id)
         all_players.extend(players)
         logger.info(f"  Found {len(players)} players at {level_name}")
 
@@ -383,8 +380,9 @@ def build_index(year: int = None, fallback_year: int = None,
     existing_ids = load_existing_players()
 
     # Get player activity from stats files first (needed for both inclusion and pruning)
-    logger.info("Scanning stats files for player activity...")
-    player_activity = get_player_activity_by_year()
+    logger.info("Loading player activity summary...")
+    with span('activity'):
+        player_activity = get_player_activity_by_year()
 
     # Fetch players from BOTH current and previous year rosters
     # This ensures we catch players who were on MiLB rosters in either season
@@ -487,7 +485,9 @@ def build_index(year: int = None, fallback_year: int = None,
     # Prune inactive players using season-based logic
     if prune_inactive:
         logger.info("Checking for inactive players to prune (season-based)...")
-        result = prune_inactive_players_by_season(result, player_activity, year)
+        with span('prune'):
+            result = prune_inactive_players_by_season(result, player_activity, year)
+    count('players', len(result))
 
     return result, year_used
 
@@ -504,37 +504,39 @@ def main():
                         help='Disable pruning of inactive players')
     parser.add_argument('--prune-days', type=int, default=INACTIVE_THRESHOLD_DAYS,
                         help=f'Days of inactivity before pruning (default: {INACTIVE_THRESHOLD_DAYS})')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
 
-    # Build index (will fallback to previous year if needed)
-    players, year_used = build_index(args.year, args.fallback_year,
-                                     prune_inactive=not args.no_prune,
-                                     prune_threshold_days=args.prune_days)
-
-    if not players:
-        logger.error("No players found. Index not created.")
-        return
-
-    # Prepare output
-    output_data = {
-        'players': players,
-        'year': year_used,
-        'requestedYear': args.year,
-        'lastUpdated': datetime.now().isoformat(),
-        'count': len(players),
-    }
-
-    # Save
-    output_path = Path(args.output) if args.output else INDEX_FILE
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
-
-    logger.info(f"Saved index to {output_path}")
-    if year_used != args.year:
-        logger.info(f"Note: Used {year_used} data (requested {args.year} had no data)")
+    with run_report('build_player_index', args):
+        # Build index (will fallback to previous year if needed)
+        players, year_used = build_index(args.year, args.fallback_year,
+                                         prune_inactive=not args.no_prune,
+                                         prune_threshold_days=args.prune_days)
+
+        if not players:
+            logger.error("No players found. Index not created.")
+            return
+
+        # Prepare output
+        output_data = {
+            'players': players,
+            'year': year_used,
+            'requestedYear': args.year,
+            'lastUpdated': datetime.now().isoformat(),
+            'count': len(players),
+        }
+
+        # Save
+        output_path = Path(args.output) if args.output else INDEX_FILE
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with span('save'), open(output_path, 'w') as f:
+            json.dump(output_data, f, indent=2)
+
+        logger.info(f"Saved index to {output_path}")
+        if year_used != args.year:
+            logger.info(f"Note: Used {year_used} data (requested {args.year} had no data)")
 
 
 if __name__ == '__main__':
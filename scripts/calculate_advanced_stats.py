@@ -28,6 +28,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from data_writer import log_write_summary, write_json
+from instrumentation import add_run_arguments, count, run_report, span
+from profiling import track_allocations
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -82,11 +86,22 @@ CSW_CODES = {'C', 'S', 'M', 'W', 'Q'}
 # All codes that count as a pitch for Swing% denominator
 PITCH_CODES = {'B', 'C', 'S', 'F', 'T', 'L', 'M', 'W', 'I', 'P', 'V', 'X', 'D', 'E', 'H', 'O', 'Q', 'R', '*B'}
 
+# Lean PBP capture (fetch_pbp.py --lean) stores call codes as one character per
+# pitch: codes that aren't a single character are written as a stand-in ('?' =
+# unknown) and mapped back to the API codes when read ('' = unknown, not a pitch)
+LEAN_CALL_ALIASES = {'*B': '*', '': '-'}
+LEAN_UNKNOWN_CALL = '?'
+LEAN_CALL_CODES = {alias: code for code, alias in LEAN_CALL_ALIASES.items()} | {LEAN_UNKNOWN_CALL: ''}
+
 # hitData.trajectory values from the MLB API
 TRAJECTORY_GB = {'ground_ball'}
 TRAJECTORY_FB = {'fly_ball', 'popup'}
 TRAJECTORY_LD = {'line_drive'}
 
+# Trajectories batted balls are classified by directly; lean records keep the
+# description (the fallback) only for other or missing trajectories
+LEAN_TRAJECTORIES = TRAJECTORY_GB | TRAJECTORY_FB | TRAJECTORY_LD
+
 # Event types for classification
 STRIKEOUT_EVENTS = {'strikeout', 'strikeout_double_play'}
 WALK_EVENTS = {'walk', 'intent_walk', 'hit_by_pitch'}
@@ -194,6 +209,22 @@ def classify_batted_ball_from_result(result: str, event_type: str, description:
     return None
 
 
+def get_pitch_calls(at_bat: dict) -> list[str]:
+    """Call codes of an at-bat's pitches, from full or lean PBP records."""
+    calls = at_bat.get('calls')
+    if calls is not None:
+        return [LEAN_CALL_CODES.get(code, code) for code in calls]
+    return [p.get('call', '') for p in at_bat.get('pitches', [])]
+
+
+def get_hit_data(at_bat: dict) -> dict:
+    """Trajectory and coordinates of an at-bat's last pitch, from full or lean PBP records."""
+    if 'calls' in at_bat:
+        return at_bat.get('hit', {})
+    pitches = at_bat.get('pitches')
+    return pitches[-1] if pitches else {}
+
+
 def is_ball_in_play(event_type: str) -> bool:
     """Check if the at-bat resulted in a ball in play."""
     if not event_type:
@@ -333,20 +364,15 @@ class PlayerAdvancedStats:
                 self.hits += 1
                 self.hr_count += 1
 
-        pitches = at_bat.get('pitches', [])
+        calls = get_pitch_calls(at_bat)
 
         # --- Batted ball classification ---
         # Prefer hitData.trajectory from pitch-level data (last pitch)
-        bb_type = None
-        trajectory = None
-        coord_x = None
-        coord_y = None
-        if pitches:
-            last_pitch = pitches[-1]
-            trajectory = last_pitch.get('trajectory')
-            coord_x = last_pitch.get('coordX')
-            coord_y = last_pitch.get('coordY')
-            bb_type = classify_batted_ball_from_trajectory(trajectory)
+        hit = get_hit_data(at_bat)
+        trajectory = hit.get('trajectory')
+        coord_x = hit.get('coordX')
+        coord_y = hit.get('coordY')
+        bb_type = classify_batted_ball_from_trajectory(trajectory)
 
         # Fallback to result/description parsing
         if bb_type is None:
@@ -379,10 +405,9 @@ class PlayerAdvancedStats:
                     self.air_pull_count += 1
 
         # --- Pitch-level stats ---
-        if pitches:
+        if calls:
             self.has_pitch_data = True
-            for p in pitches:
-                code = p.get('call', '')
+            for code in calls:
                 if code in PITCH_CODES:
                     self.total_pitches += 1
                     if code in SWING_CODES:
@@ -523,20 +548,65 @@ class PlayerAdvancedStats:
         return splits
 
 
+def load_pbp_game_file(game_file: Path) -> Optional[dict]:
+    """Load one game file of the per-game PBP layout."""
+    try:
+        with open(game_file) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Error loading {game_file}: {e}")
+        return None
+
+
+def load_pbp_day(day_path: Path) -> list[dict]:
+    """
+    Load the games of one day, from either PBP layout.
+
+    Args:
+        day_path: data/pbp/{year}/{month}/{day} without suffix - the day file is
+            {day}.json, the per-game layout is the {day}/ directory with an index.json
+    """
+    index_file = day_path / 'index.json'
+    if index_file.exists():
+        try:
+            with open(index_file) as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Error loading {index_file}: {e}")
+            return []
+
+        games = []
+        for entry in index.get('games', []):
+            game = load_pbp_game_file(day_path / f"{entry['gamePk']}.json")
+            if game:
+                games.append(game)
+        return games
+
+    day_file = day_path.with_suffix('.json')
+    if not day_file.exists():
+        return []
+
+    try:
+        with open(day_file) as f:
+            data = json.load(f)
+            return data.get('games', [])
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Error loading {day_file}: {e}")
+        return []
+
+
 def load_pbp_for_month(year: int, month: int) -> list[dict]:
     """Load all PBP data for a given month."""
     month_dir = PBP_DIR / str(year) / f'{month:02d}'
     if not month_dir.exists():
         return []
 
+    # Days saved as a day file or as a per-game directory
+    days = sorted({path.stem for path in month_dir.iterdir() if path.stem.isdigit()})
+
     games = []
-    for day_file in sorted(month_dir.glob('*.json')):
-        try:
-            with open(day_file) as f:
-                data = json.load(f)
-                games.extend(data.get('games', []))
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Error loading {day_file}: {e}")
+    for day in days:
+        games.extend(load_pbp_day(month_dir / day))
 
     return games
 
@@ -544,18 +614,7 @@ def load_pbp_for_month(year: int, month: int) -> list[dict]:
 def load_pbp_for_date(date_str: str) -> list[dict]:
     """Load PBP data for a specific date."""
     year, month, day = date_str.split('-')
-    pbp_file = PBP_DIR / year / month / f'{day}.json'
-
-    if not pbp_file.exists():
-        return []
-
-    try:
-        with open(pbp_file) as f:
-            data = json.load(f)
-            return data.get('games', [])
-    except (json.JSONDecodeError, IOError) as e:
-        logger.warning(f"Error loading {pbp_file}: {e}")
-        return []
+    return load_pbp_day(PBP_DIR / year / month / day)
 
 
 def process_games_for_stats(games: list[dict]) -> tuple[dict, dict, dict, dict]:
@@ -649,10 +708,10 @@ def save_monthly_stats(data: dict, year: int, month: int) -> None:
     data['updated'] = datetime.now().isoformat()
 
     month_file = year_dir / f'{month:02d}.json'
-    with open(month_file, 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
-
-    logger.info(f"Saved stats to {month_file}")
+    if write_json(month_file, data):
+        logger.info(f"Saved stats to {month_file}")
+    else:
+        logger.info(f"No stats changes in {month_file}")
 
 
 def update_player_advanced_stats(player_data: dict, adv_stats: dict, splits: dict, stat_type: str,
@@ -707,6 +766,52 @@ def update_player_advanced_stats(player_data: dict, adv_stats: dict, splits: dic
                     player_data[by_level_key][level][key] = value
 
 
+def update_players_advanced_stats(players: dict, batter_stats: dict, pitcher_stats: dict,
+                                  batter_by_level: dict, pitcher_by_level: dict) -> int:
+    """
+    Update player records with their monthly and per-level accumulator stats.
+
+    Returns number of batting and pitching entries updated.
+    """
+    updated_count = 0
+
+    # Update batters
+    for player_id, stats_acc in batter_stats.items():
+        adv_stats = stats_acc.get_stats(is_batter=True)
+        splits = stats_acc.get_split_stats(is_batter=True)
+
+        # Build per-level stats
+        level_stats = {}
+        if player_id in batter_by_level:
+            for level, level_acc in batter_by_level[player_id].items():
+                level_adv = level_acc.get_stats(is_batter=True)
+                if level_adv:
+                    level_stats[level] = level_adv
+
+        if player_id in players:
+            update_player_advanced_stats(players[player_id], adv_stats, splits, 'batting', level_stats)
+            updated_count += 1
+
+    # Update pitchers
+    for player_id, stats_acc in pitcher_stats.items():
+        adv_stats = stats_acc.get_stats(is_batter=False)
+        splits = stats_acc.get_split_stats(is_batter=False)
+
+        # Build per-level stats
+        level_stats = {}
+        if player_id in pitcher_by_level:
+            for level, level_acc in pitcher_by_level[player_id].items():
+                level_adv = level_acc.get_stats(is_batter=False)
+                if level_adv:
+                    level_stats[level] = level_adv
+
+        if player_id in players:
+            update_player_advanced_stats(players[player_id], adv_stats, splits, 'pitching', level_stats)
+            updated_count += 1
+
+    return updated_count
+
+
 def inject_per_game_stats(players: dict, batter_per_game: dict, pitcher_per_game: dict) -> int:
     """
     Inject per-game PBP-derived stats into game log entries.
@@ -767,18 +872,21 @@ def calculate_for_month(year: int, month: int) -> int:
     logger.info(f"Calculating advanced stats for {year}-{month:02d}")
 
     # Load PBP data for the month
-    games = load_pbp_for_month(year, month)
+    with span('load_pbp', month=f'{year}-{month:02d}'):
+        games = load_pbp_for_month(year, month)
     if not games:
         logger.info(f"No PBP data found for {year}-{month:02d}")
         return 0
 
     logger.info(f"Processing {len(games)} games")
+    count('games', len(games))
+    count('at_bats', sum(len(game.get('atBats', [])) for game in games))
 
     # Check if pitch-level data is available
     has_pitch_data = False
     for game in games[:5]:
         for ab in game.get('atBats', [])[:3]:
-            if ab.get('pitches'):
+            if ab.get('pitches') or ab.get('calls'):
                 has_pitch_data = True
                 break
         if has_pitch_data:
@@ -789,60 +897,35 @@ def calculate_for_month(year: int, month: int) -> int:
         logger.info("Legacy PBP data (at-bat level only, no Swing%/Contact%/CSW%)")
 
     # Calculate stats from PBP (monthly aggregates)
-    batter_stats, pitcher_stats, batter_by_level, pitcher_by_level = process_games_for_stats(games)
+    with span('process_games'), track_allocations('process_games'):
+        batter_stats, pitcher_stats, batter_by_level, pitcher_by_level = process_games_for_stats(games)
 
     # Calculate per-game stats from PBP
-    batter_per_game, pitcher_per_game = process_games_per_game(games)
+    with span('process_games_per_game'), track_allocations('process_games_per_game'):
+        batter_per_game, pitcher_per_game = process_games_per_game(games)
 
     # Load existing monthly stats
-    monthly_data = load_monthly_stats(year, month)
+    with span('load_stats'):
+        monthly_data = load_monthly_stats(year, month)
     players = monthly_data.get('players', {})
 
-    updated_count = 0
-
-    # Update batters
-    for player_id, stats_acc in batter_stats.items():
-        adv_stats = stats_acc.get_stats(is_batter=True)
-        splits = stats_acc.get_split_stats(is_batter=True)
-
-        # Build per-level stats
-        level_stats = {}
-        if player_id in batter_by_level:
-            for level, level_acc in batter_by_level[player_id].items():
-                level_adv = level_acc.get_stats(is_batter=True)
-                if level_adv:
-                    level_stats[level] = level_adv
-
-        if player_id in players:
-            update_player_advanced_stats(players[player_id], adv_stats, splits, 'batting', level_stats)
-            updated_count += 1
-
-    # Update pitchers
-    for player_id, stats_acc in pitcher_stats.items():
-        adv_stats = stats_acc.get_stats(is_batter=False)
-        splits = stats_acc.get_split_stats(is_batter=False)
-
-        # Build per-level stats
-        level_stats = {}
-        if player_id in pitcher_by_level:
-            for level, level_acc in pitcher_by_level[player_id].items():
-                level_adv = level_acc.get_stats(is_batter=False)
-                if level_adv:
-                    level_stats[level] = level_adv
-
-        if player_id in players:
-            update_player_advanced_stats(players[player_id], adv_stats, splits, 'pitching', level_stats)
-            updated_count += 1
+    with span('update_players'):
+        updated_count = update_players_advanced_stats(players, batter_stats, pitcher_stats,
+                                                      batter_by_level, pitcher_by_level)
 
     # Inject per-game PBP stats into game log entries
-    injected = inject_per_game_stats(players, batter_per_game, pitcher_per_game)
+    with span('inject_per_game_stats'):
+        injected = inject_per_game_stats(players, batter_per_game, pitcher_per_game)
     logger.info(f"Injected PBP stats into {injected} game log entries")
 
     # Save updated stats
     monthly_data['players'] = players
-    save_monthly_stats(monthly_data, year, month)
+    with span('save_stats'):
+        save_monthly_stats(monthly_data, year, month)
 
     logger.info(f"Updated {updated_count} players with advanced stats")
+    count('players', updated_count)
+    count('game_logs', injected)
     return updated_count
 
 
@@ -897,27 +980,30 @@ def main():
 
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug logging')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    if args.month:
-        year, month = map(int, args.month.split('-'))
-        calculate_for_month(year, month)
+    with run_report('calculate_advanced_stats', args):
+        if args.month:
+            year, month = map(int, args.month.split('-'))
+            calculate_for_month(year, month)
 
-    elif args.year:
-        calculate_for_year(args.year)
+        elif args.year:
+            calculate_for_year(args.year)
 
-    elif args.yesterday:
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        calculate_for_date(yesterday)
+        elif args.yesterday:
+            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+            calculate_for_date(yesterday)
 
-    elif args.date:
-        calculate_for_date(args.date)
+        elif args.date:
+            calculate_for_date(args.date)
 
-    logger.info("Complete!")
+        log_write_summary()
+        logger.info("Complete!")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Check that the Statcast aggregation engines reproduce the original aggregator's output.
+
+The month files used to be built by aggregating every pitch row of a month in
+one pass (reference_process_statcast_data below, kept as it was). They are now
+built by two engines that must publish the same dicts:
+  streaming   - per-day StatcastAggregate states (as saved to statcast/daily),
+                merged in date order (fetch_statcast.py)
+  vectorized  - NumPy aggregation over archived columns (--reaggregate)
+
+Rows are fed to the streaming engine in download order, which Savant does not
+keep in date order, and to the reference and vectorized engines in date order
+(the order of the raw archive). Each engine's players are compared with the
+reference as serialized JSON, so names, values and arsenal order must all match.
+
+The engines sum exactly (math.fsum), the reference sums left to right. The
+only difference allowed is an average whose exact value lies on a rounding tie
+(e.g. 14.546 / 28 = 0.5195 -> 0.519 or 0.52): there the reference's rounding
+error alone picks the side, and it picks differently for another row order.
+
+Usage:
+  python check_statcast_aggregation.py                        # 60,000 synthetic rows
+  python check_statcast_aggregation.py --rows 200000 --seed 7
+  python check_statcast_aggregation.py --year 2025 --month 6  # Archived rows of a month
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from fractions import Fraction
+from typing import Callable
+
+from fetch_statcast import (STATCAST_COLUMNS, STATCAST_LEVELS, DailyStatcastAggregate, PitcherStatcast,
+                            build_level_players, build_level_players_vectorized, is_barrel, merge_day_states,
+                            safe_float)
+from statcast_archive import StatcastColumns, read_partition
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DESCRIPTIONS = [
+    'ball', 'called_strike', 'swinging_strike', 'foul', 'hit_into_play',
+    'foul_tip', 'blocked_ball', 'swinging_strike_blocked', 'missed_bunt',
+]
+BB_TYPES = ['ground_ball', 'fly_ball', 'line_drive', 'popup']
+# Pitch type -> (mean velocity, mean spin, mean horizontal and vertical break in ft)
+PITCH_TYPES = {
+    'FF': (93.0, 2250, -0.6, 1.3),
+    'SI': (92.0, 2150, -1.2, 0.6),
+    'FC': (88.0, 2350, 0.2, 0.7),
+    'SL': (84.0, 2450, 0.4, 0.1),
+    'CU': (78.0, 2550, 0.6, -0.9),
+    'CH': (85.0, 1750, -1.1, 0.4),
+}
+
+
+def reference_aggregate_batter_statcast(records: list[dict]) -> dict:
+    """The original single-pass batter aggregation."""
+    batted_balls = []
+    total_pitches = 0
+    swings = 0
+    whiffs = 0
+
+    for rec in records:
+        total_pitches += 1
+
+        desc = rec.get('description', '').lower()
+        if 'swing' in desc or 'foul' in desc or 'hit_into_play' in desc.lower():
+            swings += 1
+            if 'swinging_strike' in desc or 'missed' in desc:
+                whiffs += 1
+
+        ev = safe_float(rec.get('launch_speed'))
+        la = safe_float(rec.get('launch_angle'))
+
+        if ev is not None and la is not None:
+            batted_balls.append({
+                'ev': ev,
+                'la': la,
+                'barrel': is_barrel(ev, la),
+                'bb_type': rec.get('bb_type', ''),
+                'xba': safe_float(rec.get('estimated_ba_using_speedangle')),
+                'xslg': safe_float(rec.get('estimated_slg_using_speedangle')),
+                'xwoba': safe_float(rec.get('estimated_woba_using_speedangle')),
+            })
+
+    if not batted_balls:
+        return {}
+
+    total_bbe = len(batted_balls)
+
+    result = {
+        'BBE': total_bbe,
+        'Pitches': total_pitches,
+    }
+
+    evs = sorted([bb['ev'] for bb in batted_balls if bb['ev'] is not None])
+    if evs:
+        result['EV'] = round(sum(evs) / len(evs), 1)
+        result['maxEV'] = round(max(evs), 1)
+        # Percentiles
+        n = len(evs)
+        result['EV50'] = round(evs[n // 2], 1)
+        idx_90 = int(n * 0.9)
+        result['EV90'] = round(evs[min(idx_90, n - 1)], 1)
+
+    las = [bb['la'] for bb in batted_balls if bb['la'] is not None]
+    if las:
+        result['LA'] = round(sum(las) / len(las), 1)
+
+    barrels = sum(1 for bb in batted_balls if bb['barrel'])
+    result['Barrel%'] = round(barrels / total_bbe, 3) if total_bbe > 0 else 0
+    result['Barrels'] = barrels
+
+    hard_hits = sum(1 for bb in batted_balls if bb['ev'] and bb['ev'] >= 95)
+    result['Hard%'] = round(hard_hits / total_bbe, 3) if total_bbe > 0 else 0
+
+    # Sweet Spot%: launch angle between 8 and 32 degrees
+    sweet_spots = sum(1 for bb in batted_balls if bb['la'] is not None and 8 <= bb['la'] <= 32)
+    result['Sweet Spot%'] = round(sweet_spots / total_bbe, 3) if total_bbe > 0 else 0
+
+    gb_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'ground_ball')
+    fb_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'fly_ball')
+    ld_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'line_drive')
+    popup_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'popup')
+
+    result['GB%'] = round(gb_count / total_bbe, 3) if total_bbe > 0 else 0
+    result['FB%'] = round(fb_count / total_bbe, 3) if total_bbe > 0 else 0
+    result['LD%'] = round(ld_count / total_bbe, 3) if total_bbe > 0 else 0
+    result['PU%'] = round(popup_count / total_bbe, 3) if total_bbe > 0 else 0
+
+    xbas = [bb['xba'] for bb in batted_balls if bb['xba'] is not None]
+    xslgs = [bb['xslg'] for bb in batted_balls if bb['xslg'] is not None]
+    xwobas = [bb['xwoba'] for bb in batted_balls if bb['xwoba'] is not None]
+
+    if xbas:
+        result['xBA'] = round(sum(xbas) / len(xbas), 3)
+    if xslgs:
+        result['xSLG'] = round(sum(xslgs) / len(xslgs), 3)
+    if xwobas:
+        result['xwOBA'] = round(sum(xwobas) / len(xwobas), 3)
+
+    if swings > 0:
+        result['Whiff%'] = round(whiffs / swings, 3)
+
+    return result
+
+
+def reference_aggregate_pitcher_statcast(records: list[dict]) -> dict:
+    """The original single-pass pitcher aggregation."""
+    pitch_data = defaultdict(list)
+    total_pitches = 0
+    called_strikes = 0
+    swinging_strikes = 0
+    swings = 0
+    extensions = []
+
+    for rec in records:
+        total_pitches += 1
+
+        pitch_type = rec.get('pitch_type', 'UN')
+        velo = safe_float(rec.get('release_speed'))
+        spin = safe_float(rec.get('release_spin_rate'))
+        ext = safe_float(rec.get('release_extension'))
+        pfx_x = safe_float(rec.get('pfx_x'))  # horizontal movement (ft)
+        pfx_z = safe_float(rec.get('pfx_z'))  # vertical movement (ft)
+
+        if ext is not None:
+            extensions.append(ext)
+
+        pitch_entry = {
+            'velo': velo,
+            'spin': spin,
+        }
+        # Store movement in inches (convert from feet)
+        if pfx_x is not None:
+            pitch_entry['hMov'] = pfx_x * 12
+        if pfx_z is not None:
+            pitch_entry['vMov'] = pfx_z * 12
+        if ext is not None:
+            pitch_entry['ext'] = ext
+
+        desc = rec.get('description', '').lower()
+        is_swing = 'swing' in desc or 'foul' in desc or 'hit_into_play' in desc
+        is_whiff = 'swinging_strike' in desc or 'missed' in desc
+
+        pitch_entry['swing'] = is_swing
+        pitch_entry['whiff'] = is_whiff
+
+        if velo is not None:
+            pitch_data[pitch_type].append(pitch_entry)
+
+        if 'called_strike' in desc:
+            called_strikes += 1
+        if is_whiff:
+            swinging_strikes += 1
+        if is_swing:
+            swings += 1
+
+    if total_pitches == 0:
+        return {}
+
+    result = {
+        'Pitches': total_pitches,
+    }
+
+    fastball_types = ['FF', 'SI', 'FC', 'FT']
+    fastball_velos = []
+    for pt in fastball_types:
+        if pt in pitch_data:
+            fastball_velos.extend([p['velo'] for p in pitch_data[pt] if p['velo'] is not None])
+
+    if fastball_velos:
+        result['Velo'] = round(sum(fastball_velos) / len(fastball_velos), 1)
+        result['maxVelo'] = round(max(fastball_velos), 1)
+
+    all_spins = []
+    for pt, pitches in pitch_data.items():
+        for p in pitches:
+            if p['spin'] is not None:
+                all_spins.append(p['spin'])
+
+    if all_spins:
+        result['SpinRate'] = round(sum(all_spins) / len(all_spins))
+
+    if extensions:
+        result['Extension'] = round(sum(extensions) / len(extensions), 1)
+
+    if swings > 0:
+        result['Whiff%'] = round(swinging_strikes / swings, 3)
+
+    csw = called_strikes + swinging_strikes
+    result['CSW%'] = round(csw / total_pitches, 3) if total_pitches > 0 else 0
+
+    # Arsenal (expanded pitch mix with movement, extension, whiff rate)
+    arsenal = {}
+    for pt, pitches in pitch_data.items():
+        if len(pitches) >= 5:
+            velos = [p['velo'] for p in pitches if p['velo'] is not None]
+            spins = [p['spin'] for p in pitches if p['spin'] is not None]
+            h_movs = [p['hMov'] for p in pitches if p.get('hMov') is not None]
+            v_movs = [p['vMov'] for p in pitches if p.get('vMov') is not None]
+            exts = [p['ext'] for p in pitches if p.get('ext') is not None]
+            pt_swings = sum(1 for p in pitches if p.get('swing'))
+            pt_whiffs = sum(1 for p in pitches if p.get('whiff'))
+
+            pitch_info = {
+                'n': len(pitches),
+                'pct': round(len(pitches) / total_pitches, 3),
+            }
+
+            if velos:
+                pitch_info['v'] = round(sum(velos) / len(velos), 1)
+                pitch_info['maxV'] = round(max(velos), 1)
+            if spins:
+                pitch_info['s'] = round(sum(spins) / len(spins))
+            if h_movs:
+                pitch_info['hMov'] = round(sum(h_movs) / len(h_movs), 1)
+            if v_movs:
+                pitch_info['vMov'] = round(sum(v_movs) / len(v_movs), 1)
+            if exts:
+                pitch_info['ext'] = round(sum(exts) / len(exts), 1)
+            if pt_swings > 0:
+                pitch_info['whiff'] = round(pt_whiffs / pt_swings, 3)
+
+            arsenal[pt] = pitch_info
+
+    if arsenal:
+        result['arsenal'] = arsenal
+
+    return result
+
+
+def reference_process_statcast_data(batter_records: list[dict], pitcher_records: list[dict], level: str) -> dict:
+    """The original player-level aggregation of a level's rows."""
+    players = {}
+
+    # Group batter records by player
+    batter_by_player = defaultdict(list)
+    for rec in batter_records:
+        player_id = rec.get('batter')
+        if player_id:
+            batter_by_player[player_id].append(rec)
+
+    for player_id, records in batter_by_player.items():
+        if len(records) >= 10:
+            player_name = records[0].get('player_name', '')
+            stats = reference_aggregate_batter_statcast(records)
+            if stats:
+                players[player_id] = {
+                    'id': player_id,
+                    'name': player_name,
+                    'type': 'batter',
+                    'level': level,
+                    'bat': stats,
+                }
+
+    # Group pitcher records by player
+    pitcher_by_player = defaultdict(list)
+    for rec in pitcher_records:
+        player_id = rec.get('pitcher')
+        if player_id:
+            pitcher_by_player[player_id].append(rec)
+
+    for player_id, records in pitcher_by_player.items():
+        if len(records) >= 50:
+            player_name = records[0].get('player_name', '')
+            stats = reference_aggregate_pitcher_statcast(records)
+            if stats:
+                if player_id in players:
+                    players[player_id]['pit'] = stats
+                    if stats.get('Pitches', 0) > players[player_id].get('bat', {}).get('BBE', 0) * 3:
+                        players[player_id]['type'] = 'pitcher'
+                else:
+                    players[player_id] = {
+                        'id': player_id,
+                        'name': player_name,
+                        'type': 'pitcher',
+                        'level': level,
+                        'pit': stats,
+                    }
+
+    return players
+
+
+def synthetic_rows(rng: random.Random, rows: int, year: int, month: int) -> list[dict]:
+    """Pitch rows shaped like Savant CSV rows (string values, Savant's precision), in date order."""
+    start = datetime(year, month, 1)
+    batters = [str(600000 + i) for i in range(max(rows // 250, 20))]
+    pitchers = [str(700000 + i) for i in range(max(rows // 1000, 10))]
+    arsenals = {pitcher: rng.sample(list(PITCH_TYPES), rng.randint(2, 5)) for pitcher in pitchers}
+
+    records = []
+    for _ in range(rows):
+        pitcher = rng.choice(pitchers)
+        pitch_type = rng.choice(arsenals[pitcher])
+        velo, spin, h_break, v_break = PITCH_TYPES[pitch_type]
+        rec = {
+            'game_date': (start + timedelta(days=rng.randrange(28))).strftime('%Y-%m-%d'),
+            'batter': rng.choice(batters),
+            'pitcher': pitcher,
+            'player_name': '',
+            'pitch_type': pitch_type,
+            'description': rng.choice(DESCRIPTIONS),
+            'release_speed': f'{rng.gauss(velo, 1.5):.1f}',
+            'release_spin_rate': str(round(rng.gauss(spin, 120))) if rng.random() > 0.03 else '',
+            'release_extension': f'{rng.gauss(6.3, 0.3):.1f}' if rng.random() > 0.03 else '',
+            'pfx_x': f'{rng.gauss(h_break, 0.25):.2f}',
+            'pfx_z': f'{rng.gauss(v_break, 0.25):.2f}',
+            'launch_speed': '', 'launch_angle': '', 'bb_type': '',
+            'estimated_ba_using_speedangle': '', 'estimated_slg_using_speedangle': '',
+            'estimated_woba_using_speedangle': '',
+        }
+        if rec['description'] == 'hit_into_play':
+            rec['launch_speed'] = f'{rng.gauss(88, 10):.1f}'
+            rec['launch_angle'] = str(round(rng.gauss(12, 25)))
+            rec['bb_type'] = rng.choice(BB_TYPES)
+            if rng.random() > 0.05:
+                rec['estimated_ba_using_speedangle'] = f'{rng.random():.3f}'
+                rec['estimated_slg_using_speedangle'] = f'{rng.random() * 2:.3f}'
+                rec['estimated_woba_using_speedangle'] = f'{rng.random() * 1.5:.3f}'
+        records.append(rec)
+
+    records.sort(key=lambda rec: rec['game_date'])
+    return records
+
+
+def with_names(records: list[dict], player_type: str, rng: random.Random) -> list[dict]:
+    """Copies of the rows named after the player_type column, with the occasional spelling variant."""
+    named = []
+    for rec in records:
+        player_id = rec[player_type]
+        name = f'Player {player_id}' if rng.random() > 0.05 else f'Plâyer {player_id}'
+        named.append({**rec, 'player_name': name})
+    return named
+
+
+def download_order(records: list[dict], rng: random.Random) -> list[dict]:
+    """Rows as Savant returns them: chunks in any order, dates descending within a chunk."""
+    by_date = defaultdict(list)
+    for rec in records:
+        by_date[rec['game_date']].append(rec)
+    dates = sorted(by_date)
+    chunks = [dates[i:i + 5] for i in range(0, len(dates), 5)]
+    rng.shuffle(chunks)
+    return [rec for chunk in chunks for date in reversed(chunk) for rec in by_date[date]]
+
+
+def streaming_players(streams: dict[tuple[str, str], list[dict]], level: str) -> dict:
+    """The fetch path: per-day states (through JSON, as saved), merged in date order."""
+    states = defaultdict(dict)
+    for (stream_level, player_type), records in streams.items():
+        daily = DailyStatcastAggregate(player_type)
+        for rec in download_order(records, random.Random(0)):
+            daily.add_row(rec)
+        for date_str, day in daily.days.items():
+            states[date_str][f'{stream_level}-{player_type}'] = json.loads(json.dumps(day.to_state()))
+    aggregates = merge_day_states(states, list(states))
+    return build_level_players(aggregates[(level, 'batter')], aggregates[(level, 'pitcher')], level.upper())
+
+
+def vectorized_players(streams: dict[tuple[str, str], list[dict]], level: str) -> dict:
+    """The --reaggregate path: archived columns in date order."""
+    columns = {}
+    for player_type in ('batter', 'pitcher'):
+        columns[player_type] = StatcastColumns()
+        for rec in streams[(level, player_type)]:
+            columns[player_type].append(rec)
+        columns[player_type] = columns[player_type].sorted_by_date()
+    return build_level_players_vectorized(columns['batter'], columns['pitcher'], level.upper())
+
+
+def exact_averages(batter_records: list[dict], pitcher_records: list[dict]) -> dict[str, Fraction]:
+    """
+    Exact value of every average the reference rounds for one player.
+
+    Keys are paths into the player entry ('bat/xBA', 'pit/arsenal/SL/v'); values
+    are the exact means of the same floats the reference sums.
+    """
+    values = defaultdict(list)
+
+    for rec in batter_records:
+        ev = safe_float(rec.get('launch_speed'))
+        la = safe_float(rec.get('launch_angle'))
+        if ev is None or la is None:
+            continue
+        values['bat/EV'].append(ev)
+        values['bat/LA'].append(la)
+        for key, column in (('xBA', 'estimated_ba_using_speedangle'), ('xSLG', 'estimated_slg_using_speedangle'),
+                            ('xwOBA', 'estimated_woba_using_speedangle')):
+            if safe_float(rec.get(column)) is not None:
+                values[f'bat/{key}'].append(safe_float(rec.get(column)))
+
+    for rec in pitcher_records:
+        ext = safe_float(rec.get('release_extension'))
+        if ext is not None:
+            values['pit/Extension'].append(ext)
+        velo = safe_float(rec.get('release_speed'))
+        if velo is None:
+            continue
+        pitch_type = rec.get('pitch_type', 'UN')
+        spin = safe_float(rec.get('release_spin_rate'))
+        if pitch_type in PitcherStatcast.FASTBALL_TYPES:
+            values['pit/Velo'].append(velo)
+        if spin is not None:
+            values['pit/SpinRate'].append(spin)
+            values[f'pit/arsenal/{pitch_type}/s'].append(spin)
+        values[f'pit/arsenal/{pitch_type}/v'].append(velo)
+        for key, column in (('hMov', 'pfx_x'), ('vMov', 'pfx_z')):
+            if safe_float(rec.get(column)) is not None:
+                values[f'pit/arsenal/{pitch_type}/{key}'].append(safe_float(rec.get(column)) * 12)
+        if ext is not None:
+            values[f'pit/arsenal/{pitch_type}/ext'].append(ext)
+
+    return {path: sum(map(Fraction, vals)) / len(vals) for path, vals in values.items()}
+
+
+def on_rounding_tie(mean: Fraction, expected, actual) -> bool:
+    """Whether `mean` is (within float noise) halfway between the two rounded values."""
+    if not all(isinstance(v, (int, float)) for v in (expected, actual)) or expected == actual:
+        return False
+    return abs(mean - (Fraction(expected) + Fraction(actual)) / 2) < Fraction(1, 10 ** 9) * max(1, abs(mean))
+
+
+def differing_leaves(expected, actual, path: str = '') -> list[tuple[str, object, object]]:
+    """(path, expected, actual) of every value that differs between two player entries."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if list(expected) != list(actual):
+            return [(path, list(expected), list(actual))]
+        return [leaf for key in expected
+                for leaf in differing_leaves(expected[key], actual[key], f'{path}/{key}'.lstrip('/'))]
+    return [] if json.dumps(expected) == json.dumps(actual) else [(path, expected, actual)]
+
+
+def compare(name: str, expected: dict, actual: dict, averages: Callable[[str], dict[str, Fraction]]) -> tuple[int, int]:
+    """
+    Log the players whose entries differ from the reference.
+
+    Args:
+        averages: Player id -> exact_averages of the player's rows
+
+    Returns:
+        (players that differ, averages that differ only on a rounding tie)
+    """
+    if json.dumps(expected) == json.dumps(actual):
+        return 0, 0
+    ties = 0
+    differing = []
+    for player_id in expected.keys() | actual.keys():
+        leaves = differing_leaves(expected.get(player_id), actual.get(player_id))
+        if not leaves:
+            continue
+        means = averages(player_id)
+        unexplained = [(path, e, a) for path, e, a in leaves
+                       if path not in means or not on_rounding_tie(means[path], e, a)]
+        ties += len(leaves) - len(unexplained)
+        if unexplained:
+            differing.append(player_id)
+    if not differing and list(expected) != list(actual):
+        logger.error(f"  {name}: players in a different order")
+        return 1, ties
+    for player_id in sorted(differing)[:5]:
+        logger.error(f"  {name} {player_id}:\n    reference {json.dumps(expected.get(player_id))}\n"
+                     f"    {name:>9} {json.dumps(actual.get(player_id))}")
+    return len(differing), ties
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the Statcast engines against the original aggregator's output")
+    parser.add_argument('--rows', type=int, default=60000, help='Synthetic rows per level and player type')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for the synthetic rows')
+    parser.add_argument('--year', type=int, default=None, help='Check the archived rows of this season')
+    parser.add_argument('--month', type=int, default=None, help='Month of the archived rows to check')
+    args = parser.parse_args()
+
+    streams = {}
+    if args.year and args.month:
+        for level in STATCAST_LEVELS:
+            for player_type in ('batter', 'pitcher'):
+                columns = read_partition(args.year, args.month, level, player_type) or StatcastColumns()
+                streams[(level, player_type)] = list(columns.sorted_by_date().records(STATCAST_COLUMNS))
+    else:
+        rng = random.Random(args.seed)
+        for level in STATCAST_LEVELS:
+            records = synthetic_rows(rng, args.rows, 2025, 6)
+            for player_type in ('batter', 'pitcher'):
+                streams[(level, player_type)] = with_names(records, player_type, rng)
+
+    differences = 0
+    for level in STATCAST_LEVELS:
+        batter_records, pitcher_records = streams[(level, 'batter')], streams[(level, 'pitcher')]
+        reference = reference_process_statcast_data(batter_records, pitcher_records, level.upper())
+        logger.info(f"{level.upper()}: {len(batter_records) + len(pitcher_records)} rows, {len(reference)} players")
+
+        def averages(player_id: str) -> dict[str, Fraction]:
+            return exact_averages([rec for rec in batter_records if rec.get('batter') == player_id],
+                                  [rec for rec in pitcher_records if rec.get('pitcher') == player_id])
+
+        streaming, vectorized = streaming_players(streams, level), vectorized_players(streams, level)
+        for name, players in (('streaming', streaming), ('vectorized', vectorized)):
+            players_differing, ties = compare(name, reference, players, averages)
+            differences += players_differing
+            if ties:
+                logger.info(f"  {name}: {ties} averages on a rounding tie rounded the other way")
+        # Both engines sum exactly, so they must agree everywhere, ties included
+        if json.dumps(streaming) != json.dumps(vectorized):
+            logger.error("  streaming and vectorized output differ")
+            differences += 1
+
+    if differences:
+        logger.error(f"{differences} players differ from the reference output")
+        sys.exit(1)
+    logger.info("Streaming and vectorized output match the reference")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Pre-compress the published JSON data files.
+
+Writes a brotli sibling next to each file the site serves (player index,
+monthly stats and Statcast files):
+  data/stats/{year}/{month}.json      - Original
+  data/stats/{year}/{month}.json.br   - brotli, quality 11
+
+GitHub Pages already serves the plain JSON gzip-encoded, which is where most
+of the transfer saving comes from, so no gzip sibling is written. Browsers whose
+DecompressionStream can decode brotli fetch the .br sibling instead, for a
+further saving over gzip; the rest (and files without a sibling) get the plain
+file.
+
+Files whose sibling is newer than the file itself are not recompressed.
+Compression runs in parallel worker processes.
+
+Usage:
+    python compress_data.py                       # Compress data/ in place
+    python compress_data.py --data-dir dist/data  # Compress a deployed copy
+"""
+
+import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import brotli
+
+from instrumentation import add_run_arguments, count, run_report, span
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+# Files served to the frontend, relative to the data directory
+PUBLISHED_PATTERNS = [
+    'player-index.json',
+    'players.json',
+    'stats/*.json',
+    'stats/[0-9]*/*.json',
+    'statcast/[0-9]*/*.json',
+]
+
+# Below this size the brotli variant isn't worth an extra request
+MIN_SIZE = 1024
+
+# Siblings and files written by earlier versions of this script
+STALE_SUFFIXES = ('.gz',)
+STALE_FILES = ('compressed.json',)
+
+BROTLI_QUALITY = 11
+
+
+def list_published_files(data_dir: Path) -> list[Path]:
+    """Published JSON files under the data directory."""
+    files = set()
+    for pattern in PUBLISHED_PATTERNS:
+        files.update(path for path in data_dir.glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def compress_file(path: Path) -> tuple[int, int]:
+    """
+    Write the .br sibling of a file.
+
+    Returns:
+        (original size, compressed size)
+    """
+    raw = path.read_bytes()
+    br = brotli.compress(raw, quality=BROTLI_QUALITY)
+
+    path.with_name(path.name + '.br').write_bytes(br)
+    remove_siblings(path, STALE_SUFFIXES)
+
+    return len(raw), len(br)
+
+
+def is_current(path: Path) -> bool:
+    """True if a file's sibling exists and is newer than the file."""
+    sibling = path.with_name(path.name + '.br')
+    return sibling.exists() and sibling.stat().st_mtime >= path.stat().st_mtime
+
+
+def remove_siblings(path: Path, suffixes: tuple[str, ...] = ('.br',) + STALE_SUFFIXES) -> None:
+    """Remove a file's compressed siblings, if any."""
+    for suffix in suffixes:
+        sibling = path.with_name(path.name + suffix)
+        if sibling.exists():
+            sibling.unlink()
+
+
+def compress_data(data_dir: Path, workers: Optional[int] = None) -> dict[str, tuple[int, int]]:
+    """
+    Compress every published file that changed since its sibling was written.
+
+    Returns:
+        Relative path -> (original size, compressed size) of every file with a sibling
+    """
+    published = list_published_files(data_dir)
+    files = {}
+    pending = []
+
+    for path in published:
+        rel = path.relative_to(data_dir).as_posix()
+        if path.stat().st_size < MIN_SIZE:
+            remove_siblings(path)
+        elif is_current(path):
+            files[rel] = (path.stat().st_size, path.with_name(path.name + '.br').stat().st_size)
+        else:
+            pending.append((rel, path))
+
+    # Siblings of files that are no longer published, and files earlier versions wrote
+    wanted = {path.with_name(path.name + '.br') for _, path in pending} | \
+        {data_dir / (rel + '.br') for rel in files}
+    for suffix in ('.br',) + STALE_SUFFIXES:
+        for sibling in data_dir.rglob(f'*.json{suffix}'):
+            if sibling not in wanted:
+                sibling.unlink()
+    for name in STALE_FILES:
+        (data_dir / name).unlink(missing_ok=True)
+
+    logger.info(f"Compressing {len(pending)} files ({len(files)} unchanged)...")
+    count('files_compressed', len(pending))
+    count('files_unchanged', len(files))
+    with span('compress', files=len(pending)), ProcessPoolExecutor(max_workers=workers) as executor:
+        for (rel, _), sizes in zip(pending, executor.map(compress_file, [path for _, path in pending])):
+            files[rel] = sizes
+            logger.debug(f"  {rel}: {sizes[0]} -> br {sizes[1]}")
+
+    total = sum(size for size, _ in files.values())
+    total_br = sum(br for _, br in files.values())
+    if total:
+        logger.info(f"{len(files)} files: {total / 1e6:.1f} MB -> brotli {total_br / 1e6:.1f} MB "
+                    f"({1 - total_br / total:.0%} smaller)")
+
+    return dict(sorted(files.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write brotli siblings of the published data files')
+    parser.add_argument('--data-dir', type=Path, default=DATA_DIR,
+                        help='Data directory to compress (default: data/)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Parallel compression processes (default: CPU count)')
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    add_run_arguments(parser)
+    args = parser.parse_args()
+
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if not args.data_dir.exists():
+        logger.error(f"Data directory not found: {args.data_dir}")
+        return
+
+    with run_report('compress_data', args):
+        compress_data(args.data_dir, args.workers)
+        logger.info("Complete!")
+
+
+if __name__ == '__main__':
+    main()
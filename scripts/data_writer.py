@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Content-addressed JSON writes for the data files.
+
+Most data files carry an `updated` (or `lastUpdated`) timestamp that changes on
+every run. write_json() hashes a file's content with those timestamps left out
+and only writes when the hash differs from the file already on disk, so re-running
+a script over unchanged data leaves the file - and the nightly commit - untouched.
+
+Writes are counted per process; scripts call log_write_summary() at the end to
+report how many files actually changed.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Top-level keys that change on every save and don't count as content
+VOLATILE_KEYS = frozenset({'updated', 'lastUpdated'})
+
+_lock = threading.Lock()
+_changed: list[Path] = []
+_unchanged = 0
+
+
+def content_hash(data: Any) -> str:
+    """Hash of a JSON document's content, ignoring key order and volatile timestamps."""
+    if isinstance(data, dict):
+        data = {key: value for key, value in data.items() if key not in VOLATILE_KEYS}
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def file_content_hash(path: Path) -> Optional[str]:
+    """Content hash of an existing JSON file, or None if it's missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            return content_hash(json.load(f))
+    except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+        return None
+
+
+def write_json(path: Path, data: Any, indent: Optional[int] = None) -> bool:
+    """
+    Write a JSON file unless the file on disk already has the same content.
+
+    Args:
+        path: Output file
+        data: JSON-serializable document
+        indent: Indentation (e.g. 2 for manifests); compact separators when None
+
+    Returns:
+        True if the file was written, False if it was left unchanged
+    """
+    global _unchanged
+
+    path = Path(path)
+    if file_content_hash(path) == content_hash(data):
+        with _lock:
+            _unchanged += 1
+        logger.debug(f"Unchanged, not rewritten: {path}")
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        if indent is None:
+            json.dump(data, f, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=indent)
+
+    with _lock:
+        _changed.append(path)
+    return True
+
+
+def get_write_counts() -> tuple[int, int]:
+    """Files written and files left unchanged by this process so far."""
+    with _lock:
+        return len(_changed), _unchanged
+
+
+def log_write_summary() -> None:
+    """Log how many of the files saved by this process actually changed."""
+    changed, unchanged = get_write_counts()
+    logger.info(f"Files changed: {changed} of {changed + unchanged} ({unchanged} unchanged, not rewritten)")
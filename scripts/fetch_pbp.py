@@ -8,6 +8,12 @@ pitch-level data with batter/pitcher matchup information needed for handedness s
 Data is stored by date:
   data/pbp/{year}/{month}/{day}.json - All games for that day
 
+or, with --per-game, one file per game plus a day index:
+  data/pbp/{year}/{month}/{day}/{gamePk}.json - One game
+  data/pbp/{year}/{month}/{day}/index.json    - gamePk, level, teams, byte size and
+                                                at-bat count of each game
+so a single game can be refetched (--game) or loaded without parsing the whole day.
+
 Usage:
   # Fetch yesterday's games
   python fetch_pbp.py --yesterday
@@ -23,11 +29,20 @@ Usage:
 
   # Adjust worker count (default: 200)
   python fetch_pbp.py --month 2025-06 --workers 100
+
+  # Lean capture (smaller files, only the fields advanced stats use)
+  python fetch_pbp.py --yesterday --lean
+
+  # Write one file per game, or refetch a single game
+  python fetch_pbp.py --yesterday --per-game
+  python fetch_pbp.py --date 2025-06-15 --game 745123
 """
 
 import argparse
 import json
 import logging
+import os
+import shutil
 import time
 from calendar import monthrange
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -37,6 +52,12 @@ from typing import Optional
 
 import requests
 
+from calculate_advanced_stats import LEAN_CALL_ALIASES, LEAN_TRAJECTORIES, LEAN_UNKNOWN_CALL
+from data_writer import log_write_summary, write_json
+from instrumentation import (add_run_arguments, count, endpoint_class, error_status, record_failure,
+                             record_request, record_retry, run_report, span)
+from rate_limiter import CircuitOpenError, get_limiter, is_retryable, retry_after_seconds
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,10 +70,10 @@ DATA_DIR = Path(__file__).parent.parent / 'data'
 PBP_DIR = DATA_DIR / 'pbp'
 
 # API
-MLB_API_BASE = 'https://statsapi.mlb.com/api/v1'
+# Overridable to point at a stand-in server (see mock_statsapi.py)
+MLB_API_BASE = os.environ.get('MLB_API_BASE', 'https://statsapi.mlb.com/api/v1')
 REQUEST_TIMEOUT = 60
 MAX_RETRIES = 3
-RETRY_DELAY = 2
 
 # MiLB levels and their sport IDs
 MILB_SPORT_IDS = {
@@ -79,21 +100,47 @@ class APIClient:
             'Accept': 'application/json',
             'User-Agent': 'MiLB-Tracker/1.0'
         })
+        self.limiter = get_limiter('statsapi')
 
     def get(self, endpoint: str, params: dict = None) -> Optional[dict]:
-        """GET request with retries."""
+        """GET request paced by the shared Stats API limiter, retried on 429/5xx and transport errors."""
         url = f"{MLB_API_BASE}{endpoint}"
+        kind = endpoint_class(endpoint)
 
         for attempt in range(MAX_RETRIES):
+            try:
+                self.limiter.acquire()
+            except CircuitOpenError as e:
+                logger.debug(f"Request skipped: {e}")
+                break
+            started = time.perf_counter()
+            retry_after = None
             try:
                 resp = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                latency = time.perf_counter() - started
+                retry_after = retry_after_seconds(resp.headers.get('Retry-After'))
                 resp.raise_for_status()
-                return resp.json()
+                decode_started = time.perf_counter()
+                data = resp.json()
+                self.limiter.release(resp.status_code)
+                record_request(kind, resp.status_code, latency, len(resp.content),
+                               time.perf_counter() - decode_started)
+                return data
             except requests.exceptions.RequestException as e:
+                status = error_status(e)
+                self.limiter.release(status, retry_after)
+                response = getattr(e, 'response', None)
+                record_request(kind, status, time.perf_counter() - started,
+                               len(response.content) if response is not None else 0)
+                if not is_retryable(status):
+                    break
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
+                    delay = self.limiter.backoff(attempt, retry_after)
+                    record_retry(kind, delay)
+                    time.sleep(delay)
                 else:
                     logger.debug(f"Request failed after {MAX_RETRIES} attempts: {e}")
+        record_failure(kind)
         return None
 
 
@@ -151,7 +198,51 @@ def fetch_play_by_play(client: APIClient, game_pk: int) -> Optional[dict]:
     return data
 
 
-def extract_at_bats(pbp_data: dict, game_info: dict) -> list[dict]:
+def encode_lean_calls(pitches: list[dict]) -> str:
+    """Encode an at-bat's pitch call codes as one character per pitch."""
+    calls = []
+    for pitch in pitches:
+        code = pitch.get('call', '')
+        code = LEAN_CALL_ALIASES.get(code, code)
+        calls.append(code if len(code) == 1 else LEAN_UNKNOWN_CALL)
+    return ''.join(calls)
+
+
+def make_lean_at_bat(at_bat: dict, names: dict) -> dict:
+    """
+    Reduce a full at-bat record to the fields calculate_advanced_stats.py uses.
+
+    Player names go to the day's `names` dictionary, call codes become a string
+    (see encode_lean_calls), hit data is kept from the last pitch, and the
+    description is only kept when there is no trajectory to classify by.
+    """
+    names[str(at_bat['batterId'])] = at_bat.get('batterName')
+    if at_bat.get('pitcherId'):
+        names[str(at_bat['pitcherId'])] = at_bat.get('pitcherName')
+
+    lean = {
+        'batterId': at_bat['batterId'],
+        'batterHand': at_bat.get('batterHand'),
+        'pitcherId': at_bat.get('pitcherId'),
+        'pitcherHand': at_bat.get('pitcherHand'),
+        'result': at_bat.get('result'),
+        'eventType': at_bat.get('eventType'),
+        'calls': encode_lean_calls(at_bat['pitches']),
+    }
+    if at_bat.get('rbi'):
+        lean['rbi'] = at_bat['rbi']
+
+    last_pitch = at_bat['pitches'][-1] if at_bat['pitches'] else {}
+    hit = {key: last_pitch[key] for key in ('trajectory', 'coordX', 'coordY') if key in last_pitch}
+    if hit:
+        lean['hit'] = hit
+    if hit.get('trajectory') not in LEAN_TRAJECTORIES and at_bat.get('description'):
+        lean['description'] = at_bat['description']
+
+    return lean
+
+
+def extract_at_bats(pbp_data: dict, game_info: dict, names: Optional[dict] = None) -> list[dict]:
     """
     Extract at-bat level data from play-by-play response.
 
@@ -162,6 +253,9 @@ def extract_at_bats(pbp_data: dict, game_info: dict) -> list[dict]:
     - pitch count, outcome stats
     - pitches: list of individual pitch events with call codes
     - hitData: trajectory, coordinates for batted balls
+
+    With a `names` dictionary (lean capture), records are reduced by
+    make_lean_at_bat and player names are collected into `names` instead.
     """
     at_bats = []
     game_pk = game_info.get('gamePk')
@@ -258,6 +352,9 @@ def extract_at_bats(pbp_data: dict, game_info: dict) -> list[dict]:
         at_bat['strikes'] = strikes
         at_bat['balls'] = balls
 
+        if names is not None:
+            at_bat = make_lean_at_bat(at_bat, names)
+
         at_bats.append(at_bat)
 
     if not at_bats and all_plays:
@@ -266,8 +363,8 @@ def extract_at_bats(pbp_data: dict, game_info: dict) -> list[dict]:
     return at_bats
 
 
-def process_game(game: dict, client: APIClient) -> Optional[dict]:
-    """Process a single game and return its play-by-play data."""
+def process_game(game: dict, client: APIClient, names: Optional[dict] = None) -> Optional[dict]:
+    """Process a single game and return its play-by-play data (lean if given a `names` dictionary)."""
     game_pk = game.get('gamePk')
     if not game_pk:
         logger.debug(f"Game missing gamePk field")
@@ -281,7 +378,7 @@ def process_game(game: dict, client: APIClient) -> Optional[dict]:
     # Log the structure of returned data for debugging
     logger.debug(f"Game {game_pk}: PBP data keys: {list(pbp_data.keys())}")
 
-    at_bats = extract_at_bats(pbp_data, game)
+    at_bats = extract_at_bats(pbp_data, game, names)
 
     if not at_bats:
         logger.debug(f"Game {game_pk}: No at-bats extracted from play-by-play data")
@@ -308,13 +405,15 @@ def process_game(game: dict, client: APIClient) -> Optional[dict]:
     }
 
 
-def fetch_date(date_str: str, max_workers: int = 200) -> dict:
+def fetch_date(date_str: str, max_workers: int = 200, lean: bool = False) -> dict:
     """
     Fetch play-by-play data for all MiLB games on a specific date.
 
     Args:
         date_str: Date in YYYY-MM-DD format
         max_workers: Number of parallel workers (default: 200)
+        lean: Capture lean at-bat records, with player names in one
+            dictionary for the day (see make_lean_at_bat)
 
     Returns:
         Dict with date metadata and list of game records
@@ -322,7 +421,8 @@ def fetch_date(date_str: str, max_workers: int = 200) -> dict:
     client = APIClient()
 
     # Get all completed games for this date
-    games = get_games_for_date(client, date_str)
+    with span('schedule', date=date_str):
+        games = get_games_for_date(client, date_str)
     logger.info(f"Found {len(games)} completed games for {date_str}")
 
     if not games:
@@ -336,13 +436,14 @@ def fetch_date(date_str: str, max_workers: int = 200) -> dict:
     # Fetch play-by-play for each game in parallel
     game_records = []
     failed = 0
+    names = {} if lean else None
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with span('play_by_play', date=date_str, games=len(games)), ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Each worker gets its own client for thread safety
         future_to_game = {}
         for game in games:
             game_client = APIClient()
-            future = executor.submit(process_game, game, game_client)
+            future = executor.submit(process_game, game, game_client, names)
             future_to_game[future] = game.get('gamePk')
 
         for future in as_completed(future_to_game):
@@ -356,6 +457,9 @@ def fetch_date(date_str: str, max_workers: int = 200) -> dict:
                 failed += 1
 
     logger.info(f"Processed {len(game_records)} games, {failed} failed")
+    count('games', len(game_records))
+    count('games_failed', failed)
+    count('at_bats', sum(len(record['atBats']) for record in game_records))
 
     # If we found games but processed none, provide helpful message
     if len(games) > 0 and len(game_records) == 0:
@@ -363,29 +467,115 @@ def fetch_date(date_str: str, max_workers: int = 200) -> dict:
                       f"This usually means play-by-play data is not available. "
                       f"Try running with --debug for more details.")
 
-    return {
+    data = {
         'date': date_str,
         'updated': datetime.now().isoformat(),
         'gameCount': len(game_records),
         'games': game_records,
     }
+    if lean:
+        data['format'] = 'lean'
+        data['players'] = dict(sorted(names.items(), key=lambda item: int(item[0])))
+    return data
+
+
+def get_day_paths(date_str: str) -> tuple[Path, Path]:
+    """Day file and per-game directory for a date."""
+    year, month, day = date_str.split('-')
+    month_dir = PBP_DIR / year / month
+    return month_dir / f'{day}.json', month_dir / day
 
 
 def save_date_data(date_str: str, data: dict) -> None:
     """Save play-by-play data for a specific date."""
-    year, month, day = date_str.split('-')
+    output_file, game_dir = get_day_paths(date_str)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if write_json(output_file, data):
+        logger.info(f"Saved {data['gameCount']} games to {output_file}")
+    else:
+        logger.info(f"No changes for {data['gameCount']} games in {output_file}")
+
+    # The day file replaces any per-game layout for the date
+    if game_dir.exists():
+        shutil.rmtree(game_dir)
 
-    # Create directory structure: data/pbp/{year}/{month}/
-    date_dir = PBP_DIR / year / month
-    date_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save as {day}.json
-    output_file = date_dir / f'{day}.json'
+def build_game_index_entry(game: dict, game_file: Path) -> dict:
+    """Day index entry for a saved game file."""
+    return {
+        'gamePk': game['gamePk'],
+        'level': game.get('level'),
+        'awayTeam': game.get('awayTeam'),
+        'homeTeam': game.get('homeTeam'),
+        'bytes': game_file.stat().st_size,
+        'atBats': len(game.get('atBats', [])),
+    }
+
+
+def load_game_index(date_str: str) -> dict:
+    """Load a date's per-game index, or an empty one if there is none."""
+    _, game_dir = get_day_paths(date_str)
+    index_file = game_dir / 'index.json'
+    if index_file.exists():
+        try:
+            with open(index_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {index_file}: {e}")
+    return {'date': date_str, 'gameCount': 0, 'games': []}
+
+
+def save_date_games(date_str: str, games: list[dict], players: Optional[dict] = None) -> None:
+    """
+    Save play-by-play data for a date as one file per game plus a day index.
+
+    Games already saved for the date and not in `games` are kept, so a single
+    game can be refetched without touching the rest of the day.
+
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        games: Game records to save
+        players: Player names of lean records, merged into the index's dictionary
+    """
+    day_file, game_dir = get_day_paths(date_str)
+    game_dir.mkdir(parents=True, exist_ok=True)
+
+    existing = load_game_index(date_str)
+    entries = {entry['gamePk']: entry for entry in existing.get('games', [])}
+    changed = 0
+    for game in games:
+        game_file = game_dir / f"{game['gamePk']}.json"
+        if write_json(game_file, game):
+            changed += 1
+        entries[game['gamePk']] = build_game_index_entry(game, game_file)
+
+    index = {
+        'date': date_str,
+        'updated': datetime.now().isoformat(),
+        'gameCount': len(entries),
+        'games': [entries[game_pk] for game_pk in sorted(entries)],
+    }
+    names = {**existing.get('players', {}), **(players or {})}
+    if names:
+        index['players'] = dict(sorted(names.items(), key=lambda item: int(item[0])))
+    write_json(game_dir / 'index.json', index)
+    logger.info(f"Saved {len(games)} games ({changed} changed) to {game_dir}/, {len(entries)} games indexed")
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
+    # The per-game layout replaces any day file for the date
+    if day_file.exists():
+        day_file.unlink()
 
-    logger.info(f"Saved {data['gameCount']} games to {output_file}")
+
+def fetch_game(date_str: str, game_pk: int, names: Optional[dict] = None) -> Optional[dict]:
+    """Fetch play-by-play data for a single game on a date (lean if given a `names` dictionary)."""
+    client = APIClient()
+    for game in get_games_for_date(client, date_str):
+        if game.get('gamePk') == game_pk:
+            return process_game(game, client, names)
+
+    logger.warning(f"Game {game_pk} is not a completed game on {date_str}")
+    return None
 
 
 def update_manifest(year: int, months: list[int]) -> None:
@@ -398,10 +588,11 @@ def update_manifest(year: int, months: list[int]) -> None:
     for month in months:
         month_dir = year_dir / f'{month:02d}'
         if month_dir.exists():
-            days = sorted([
-                int(f.stem) for f in month_dir.glob('*.json')
-                if f.stem.isdigit()
-            ])
+            # Day files and per-game day directories
+            days = sorted(
+                {int(f.stem) for f in month_dir.glob('*.json') if f.stem.isdigit()}
+                | {int(d.name) for d in month_dir.iterdir() if d.name.isdigit() and (d / 'index.json').exists()}
+            )
             if days:
                 months_data[month] = days
 
@@ -412,10 +603,8 @@ def update_manifest(year: int, months: list[int]) -> None:
     }
 
     manifest_file = year_dir / 'manifest.json'
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
-
-    logger.info(f"Updated manifest: {manifest_file}")
+    if write_json(manifest_file, manifest, indent=2):
+        logger.info(f"Updated manifest: {manifest_file}")
 
 
 def get_dates_for_month(year: int, month: int) -> list[str]:
@@ -434,81 +623,106 @@ def main():
     parser.add_argument('--yesterday', action='store_true', help='Fetch yesterday\'s games')
     parser.add_argument('--workers', type=int, default=200,
                         help='Number of parallel workers (default: 200)')
+    parser.add_argument('--lean', action='store_true',
+                        help='Lean capture: player names once per day, call codes as a string per at-bat, '
+                             'descriptions only without trajectory')
+    parser.add_argument('--per-game', action='store_true',
+                        help='Save one file per game plus a day index instead of one file per day')
+    parser.add_argument('--game', type=int,
+                        help='Refetch a single game (gamePk) on --date into the per-game layout')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    add_run_arguments(parser)
     args = parser.parse_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Determine which dates to fetch
-    dates_to_fetch = []
-    target_year = None
-    target_months = set()
-
-    if args.date:
-        dates_to_fetch = [args.date]
-        target_year = int(args.date.split('-')[0])
-        target_months.add(int(args.date.split('-')[1]))
-    elif args.month:
-        year, month = map(int, args.month.split('-'))
-        dates_to_fetch = get_dates_for_month(year, month)
-        target_year = year
-        target_months.add(month)
-        # Only fetch up to today
-        today = datetime.now().strftime('%Y-%m-%d')
-        dates_to_fetch = [d for d in dates_to_fetch if d <= today]
-    elif args.year:
-        target_year = args.year
-        for month in SEASON_MONTHS:
-            dates_to_fetch.extend(get_dates_for_month(args.year, month))
+    with run_report('fetch_pbp', args):
+        # Determine which dates to fetch
+        dates_to_fetch = []
+        target_year = None
+        target_months = set()
+
+        if args.date:
+            dates_to_fetch = [args.date]
+            target_year = int(args.date.split('-')[0])
+            target_months.add(int(args.date.split('-')[1]))
+        elif args.month:
+            year, month = map(int, args.month.split('-'))
+            dates_to_fetch = get_dates_for_month(year, month)
+            target_year = year
             target_months.add(month)
-        # Only fetch up to today
-        today = datetime.now().strftime('%Y-%m-%d')
-        dates_to_fetch = [d for d in dates_to_fetch if d <= today]
-    elif args.yesterday:
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        dates_to_fetch = [yesterday]
-        target_year = int(yesterday.split('-')[0])
-        target_months.add(int(yesterday.split('-')[1]))
-    else:
-        parser.error('Must specify --date, --month, --year, or --yesterday')
-
-    logger.info(f"Will fetch {len(dates_to_fetch)} dates with {args.workers} workers")
-
-    # Fetch each date
-    total_games = 0
-    for i, date_str in enumerate(dates_to_fetch, 1):
-        logger.info(f"[{i}/{len(dates_to_fetch)}] Fetching {date_str}...")
-
-        try:
-            data = fetch_date(date_str, max_workers=args.workers)
-            if data['gameCount'] > 0:
-                save_date_data(date_str, data)
-                total_games += data['gameCount']
-            else:
-                logger.info(f"  No games for {date_str}, skipping save")
-        except Exception as e:
-            logger.error(f"Error fetching {date_str}: {e}")
-            if args.debug:
-                raise
-
-        # Small delay between dates to be nice to the API
-        if i < len(dates_to_fetch):
-            time.sleep(0.5)
-
-    # Update manifest
-    if target_year and target_months:
-        # Get all months that have data
-        year_dir = PBP_DIR / str(target_year)
-        if year_dir.exists():
-            all_months = sorted([
-                int(d.name) for d in year_dir.iterdir()
-                if d.is_dir() and d.name.isdigit()
-            ])
-            if all_months:
-                update_manifest(target_year, all_months)
-
-    logger.info(f"Complete! Fetched {total_games} total games across {len(dates_to_fetch)} dates")
+            # Only fetch up to today
+            today = datetime.now().strftime('%Y-%m-%d')
+            dates_to_fetch = [d for d in dates_to_fetch if d <= today]
+        elif args.year:
+            target_year = args.year
+            for month in SEASON_MONTHS:
+                dates_to_fetch.extend(get_dates_for_month(args.year, month))
+                target_months.add(month)
+            # Only fetch up to today
+            today = datetime.now().strftime('%Y-%m-%d')
+            dates_to_fetch = [d for d in dates_to_fetch if d <= today]
+        elif args.yesterday:
+            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+            dates_to_fetch = [yesterday]
+            target_year = int(yesterday.split('-')[0])
+            target_months.add(int(yesterday.split('-')[1]))
+        else:
+            parser.error('Must specify --date, --month, --year, or --yesterday')
+
+        total_games = 0
+        if args.game:
+            if not args.date:
+                parser.error('--game requires --date')
+            names = {} if args.lean else None
+            game = fetch_game(args.date, args.game, names)
+            if game:
+                # Bring the rest of the day into the per-game layout first
+                day_file, _ = get_day_paths(args.date)
+                if day_file.exists():
+                    with open(day_file) as f:
+                        day_data = json.load(f)
+                    save_date_games(args.date, day_data.get('games', []), day_data.get('players'))
+                save_date_games(args.date, [game], names)
+                total_games = 1
+        else:
+            logger.info(f"Will fetch {len(dates_to_fetch)} dates with {args.workers} workers")
+
+            # Fetch each date
+            for i, date_str in enumerate(dates_to_fetch, 1):
+                logger.info(f"[{i}/{len(dates_to_fetch)}] Fetching {date_str}...")
+
+                try:
+                    data = fetch_date(date_str, max_workers=args.workers, lean=args.lean)
+                    if data['gameCount'] > 0:
+                        with span('save', date=date_str):
+                            if args.per_game:
+                                save_date_games(date_str, data['games'], data.get('players'))
+                            else:
+                                save_date_data(date_str, data)
+                        total_games += data['gameCount']
+                    else:
+                        logger.info(f"  No games for {date_str}, skipping save")
+                except Exception as e:
+                    logger.error(f"Error fetching {date_str}: {e}")
+                    if args.debug:
+                        raise
+
+        # Update manifest
+        if target_year and target_months:
+            # Get all months that have data
+            year_dir = PBP_DIR / str(target_year)
+            if year_dir.exists():
+                all_months = sorted([
+                    int(d.name) for d in year_dir.iterdir()
+                    if d.is_dir() and d.name.isdigit()
+                ])
+                if all_months:
+                    update_manifest(target_year, all_months)
+
+        log_write_summary()
+        logger.info(f"Complete! Fetched {total_games} total games across {len(dates_to_fetch)} dates")
 
 
 if __name__ == '__main__':
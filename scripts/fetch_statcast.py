@@ -12,26 +12,56 @@ and aggregates it into player-level Statcast metrics.
 Data is stored in monthly files to avoid GitHub's file size limits:
   data/statcast/{year}/{month}.json  - Player data for that month
   data/statcast/{year}/manifest.json - Lists available months
+
+Monthly stats files (data/stats/{year}/{month}.json) are enriched with each
+player's Statcast block, or with --statcast-sidecar the blocks are written to
+data/stats/{year}/{month}.statcast.json and joined by the frontend loader.
+
+Each fetched day is also saved as mergeable per-player totals, from which the
+monthly files and the season-to-date and rolling views are built by merging
+(the daily files are working state like the raw archive below: ignored by git,
+left out of the Pages deploy and kept in an Actions cache):
+  data/statcast/daily/{year}/{month}/{day}.json - Per-player totals for one day
+  data/statcast/daily/{year}/index.json         - Dates already fetched
+  data/statcast/{year}/season.json              - Season to date, with all-level percentiles
+  data/statcast/{year}/rolling.json             - Last 7/14/30 days
+so nightly runs (--yesterday) only download the days not fetched yet.
+
+The fetched pitch rows are also kept in a columnar archive (see statcast_archive.py)
+so `--reaggregate` can rebuild the monthly files without touching the network:
+  data/statcast/raw/{year}/{month}/{level}-{player_type}.bin.gz
 """
 
 import argparse
 import csv
-import io
 import json
 import logging
+import math
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import requests
 
+from data_writer import content_hash, log_write_summary, write_json
+from fetch_stats import STATCAST_SIDECAR_SUFFIX, list_statcast_sidecar_months
+from instrumentation import (add_run_arguments, count, error_status, record_failure, record_request, record_retry,
+                             run_report, span)
+from profiling import track_allocations
+from rate_limiter import AdaptiveRateLimiter, CircuitOpenError, get_limiter, is_retryable, retry_after_seconds
+from statcast_archive import ARCHIVE_COLUMNS, StatcastColumns, list_archived_months, read_partition, update_partition
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / 'data'
 STATCAST_DIR = DATA_DIR / 'statcast'
+DAILY_DIR = STATCAST_DIR / 'daily'
 STATS_DIR = DATA_DIR / 'stats'
 
 # Baseball Savant endpoints (minors uses hyphens, MLB uses underscore)
@@ -40,16 +70,49 @@ SAVANT_MINORS_URL = 'https://baseballsavant.mlb.com/statcast-search-minors/csv'
 # Request settings - following sabRmetrics chunking approach
 REQUEST_TIMEOUT = 120  # 2 minutes per chunk (chunks are smaller now)
 MAX_RETRIES = 3
-RETRY_DELAY = 5
-CHUNK_DAYS = 5  # Split date ranges into 5-day chunks (sabRmetrics strategy)
+CHUNK_DAYS = 5  # Initial chunk size in days (sabRmetrics strategy), adapted to row density
+MAX_CHUNK_DAYS = 15  # Largest chunk used when data is sparse (season edges, All-Star break)
+TARGET_CHUNK_FILL = 0.5  # Size chunks to aim for this fraction of the row limit
 ROW_LIMIT_WARNING = 25000  # Baseball Savant returns max 25,000 rows per query
 
+# Filters used to partition a single day that still hits the row limit.
+# Each filter's values together cover every row, so the halves can be recombined.
+SPLIT_FILTERS = [
+    ('home_road', ['Home', 'Road']),
+    ('pitcher_throws', ['R', 'L']),
+]
+
+# Concurrency settings - chunks x levels x player types are downloaded in parallel
+MAX_IN_FLIGHT = 6  # Maximum concurrent Savant requests
+REQUESTS_PER_SECOND = 2.0  # Maximum request starts per second against Savant
+
+# Levels with MiLB Statcast coverage: 'aaa' for Triple-A, 'a' for Single-A (FSL)
+STATCAST_LEVELS = ['aaa', 'a']
+PLAYER_TYPES = ['batter', 'pitcher']
+
 # Known CSV column names to detect valid responses
 VALID_CSV_COLUMNS = ['pitch_type', 'release_speed', 'batter', 'pitcher', 'game_date', 'launch_speed']
 
+# Columns the aggregations read; everything else in Savant's CSV is dropped while parsing
+STATCAST_COLUMNS = [
+    'game_date', 'batter', 'pitcher', 'player_name', 'description', 'bb_type',
+    'launch_speed', 'launch_angle',
+    'estimated_ba_using_speedangle', 'estimated_slg_using_speedangle', 'estimated_woba_using_speedangle',
+    'pitch_type', 'release_speed', 'release_spin_rate', 'release_extension', 'pfx_x', 'pfx_z',
+]
+
 # Season months (April = 4 through September = 9)
 SEASON_MONTHS = [4, 5, 6, 7, 8, 9]
 
+# Rolling windows (days) merged from the per-day aggregates
+ROLLING_WINDOWS = [7, 14, 30]
+
+# Quantile sketch resolution (bins per unit): 0.1 mph exit velocity and pitch
+# velocity, 1 degree launch angle
+EV_SKETCH_SCALE = 10
+LA_SKETCH_SCALE = 1
+VELO_SKETCH_SCALE = 10
+
 
 def generate_date_chunks(start_date: datetime, end_date: datetime, chunk_days: int = CHUNK_DAYS) -> list[tuple[str, str]]:
     """
@@ -81,6 +144,11 @@ def generate_date_chunks(start_date: datetime, end_date: datetime, chunk_days: i
     return chunks
 
 
+def get_savant_limiter(rate: float = REQUESTS_PER_SECOND, max_workers: int = MAX_IN_FLIGHT) -> AdaptiveRateLimiter:
+    """Process-wide Savant limiter: starts at `rate` and never exceeds it, backing off on 429/5xx."""
+    return get_limiter('savant', rate=rate, max_rate=rate, max_concurrency=max_workers)
+
+
 def get_session() -> requests.Session:
     """Create a session with appropriate headers.
 
@@ -95,28 +163,25 @@ def get_session() -> requests.Session:
     return session
 
 
-def fetch_statcast_csv(
-    session: requests.Session,
+_thread_local = threading.local()
+
+
+def get_thread_session() -> requests.Session:
+    """Get this thread's session (sessions are not shared between download workers)."""
+    if not hasattr(_thread_local, 'session'):
+        _thread_local.session = get_session()
+    return _thread_local.session
+
+
+def build_savant_params(
     year: int,
     start_date: str,
     end_date: str,
     player_type: str = 'batter',
     level: str = 'aaa',
-) -> Optional[str]:
-    """
-    Fetch Statcast CSV data from Baseball Savant minor league search.
-
-    Args:
-        session: Requests session
-        year: Season year
-        start_date: Start date (YYYY-MM-DD)
-        end_date: End date (YYYY-MM-DD)
-        player_type: 'batter' or 'pitcher'
-        level: 'aaa' for Triple-A or 'a' for Single-A (FSL)
-
-    Returns:
-        CSV data as string, or None if request failed
-    """
+    filters: Optional[dict] = None,
+) -> dict:
+    """Build Baseball Savant minor league search parameters for one request."""
     # Parameters aligned with pybaseball's statcast query format
     # Reference: https://github.com/jldbc/pybaseball/blob/master/docs/statcast.md
     # Critical: must include 'minors': 'true' even though endpoint is /statcast-search-minors/
@@ -166,61 +231,127 @@ def fetch_statcast_csv(
     elif level == 'a':
         params['hfLevel'] = 'A|'
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            logger.debug(f"Fetching {player_type} data for {level.upper()} ({start_date} to {end_date})...")
-            logger.debug(f"URL: {SAVANT_MINORS_URL}")
-            resp = session.get(SAVANT_MINORS_URL, params=params, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
+    if filters:
+        params.update(filters)
 
-            content = resp.text
-            content_lower = content.lower()
+    return params
 
-            # Log response details for debugging
-            logger.debug(f"Response status: {resp.status_code}, Content length: {len(content)}")
-            if len(content) < 500:
-                logger.debug(f"Full response: {content}")
-            else:
-                logger.debug(f"First 500 chars: {content[:500]}")
 
-            # Check if response is valid CSV with expected columns
-            has_valid_columns = any(col in content_lower for col in VALID_CSV_COLUMNS)
+def aggregate_statcast_lines(lines: Iterable[str], player_type: str,
+                             archive: bool = False) -> 'DailyStatcastAggregate':
+    """
+    Parse Statcast CSV lines and fold each row into per-day, per-player aggregates.
 
-            if content and len(content) > 100 and has_valid_columns:
-                logger.info(f"Successfully fetched {len(content)} bytes of data")
-                return content
-            elif 'no results' in content_lower or 'error' in content_lower or len(content) < 100:
-                logger.debug(f"No data returned for {level.upper()} {player_type}: {content[:200] if content else 'empty'}")
-                return None
-            else:
-                # Return content anyway - might still be valid CSV with different columns
-                logger.warning(f"Unexpected response format for {level.upper()} {player_type}, returning anyway")
-                logger.warning(f"Content preview: {content[:300]}")
-                return content
+    Only the columns in STATCAST_COLUMNS are kept from each row, and rows are
+    discarded as soon as they are aggregated. With `archive`, the columns in
+    ARCHIVE_COLUMNS are also appended to the aggregate's column buffers.
+    """
+    aggregate = DailyStatcastAggregate(player_type, StatcastColumns() if archive else None)
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return aggregate
 
-    logger.error(f"Failed to fetch data after {MAX_RETRIES} attempts")
-    return None
+    header = [col.strip().lstrip('\ufeff') for col in header]
+    if not any(col in header for col in VALID_CSV_COLUMNS):
+        # Savant answers empty searches with a short message instead of a CSV
+        logger.debug(f"No data returned for {player_type}: {','.join(header)[:200]}")
+        return aggregate
 
+    wanted = STATCAST_COLUMNS + [col for col in ARCHIVE_COLUMNS if col not in STATCAST_COLUMNS] if archive \
+        else STATCAST_COLUMNS
+    columns = [(col, header.index(col)) for col in wanted if col in header]
+    for row in reader:
+        if not row:
+            continue
+        aggregate.add_row({col: row[i] for col, i in columns if i < len(row)})
 
-def parse_statcast_csv(csv_data: str) -> list[dict]:
-    """Parse Statcast CSV data into list of pitch records."""
-    if not csv_data:
-        return []
+    return aggregate
 
-    records = []
-    try:
-        reader = csv.DictReader(io.StringIO(csv_data))
-        for row in reader:
-            records.append(row)
-    except Exception as e:
-        logger.warning(f"Error parsing CSV: {e}")
 
-    return records
+def fetch_statcast_aggregate(
+    session: requests.Session,
+    year: int,
+    start_date: str,
+    end_date: str,
+    player_type: str = 'batter',
+    level: str = 'aaa',
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    filters: Optional[dict] = None,
+    archive: bool = False,
+) -> 'DailyStatcastAggregate':
+    """
+    Stream Statcast CSV data from Baseball Savant minor league search into player aggregates.
+
+    The response is parsed as it downloads, so memory grows with the number of
+    players in the chunk rather than the number of pitches.
+
+    Args:
+        session: Requests session
+        year: Season year
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        player_type: 'batter' or 'pitcher'
+        level: 'aaa' for Triple-A or 'a' for Single-A (FSL)
+        limiter: Rate limiter shared by concurrent downloads (default: get_savant_limiter())
+        filters: Optional extra Savant search parameters (e.g. {'home_road': 'Home'})
+        archive: Also keep the archived columns of every row
+
+    Returns:
+        DailyStatcastAggregate for the chunk (empty, with the chunk in its
+        failed_ranges, if the request failed)
+    """
+    params = build_savant_params(year, start_date, end_date, player_type, level, filters)
+    limiter = limiter or get_savant_limiter()
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            limiter.acquire()
+        except CircuitOpenError as e:
+            logger.error(f"Skipping {player_type} {level.upper()} {start_date} to {end_date}: {e}")
+            break
+        started = time.perf_counter()
+        retry_after = None
+        try:
+            logger.debug(f"Fetching {player_type} data for {level.upper()} ({start_date} to {end_date})...")
+            logger.debug(f"URL: {SAVANT_MINORS_URL}")
+            with session.get(SAVANT_MINORS_URL, params=params, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+                latency = time.perf_counter() - started
+                retry_after = retry_after_seconds(resp.headers.get('Retry-After'))
+                resp.raise_for_status()
+                # Savant CSVs are UTF-8 with a byte order mark
+                resp.encoding = 'utf-8-sig'
+                # The body is parsed as it streams, so decode time includes the download
+                decode_started = time.perf_counter()
+                aggregate = aggregate_statcast_lines(resp.iter_lines(decode_unicode=True), player_type, archive)
+                limiter.release(resp.status_code)
+                record_request('savant', resp.status_code, latency, resp.raw.tell(),
+                               time.perf_counter() - decode_started)
+            count('rows', aggregate.row_count)
+
+            logger.debug(f"Streamed {aggregate.row_count} rows over {len(aggregate.days)} day(s)")
+            return aggregate
+
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+            status = error_status(e)
+            limiter.release(status, retry_after)
+            record_request('savant', status, time.perf_counter() - started)
+            if not is_retryable(status):
+                break
+            if attempt < MAX_RETRIES - 1:
+                delay = limiter.backoff(attempt, retry_after)
+                record_retry('savant', delay)
+                time.sleep(delay)
+        except Exception as e:
+            # Parse errors still free the limiter slot
+            limiter.release(type(e).__name__)
+            raise
+
+    record_failure('savant')
+    logger.error(f"Failed to fetch {player_type} data for {level.upper()} ({start_date} to {end_date})")
+    return failed_download(player_type, start_date, end_date, archive)
 
 
 def safe_float(val) -> Optional[float]:
@@ -233,6 +364,11 @@ def safe_float(val) -> Optional[float]:
         return None
 
 
+def average(total, count: int, digits: Optional[int] = None):
+    """Average of a sum (float or ExactSum), rounded to `digits` (an int when None)."""
+    return round(float(total) / count, digits)
+
+
 def safe_int(val) -> Optional[int]:
     """Safely convert value to int."""
     if val is None or val == '' or val == 'null':
@@ -259,127 +395,378 @@ def is_barrel(ev: float, la: float) -> bool:
     return la_low <= la <= la_high
 
 
-def aggregate_batter_statcast(records: list[dict]) -> dict:
-    """
-    Aggregate pitch-level records into batter Statcast metrics.
+def is_swing_description(desc: str) -> bool:
+    """Whether a Statcast pitch description is a swing (whiff, foul or ball in play)."""
+    return 'swing' in desc or 'foul' in desc or 'hit_into_play' in desc
 
-    Metrics calculated:
-    - EV (Exit Velocity): Average launch_speed on batted balls
-    - LA (Launch Angle): Average launch_angle on batted balls
-    - Barrel%: Barrels / Batted Ball Events (computed from EV/LA using Statcast barrel definition)
-    - Hard%: Hard hit balls (95+ mph) / Batted Ball Events
-    - GB%, FB%, LD%: Ground ball, fly ball, line drive rates
-    - xBA, xSLG, xwOBA: Expected stats based on batted ball quality
-    """
-    batted_balls = []
-    total_pitches = 0
-    swings = 0
-    whiffs = 0
 
-    for rec in records:
-        total_pitches += 1
+def is_whiff_description(desc: str) -> bool:
+    """Whether a Statcast pitch description is a swing and miss."""
+    return 'swinging_strike' in desc or 'missed' in desc
 
-        desc = rec.get('description', '').lower()
-        if 'swing' in desc or 'foul' in desc or 'hit_into_play' in desc.lower():
-            swings += 1
-            if 'swinging_strike' in desc or 'missed' in desc:
-                whiffs += 1
 
-        ev = safe_float(rec.get('launch_speed'))
-        la = safe_float(rec.get('launch_angle'))
-
-        if ev is not None and la is not None:
-            batted_balls.append({
-                'ev': ev,
-                'la': la,
-                'barrel': is_barrel(ev, la),
-                'bb_type': rec.get('bb_type', ''),
-                'xba': safe_float(rec.get('estimated_ba_using_speedangle')),
-                'xslg': safe_float(rec.get('estimated_slg_using_speedangle')),
-                'xwoba': safe_float(rec.get('estimated_woba_using_speedangle')),
-            })
-
-    if not batted_balls:
-        return {}
+class ExactSum:
+    """
+    Running float sum without rounding error, kept as math.fsum's partials.
 
-    total_bbe = len(batted_balls)
+    The total is the correctly rounded sum of every value added, whatever the
+    order values are added or sums merged in (days, months, the archive), so
+    averages match a single sum over all the values.
+    """
 
-    result = {
-        'BBE': total_bbe,
-        'Pitches': total_pitches,
-    }
+    def __init__(self, partials: Optional[list[float]] = None):
+        self.partials = list(partials or [])
+
+    def __iadd__(self, value) -> 'ExactSum':
+        """Add a value, or fold in another ExactSum."""
+        for x in (value.partials if isinstance(value, ExactSum) else (value,)):
+            partials = self.partials
+            i = 0
+            for y in partials:
+                if abs(x) < abs(y):
+                    x, y = y, x
+                hi = x + y
+                lo = y - (hi - x)
+                if lo:
+                    partials[i] = lo
+                    i += 1
+                x = hi
+            partials[i:] = [x]
+        return self
+
+    def __float__(self) -> float:
+        return math.fsum(self.partials)
+
+    @classmethod
+    def total(cls, sums: Iterable['ExactSum']) -> 'ExactSum':
+        """Exact sum of several sums."""
+        result = cls()
+        for other in sums:
+            result += other
+        return result
+
+    def to_state(self) -> list[float]:
+        return list(self.partials)
+
+    @classmethod
+    def from_state(cls, state) -> 'ExactSum':
+        """Rebuild from to_state() output (or a plain float from older day files)."""
+        return cls(state if isinstance(state, list) else [state])
+
+
+class QuantileSketch:
+    """
+    Fixed-bin histogram of values for mergeable percentiles.
 
-    evs = sorted([bb['ev'] for bb in batted_balls if bb['ev'] is not None])
-    if evs:
-        result['EV'] = round(sum(evs) / len(evs), 1)
-        result['maxEV'] = round(max(evs), 1)
-        # Percentiles
-        n = len(evs)
-        result['EV50'] = round(evs[n // 2], 1)
-        idx_90 = int(n * 0.9)
-        result['EV90'] = round(evs[min(idx_90, n - 1)], 1)
-
-    las = [bb['la'] for bb in batted_balls if bb['la'] is not None]
-    if las:
-        result['LA'] = round(sum(las) / len(las), 1)
-
-    barrels = sum(1 for bb in batted_balls if bb['barrel'])
-    result['Barrel%'] = round(barrels / total_bbe, 3) if total_bbe > 0 else 0
-    result['Barrels'] = barrels
-
-    hard_hits = sum(1 for bb in batted_balls if bb['ev'] and bb['ev'] >= 95)
-    result['Hard%'] = round(hard_hits / total_bbe, 3) if total_bbe > 0 else 0
-
-    # Sweet Spot%: launch angle between 8 and 32 degrees
-    sweet_spots = sum(1 for bb in batted_balls if bb['la'] is not None and 8 <= bb['la'] <= 32)
-    result['Sweet Spot%'] = round(sweet_spots / total_bbe, 3) if total_bbe > 0 else 0
-
-    gb_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'ground_ball')
-    fb_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'fly_ball')
-    ld_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'line_drive')
-    popup_count = sum(1 for bb in batted_balls if bb['bb_type'] == 'popup')
-
-    result['GB%'] = round(gb_count / total_bbe, 3) if total_bbe > 0 else 0
-    result['FB%'] = round(fb_count / total_bbe, 3) if total_bbe > 0 else 0
-    result['LD%'] = round(ld_count / total_bbe, 3) if total_bbe > 0 else 0
-    result['PU%'] = round(popup_count / total_bbe, 3) if total_bbe > 0 else 0
-
-    xbas = [bb['xba'] for bb in batted_balls if bb['xba'] is not None]
-    xslgs = [bb['xslg'] for bb in batted_balls if bb['xslg'] is not None]
-    xwobas = [bb['xwoba'] for bb in batted_balls if bb['xwoba'] is not None]
-
-    if xbas:
-        result['xBA'] = round(sum(xbas) / len(xbas), 3)
-    if xslgs:
-        result['xSLG'] = round(sum(xslgs) / len(xslgs), 3)
-    if xwobas:
-        result['xwOBA'] = round(sum(xwobas) / len(xwobas), 3)
-
-    if swings > 0:
-        result['Whiff%'] = round(whiffs / swings, 3)
+    Values are binned at 1/scale resolution, which is exact for Statcast's
+    0.1 mph speeds and whole-degree launch angles. Merging sketches (days,
+    months, levels) is a sum over bins.
+    """
 
-    return result
+    def __init__(self, scale: int):
+        self.scale = scale
+        self.bins: dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a single value."""
+        idx = round(value * self.scale)
+        self.bins[idx] = self.bins.get(idx, 0) + 1
+        self.count += 1
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Fold another sketch with the same scale into this one."""
+        for idx, count in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at rank min(int(count * q), count - 1) of the sorted values."""
+        if not self.count:
+            return None
+        rank = min(int(self.count * q), self.count - 1)
+        seen = 0
+        for idx in sorted(self.bins):
+            seen += self.bins[idx]
+            if seen > rank:
+                return idx / self.scale
+        return None
 
+    def max(self) -> Optional[float]:
+        """Largest value (at bin resolution)."""
+        return max(self.bins) / self.scale if self.bins else None
+
+    def to_list(self) -> list[int]:
+        """Serialize as [scale, first bin, count, gap to next bin, count, ...]."""
+        return encode_sketch_bins(self.scale, sorted(self.bins.items()))
+
+    @classmethod
+    def from_list(cls, data: list[int]) -> 'QuantileSketch':
+        """Rebuild a sketch from to_list() output."""
+        sketch = cls(data[0])
+        idx = 0
+        for i in range(1, len(data), 2):
+            idx += data[i]
+            sketch.bins[idx] = data[i + 1]
+            sketch.count += data[i + 1]
+        return sketch
+
+
+def encode_sketch_bins(scale: int, bins: Iterable[tuple[int, int]]) -> list[int]:
+    """Delta-encode sorted (bin, count) pairs into QuantileSketch.to_list() form."""
+    data = [scale]
+    prev = 0
+    for idx, count in bins:
+        data.extend((idx - prev, count))
+        prev = idx
+    return data
+
+
+class BatterStatcast:
+    """Running batter Statcast totals, fed one pitch record at a time."""
+
+    def __init__(self):
+        self.pitches = 0
+        self.swings = 0
+        self.whiffs = 0
+
+        # Batted ball events (pitches with both EV and LA)
+        self.ev_sum = ExactSum()
+        self.ev_sketch = QuantileSketch(EV_SKETCH_SCALE)  # EV50/EV90/maxEV
+        self.la_sum = ExactSum()
+        self.la_sketch = QuantileSketch(LA_SKETCH_SCALE)
+        self.barrels = 0
+        self.hard_hits = 0
+        self.sweet_spots = 0
+        self.bb_types = defaultdict(int)
+
+        # Expected stats: sums and counts of non-null values on batted balls
+        self.xba_sum, self.xba_count = ExactSum(), 0
+        self.xslg_sum, self.xslg_count = ExactSum(), 0
+        self.xwoba_sum, self.xwoba_count = ExactSum(), 0
+
+    def add(self, rec: dict) -> None:
+        """Add a single pitch record."""
+        self.pitches += 1
+
+        desc = (rec.get('description') or '').lower()
+        if is_swing_description(desc):
+            self.swings += 1
+            if is_whiff_description(desc):
+                self.whiffs += 1
 
-def aggregate_pitcher_statcast(records: list[dict]) -> dict:
-    """
-    Aggregate pitch-level records into pitcher Statcast metrics.
+        ev = safe_float(rec.get('launch_speed'))
+        la = safe_float(rec.get('launch_angle'))
+        if ev is None or la is None:
+            return
+
+        self.ev_sum += ev
+        self.ev_sketch.add(ev)
+        self.la_sum += la
+        self.la_sketch.add(la)
+        if is_barrel(ev, la):
+            self.barrels += 1
+        if ev >= 95:
+            self.hard_hits += 1
+        # Sweet Spot: launch angle between 8 and 32 degrees
+        if 8 <= la <= 32:
+            self.sweet_spots += 1
+        self.bb_types[rec.get('bb_type', '')] += 1
+
+        xba = safe_float(rec.get('estimated_ba_using_speedangle'))
+        if xba is not None:
+            self.xba_sum += xba
+            self.xba_count += 1
+        xslg = safe_float(rec.get('estimated_slg_using_speedangle'))
+        if xslg is not None:
+            self.xslg_sum += xslg
+            self.xslg_count += 1
+        xwoba = safe_float(rec.get('estimated_woba_using_speedangle'))
+        if xwoba is not None:
+            self.xwoba_sum += xwoba
+            self.xwoba_count += 1
+
+    def merge(self, other: 'BatterStatcast') -> None:
+        """Fold another accumulator's totals into this one."""
+        self.pitches += other.pitches
+        self.swings += other.swings
+        self.whiffs += other.whiffs
+        self.ev_sum += other.ev_sum
+        self.ev_sketch.merge(other.ev_sketch)
+        self.la_sum += other.la_sum
+        self.la_sketch.merge(other.la_sketch)
+        self.barrels += other.barrels
+        self.hard_hits += other.hard_hits
+        self.sweet_spots += other.sweet_spots
+        for bb_type, count in other.bb_types.items():
+            self.bb_types[bb_type] += count
+        self.xba_sum += other.xba_sum
+        self.xba_count += other.xba_count
+        self.xslg_sum += other.xslg_sum
+        self.xslg_count += other.xslg_count
+        self.xwoba_sum += other.xwoba_sum
+        self.xwoba_count += other.xwoba_count
+
+    def to_state(self) -> dict:
+        """Serialize the running totals."""
+        return {
+            'p': self.pitches,
+            'sw': self.swings,
+            'wh': self.whiffs,
+            'ev': self.ev_sum.to_state(),
+            'evq': self.ev_sketch.to_list(),
+            'la': self.la_sum.to_state(),
+            'laq': self.la_sketch.to_list(),
+            'br': self.barrels,
+            'hh': self.hard_hits,
+            'ss': self.sweet_spots,
+            'bb': dict(self.bb_types),
+            'xba': [self.xba_sum.to_state(), self.xba_count],
+            'xslg': [self.xslg_sum.to_state(), self.xslg_count],
+            'xwoba': [self.xwoba_sum.to_state(), self.xwoba_count],
+        }
 
-    Metrics calculated:
-    - Velo: Average fastball velocity
-    - SpinRate: Average spin rate
-    - Whiff%: Swinging strikes / swings
-    - CSW%: Called strikes + whiffs / total pitches
-    """
-    pitch_data = defaultdict(list)
-    total_pitches = 0
-    called_strikes = 0
-    swinging_strikes = 0
-    swings = 0
-    extensions = []
+    @classmethod
+    def from_state(cls, state: dict) -> 'BatterStatcast':
+        """Rebuild an accumulator from to_state() output."""
+        acc = cls()
+        acc.pitches = state['p']
+        acc.swings = state['sw']
+        acc.whiffs = state['wh']
+        acc.ev_sum = ExactSum.from_state(state['ev'])
+        acc.ev_sketch = QuantileSketch.from_list(state['evq'])
+        acc.la_sum = ExactSum.from_state(state['la'])
+        acc.la_sketch = QuantileSketch.from_list(state['laq'])
+        acc.barrels = state['br']
+        acc.hard_hits = state['hh']
+        acc.sweet_spots = state['ss']
+        acc.bb_types.update(state['bb'])
+        for key in ('xba', 'xslg', 'xwoba'):
+            total, total_count = state[key]
+            setattr(acc, f'{key}_sum', ExactSum.from_state(total))
+            setattr(acc, f'{key}_count', total_count)
+        return acc
+
+    def get_stats(self) -> dict:
+        """Calculate final batter metrics (see aggregate_batter_statcast)."""
+        total_bbe = self.ev_sketch.count
+        if total_bbe == 0:
+            return {}
+
+        result = {
+            'BBE': total_bbe,
+            'Pitches': self.pitches,
+        }
 
-    for rec in records:
-        total_pitches += 1
+        result['EV'] = average(self.ev_sum, total_bbe, 1)
+        result['maxEV'] = round(self.ev_sketch.max(), 1)
+        # Percentiles
+        result['EV50'] = round(self.ev_sketch.quantile(0.5), 1)
+        result['EV90'] = round(self.ev_sketch.quantile(0.9), 1)
+
+        result['LA'] = average(self.la_sum, total_bbe, 1)
+
+        result['Barrel%'] = round(self.barrels / total_bbe, 3)
+        result['Barrels'] = self.barrels
+        result['Hard%'] = round(self.hard_hits / total_bbe, 3)
+        result['Sweet Spot%'] = round(self.sweet_spots / total_bbe, 3)
+
+        result['GB%'] = round(self.bb_types['ground_ball'] / total_bbe, 3)
+        result['FB%'] = round(self.bb_types['fly_ball'] / total_bbe, 3)
+        result['LD%'] = round(self.bb_types['line_drive'] / total_bbe, 3)
+        result['PU%'] = round(self.bb_types['popup'] / total_bbe, 3)
+
+        if self.xba_count:
+            result['xBA'] = average(self.xba_sum, self.xba_count, 3)
+        if self.xslg_count:
+            result['xSLG'] = average(self.xslg_sum, self.xslg_count, 3)
+        if self.xwoba_count:
+            result['xwOBA'] = average(self.xwoba_sum, self.xwoba_count, 3)
+
+        if self.swings > 0:
+            result['Whiff%'] = round(self.whiffs / self.swings, 3)
+
+        return result
+
+
+class PitchTypeStatcast:
+    """Running totals for one pitch type in a pitcher's arsenal."""
+
+    def __init__(self):
+        self.n = 0
+        self.velo_sum = ExactSum()
+        self.velo_max = None
+        self.velo_sketch = QuantileSketch(VELO_SKETCH_SCALE)
+        self.spin_sum, self.spin_count = ExactSum(), 0
+        self.h_mov_sum, self.h_mov_count = ExactSum(), 0
+        self.v_mov_sum, self.v_mov_count = ExactSum(), 0
+        self.ext_sum, self.ext_count = ExactSum(), 0
+        self.swings = 0
+        self.whiffs = 0
+
+    def merge(self, other: 'PitchTypeStatcast') -> None:
+        """Fold another pitch type's totals into this one."""
+        self.n += other.n
+        self.velo_sum += other.velo_sum
+        if other.velo_max is not None and (self.velo_max is None or other.velo_max > self.velo_max):
+            self.velo_max = other.velo_max
+        self.velo_sketch.merge(other.velo_sketch)
+        self.spin_sum += other.spin_sum
+        self.spin_count += other.spin_count
+        self.h_mov_sum += other.h_mov_sum
+        self.h_mov_count += other.h_mov_count
+        self.v_mov_sum += other.v_mov_sum
+        self.v_mov_count += other.v_mov_count
+        self.ext_sum += other.ext_sum
+        self.ext_count += other.ext_count
+        self.swings += other.swings
+        self.whiffs += other.whiffs
+
+    def to_state(self) -> list:
+        """Serialize the running totals as a flat list."""
+        return [
+            self.n, self.velo_sum.to_state(), self.velo_max,
+            self.spin_sum.to_state(), self.spin_count,
+            self.h_mov_sum.to_state(), self.h_mov_count,
+            self.v_mov_sum.to_state(), self.v_mov_count,
+            self.ext_sum.to_state(), self.ext_count,
+            self.swings, self.whiffs,
+            self.velo_sketch.to_list(),
+        ]
+
+    @classmethod
+    def from_state(cls, state: list) -> 'PitchTypeStatcast':
+        """Rebuild pitch type totals from to_state() output."""
+        pt = cls()
+        (pt.n, pt.velo_sum, pt.velo_max,
+         pt.spin_sum, pt.spin_count,
+         pt.h_mov_sum, pt.h_mov_count,
+         pt.v_mov_sum, pt.v_mov_count,
+         pt.ext_sum, pt.ext_count,
+         pt.swings, pt.whiffs, velo_sketch) = state
+        pt.velo_sketch = QuantileSketch.from_list(velo_sketch)
+        for name in ('velo_sum', 'spin_sum', 'h_mov_sum', 'v_mov_sum', 'ext_sum'):
+            setattr(pt, name, ExactSum.from_state(getattr(pt, name)))
+        return pt
+
+
+class PitcherStatcast:
+    """Running pitcher Statcast totals, fed one pitch record at a time."""
+
+    FASTBALL_TYPES = ['FF', 'SI', 'FC', 'FT']
+
+    def __init__(self):
+        self.pitches = 0
+        self.called_strikes = 0
+        self.swinging_strikes = 0
+        self.swings = 0
+        self.ext_sum, self.ext_count = ExactSum(), 0
+        # Pitch type -> totals, for pitches with a recorded velocity
+        self.pitch_types: dict[str, PitchTypeStatcast] = {}
+
+    def add(self, rec: dict) -> None:
+        """Add a single pitch record."""
+        self.pitches += 1
 
         pitch_type = rec.get('pitch_type', 'UN')
         velo = safe_float(rec.get('release_speed'))
@@ -389,154 +776,310 @@ def aggregate_pitcher_statcast(records: list[dict]) -> dict:
         pfx_z = safe_float(rec.get('pfx_z'))  # vertical movement (ft)
 
         if ext is not None:
-            extensions.append(ext)
+            self.ext_sum += ext
+            self.ext_count += 1
 
-        pitch_entry = {
-            'velo': velo,
-            'spin': spin,
-        }
-        # Store movement in inches (convert from feet)
+        desc = (rec.get('description') or '').lower()
+        is_swing = is_swing_description(desc)
+        is_whiff = is_whiff_description(desc)
+
+        if 'called_strike' in desc:
+            self.called_strikes += 1
+        if is_whiff:
+            self.swinging_strikes += 1
+        if is_swing:
+            self.swings += 1
+
+        if velo is None:
+            return
+
+        pt = self.pitch_types.get(pitch_type)
+        if pt is None:
+            pt = self.pitch_types[pitch_type] = PitchTypeStatcast()
+
+        pt.n += 1
+        pt.velo_sum += velo
+        if pt.velo_max is None or velo > pt.velo_max:
+            pt.velo_max = velo
+        pt.velo_sketch.add(velo)
+        if spin is not None:
+            pt.spin_sum += spin
+            pt.spin_count += 1
+        # Movement in inches (convert from feet)
         if pfx_x is not None:
-            pitch_entry['hMov'] = pfx_x * 12
+            pt.h_mov_sum += pfx_x * 12
+            pt.h_mov_count += 1
         if pfx_z is not None:
-            pitch_entry['vMov'] = pfx_z * 12
+            pt.v_mov_sum += pfx_z * 12
+            pt.v_mov_count += 1
         if ext is not None:
-            pitch_entry['ext'] = ext
+            pt.ext_sum += ext
+            pt.ext_count += 1
+        if is_swing:
+            pt.swings += 1
+        if is_whiff:
+            pt.whiffs += 1
+
+    def merge(self, other: 'PitcherStatcast') -> None:
+        """Fold another accumulator's totals into this one."""
+        self.pitches += other.pitches
+        self.called_strikes += other.called_strikes
+        self.swinging_strikes += other.swinging_strikes
+        self.swings += other.swings
+        self.ext_sum += other.ext_sum
+        self.ext_count += other.ext_count
+        for pitch_type, other_pt in other.pitch_types.items():
+            if pitch_type in self.pitch_types:
+                self.pitch_types[pitch_type].merge(other_pt)
+            else:
+                self.pitch_types[pitch_type] = other_pt
+
+    def to_state(self) -> dict:
+        """Serialize the running totals (pitch types in order of first appearance)."""
+        return {
+            'p': self.pitches,
+            'cs': self.called_strikes,
+            'ss': self.swinging_strikes,
+            'sw': self.swings,
+            'ext': [self.ext_sum.to_state(), self.ext_count],
+            'types': {pitch_type: pt.to_state() for pitch_type, pt in self.pitch_types.items()},
+        }
 
-        desc = rec.get('description', '').lower()
-        is_swing = 'swing' in desc or 'foul' in desc or 'hit_into_play' in desc
-        is_whiff = 'swinging_strike' in desc or 'missed' in desc
+    @classmethod
+    def from_state(cls, state: dict) -> 'PitcherStatcast':
+        """Rebuild an accumulator from to_state() output."""
+        acc = cls()
+        acc.pitches = state['p']
+        acc.called_strikes = state['cs']
+        acc.swinging_strikes = state['ss']
+        acc.swings = state['sw']
+        ext_sum, acc.ext_count = state['ext']
+        acc.ext_sum = ExactSum.from_state(ext_sum)
+        acc.pitch_types = {
+            pitch_type: PitchTypeStatcast.from_state(pt_state) for pitch_type, pt_state in state['types'].items()
+        }
+        return acc
 
-        pitch_entry['swing'] = is_swing
-        pitch_entry['whiff'] = is_whiff
+    def get_stats(self) -> dict:
+        """Calculate final pitcher metrics (see aggregate_pitcher_statcast)."""
+        if self.pitches == 0:
+            return {}
 
-        if velo is not None:
-            pitch_data[pitch_type].append(pitch_entry)
+        result = {
+            'Pitches': self.pitches,
+        }
 
-        if 'called_strike' in desc:
-            called_strikes += 1
-        if is_whiff:
-            swinging_strikes += 1
-        if is_swing:
-            swings += 1
+        fastballs = [self.pitch_types[pt] for pt in self.FASTBALL_TYPES if pt in self.pitch_types]
+        fastball_count = sum(pt.n for pt in fastballs)
+        if fastball_count:
+            result['Velo'] = average(ExactSum.total(pt.velo_sum for pt in fastballs), fastball_count, 1)
+            result['maxVelo'] = round(max(pt.velo_max for pt in fastballs), 1)
 
-    if total_pitches == 0:
-        return {}
+        spin_count = sum(pt.spin_count for pt in self.pitch_types.values())
+        if spin_count:
+            result['SpinRate'] = average(ExactSum.total(pt.spin_sum for pt in self.pitch_types.values()), spin_count)
 
-    result = {
-        'Pitches': total_pitches,
-    }
+        if self.ext_count:
+            result['Extension'] = average(self.ext_sum, self.ext_count, 1)
+
+        if self.swings > 0:
+            result['Whiff%'] = round(self.swinging_strikes / self.swings, 3)
 
-    fastball_types = ['FF', 'SI', 'FC', 'FT']
-    fastball_velos = []
-    for pt in fastball_types:
-        if pt in pitch_data:
-            fastball_velos.extend([p['velo'] for p in pitch_data[pt] if p['velo'] is not None])
-
-    if fastball_velos:
-        result['Velo'] = round(sum(fastball_velos) / len(fastball_velos), 1)
-        result['maxVelo'] = round(max(fastball_velos), 1)
-
-    all_spins = []
-    for pt, pitches in pitch_data.items():
-        for p in pitches:
-            if p['spin'] is not None:
-                all_spins.append(p['spin'])
-
-    if all_spins:
-        result['SpinRate'] = round(sum(all_spins) / len(all_spins))
-
-    if extensions:
-        result['Extension'] = round(sum(extensions) / len(extensions), 1)
-
-    if swings > 0:
-        result['Whiff%'] = round(swinging_strikes / swings, 3)
-
-    csw = called_strikes + swinging_strikes
-    result['CSW%'] = round(csw / total_pitches, 3) if total_pitches > 0 else 0
-
-    # Arsenal (expanded pitch mix with movement, extension, whiff rate)
-    arsenal = {}
-    for pt, pitches in pitch_data.items():
-        if len(pitches) >= 5:
-            velos = [p['velo'] for p in pitches if p['velo'] is not None]
-            spins = [p['spin'] for p in pitches if p['spin'] is not None]
-            h_movs = [p['hMov'] for p in pitches if p.get('hMov') is not None]
-            v_movs = [p['vMov'] for p in pitches if p.get('vMov') is not None]
-            exts = [p['ext'] for p in pitches if p.get('ext') is not None]
-            pt_swings = sum(1 for p in pitches if p.get('swing'))
-            pt_whiffs = sum(1 for p in pitches if p.get('whiff'))
+        csw = self.called_strikes + self.swinging_strikes
+        result['CSW%'] = round(csw / self.pitches, 3)
+
+        # Arsenal (expanded pitch mix with movement, extension, whiff rate)
+        arsenal = {}
+        for pitch_type, pt in self.pitch_types.items():
+            if pt.n < 5:
+                continue
 
             pitch_info = {
-                'n': len(pitches),
-                'pct': round(len(pitches) / total_pitches, 3),
+                'n': pt.n,
+                'pct': round(pt.n / self.pitches, 3),
+                'v': average(pt.velo_sum, pt.n, 1),
+                'maxV': round(pt.velo_max, 1),
             }
+            if pt.spin_count:
+                pitch_info['s'] = average(pt.spin_sum, pt.spin_count)
+            if pt.h_mov_count:
+                pitch_info['hMov'] = average(pt.h_mov_sum, pt.h_mov_count, 1)
+            if pt.v_mov_count:
+                pitch_info['vMov'] = average(pt.v_mov_sum, pt.v_mov_count, 1)
+            if pt.ext_count:
+                pitch_info['ext'] = average(pt.ext_sum, pt.ext_count, 1)
+            if pt.swings > 0:
+                pitch_info['whiff'] = round(pt.whiffs / pt.swings, 3)
 
-            if velos:
-                pitch_info['v'] = round(sum(velos) / len(velos), 1)
-                pitch_info['maxV'] = round(max(velos), 1)
-            if spins:
-                pitch_info['s'] = round(sum(spins) / len(spins))
-            if h_movs:
-                pitch_info['hMov'] = round(sum(h_movs) / len(h_movs), 1)
-            if v_movs:
-                pitch_info['vMov'] = round(sum(v_movs) / len(v_movs), 1)
-            if exts:
-                pitch_info['ext'] = round(sum(exts) / len(exts), 1)
-            if pt_swings > 0:
-                pitch_info['whiff'] = round(pt_whiffs / pt_swings, 3)
-
-            arsenal[pt] = pitch_info
-
-    if arsenal:
-        result['arsenal'] = arsenal
+            arsenal[pitch_type] = pitch_info
 
-    return result
+        if arsenal:
+            result['arsenal'] = arsenal
 
+        return result
 
-def process_statcast_data(
-    batter_records: list[dict],
-    pitcher_records: list[dict],
-    level: str,
-) -> dict:
+
+def aggregate_batter_statcast(records: list[dict]) -> dict:
     """
-    Process raw Statcast records into player-level aggregations.
+    Aggregate pitch-level records into batter Statcast metrics.
+
+    Metrics calculated:
+    - EV (Exit Velocity): Average launch_speed on batted balls
+    - LA (Launch Angle): Average launch_angle on batted balls
+    - Barrel%: Barrels / Batted Ball Events (computed from EV/LA using Statcast barrel definition)
+    - Hard%: Hard hit balls (95+ mph) / Batted Ball Events
+    - GB%, FB%, LD%: Ground ball, fly ball, line drive rates
+    - xBA, xSLG, xwOBA: Expected stats based on batted ball quality
+    """
+    acc = BatterStatcast()
+    for rec in records:
+        acc.add(rec)
+    return acc.get_stats()
+
+
+def aggregate_pitcher_statcast(records: list[dict]) -> dict:
+    """
+    Aggregate pitch-level records into pitcher Statcast metrics.
+
+    Metrics calculated:
+    - Velo: Average fastball velocity
+    - SpinRate: Average spin rate
+    - Whiff%: Swinging strikes / swings
+    - CSW%: Called strikes + whiffs / total pitches
+    """
+    acc = PitcherStatcast()
+    for rec in records:
+        acc.add(rec)
+    return acc.get_stats()
+
+
+class StatcastAggregate:
+    """Per-player running Statcast aggregates for one player type, built row by row."""
+
+    def __init__(self, player_type: str):
+        self.player_type = player_type
+        self.players: dict[str, object] = {}  # player_id -> BatterStatcast / PitcherStatcast
+        self.names: dict[str, str] = {}
+        self.row_count = 0
+
+    def add_row(self, rec: dict) -> None:
+        """Fold a single pitch record into its player's aggregate."""
+        self.row_count += 1
+
+        player_id = rec.get(self.player_type)
+        if not player_id:
+            return
+
+        acc = self.players.get(player_id)
+        if acc is None:
+            acc = BatterStatcast() if self.player_type == 'batter' else PitcherStatcast()
+            self.players[player_id] = acc
+            self.names[player_id] = rec.get('player_name', '')
+        acc.add(rec)
+
+    def merge(self, other: 'StatcastAggregate') -> None:
+        """Fold another aggregate (e.g. the next day) into this one."""
+        self.row_count += other.row_count
+        for player_id, acc in other.players.items():
+            if player_id in self.players:
+                self.players[player_id].merge(acc)
+            else:
+                self.players[player_id] = acc
+                self.names[player_id] = other.names.get(player_id, '')
+
+    def to_state(self) -> dict:
+        """Serialize per-player totals and names (see load_day_aggregates)."""
+        return {
+            'rows': self.row_count,
+            'players': {
+                player_id: {'name': self.names.get(player_id, ''), **acc.to_state()}
+                for player_id, acc in self.players.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, player_type: str, state: dict) -> 'StatcastAggregate':
+        """Rebuild an aggregate from to_state() output."""
+        aggregate = cls(player_type)
+        aggregate.row_count = state.get('rows', 0)
+        acc_class = BatterStatcast if player_type == 'batter' else PitcherStatcast
+        for player_id, player_state in state.get('players', {}).items():
+            aggregate.players[player_id] = acc_class.from_state(player_state)
+            aggregate.names[player_id] = player_state.get('name', '')
+        return aggregate
+
+
+class DailyStatcastAggregate:
+    """StatcastAggregates for one player type, split by game date."""
+
+    def __init__(self, player_type: str, columns: Optional[StatcastColumns] = None):
+        self.player_type = player_type
+        self.days: dict[str, StatcastAggregate] = {}
+        self.row_count = 0
+        # Raw rows kept for the archive, if requested
+        self.columns = columns
+        # (start, end) date ranges of chunks that could not be downloaded
+        self.failed_ranges: list[tuple[str, str]] = []
+
+    def add_row(self, rec: dict) -> None:
+        """Fold a single pitch record into its game date's aggregate."""
+        self.row_count += 1
+        if self.columns is not None:
+            self.columns.append(rec)
+
+        game_date = rec.get('game_date') or ''
+        day = self.days.get(game_date)
+        if day is None:
+            day = self.days[game_date] = StatcastAggregate(self.player_type)
+        day.add_row(rec)
+
+    def merge(self, other: 'DailyStatcastAggregate') -> None:
+        """Fold another daily aggregate (e.g. a downloaded chunk) into this one."""
+        self.row_count += other.row_count
+        self.failed_ranges.extend(other.failed_ranges)
+        if self.columns is not None and other.columns is not None:
+            self.columns.extend(other.columns)
+        for game_date, day in other.days.items():
+            if game_date in self.days:
+                self.days[game_date].merge(day)
+            else:
+                self.days[game_date] = day
+
+    def failed_dates(self, dates: list[str]) -> set[str]:
+        """The dates (YYYY-MM-DD) covered by a failed chunk."""
+        return {date for date in dates if any(start <= date <= end for start, end in self.failed_ranges)}
+
+
+def failed_download(player_type: str, start_date: str, end_date: str, archive: bool) -> DailyStatcastAggregate:
+    """Empty aggregate marking a chunk whose rows could not be downloaded."""
+    aggregate = DailyStatcastAggregate(player_type, StatcastColumns() if archive else None)
+    aggregate.failed_ranges.append((start_date, end_date))
+    return aggregate
+
+
+def build_level_players(batters: StatcastAggregate, pitchers: StatcastAggregate, level: str) -> dict:
+    """
+    Turn batter and pitcher aggregates for a level into player-level Statcast entries.
 
     Returns dict mapping player_id -> statcast metrics
     """
     players = {}
 
-    # Group batter records by player
-    batter_by_player = defaultdict(list)
-    for rec in batter_records:
-        player_id = rec.get('batter')
-        if player_id:
-            batter_by_player[player_id].append(rec)
-
-    for player_id, records in batter_by_player.items():
-        if len(records) >= 10:
-            player_name = records[0].get('player_name', '')
-            stats = aggregate_batter_statcast(records)
+    for player_id, acc in batters.players.items():
+        if acc.pitches >= 10:
+            stats = acc.get_stats()
             if stats:
                 players[player_id] = {
                     'id': player_id,
-                    'name': player_name,
+                    'name': batters.names.get(player_id, ''),
                     'type': 'batter',
                     'level': level,
                     'bat': stats,
                 }
 
-    # Group pitcher records by player
-    pitcher_by_player = defaultdict(list)
-    for rec in pitcher_records:
-        player_id = rec.get('pitcher')
-        if player_id:
-            pitcher_by_player[player_id].append(rec)
-
-    for player_id, records in pitcher_by_player.items():
-        if len(records) >= 50:
-            player_name = records[0].get('player_name', '')
-            stats = aggregate_pitcher_statcast(records)
+    for player_id, acc in pitchers.players.items():
+        if acc.pitches >= 50:
+            stats = acc.get_stats()
             if stats:
                 if player_id in players:
                     players[player_id]['pit'] = stats
@@ -545,7 +1088,7 @@ def process_statcast_data(
                 else:
                     players[player_id] = {
                         'id': player_id,
-                        'name': player_name,
+                        'name': pitchers.names.get(player_id, ''),
                         'type': 'pitcher',
                         'level': level,
                         'pit': stats,
@@ -554,6 +1097,455 @@ def process_statcast_data(
     return players
 
 
+def process_statcast_data(
+    batter_records: list[dict],
+    pitcher_records: list[dict],
+    level: str,
+) -> dict:
+    """
+    Process raw Statcast records into player-level aggregations.
+
+    Returns dict mapping player_id -> statcast metrics
+    """
+    batters = StatcastAggregate('batter')
+    for rec in batter_records:
+        batters.add_row(rec)
+
+    pitchers = StatcastAggregate('pitcher')
+    for rec in pitcher_records:
+        pitchers.add_row(rec)
+
+    return build_level_players(batters, pitchers, level)
+
+
+def column_values(columns: StatcastColumns, name: str) -> np.ndarray:
+    """View an archived column as a NumPy array (no copy)."""
+    column = columns.columns[name]
+    if not len(column):
+        return np.empty(0, dtype=np.dtype(column.typecode))
+    return np.frombuffer(column, dtype=np.dtype(column.typecode))
+
+
+def description_masks(columns: StatcastColumns) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row swing, whiff and called strike flags, classified once per distinct description."""
+    values = [(desc or '').lower() for desc in columns.dictionaries['description']]
+    codes = column_values(columns, 'description')
+    swing = np.array([is_swing_description(desc) for desc in values], dtype=bool)
+    whiff = np.array([is_whiff_description(desc) for desc in values], dtype=bool)
+    called = np.array(['called_strike' in desc for desc in values], dtype=bool)
+    if not values:
+        return (np.zeros(len(codes), dtype=bool),) * 3
+    return swing[codes], whiff[codes], called[codes]
+
+
+def barrel_mask(ev: np.ndarray, la: np.ndarray) -> np.ndarray:
+    """Vectorized is_barrel."""
+    excess = ev - 98.0
+    la_low = np.maximum(26.0 - excess, 8.0)
+    la_high = np.minimum(30.0 + excess, 50.0)
+    return (ev >= 98.0) & (la_low <= la) & (la <= la_high)
+
+
+def group_players(columns: StatcastColumns, player_type: str) -> tuple:
+    """
+    Group archived rows by player.
+
+    Returns (valid row mask, player ids, first row of each player, per-row player index),
+    with players ordered by their first row.
+    """
+    ids = column_values(columns, player_type)
+    valid = ids != 0
+    players, first, inverse = np.unique(ids[valid], return_index=True, return_inverse=True)
+
+    # Renumber players by first appearance, matching StatcastAggregate's insertion order
+    order = np.argsort(first, kind='stable')
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    return valid, players[order], first[order], rank[inverse.reshape(-1)]
+
+
+def player_names(columns: StatcastColumns, valid: np.ndarray, first: np.ndarray) -> list[str]:
+    """Name on each player's first row (their earliest game, as partitions are date-sorted)."""
+    names = columns.dictionaries['player_name']
+    codes = column_values(columns, 'player_name')[valid][first]
+    return [names[code] for code in codes]
+
+
+def masked_sums(inverse: np.ndarray, values: np.ndarray, n: int) -> tuple[list[float], np.ndarray]:
+    """Per-group exact sums (math.fsum, like ExactSum) and counts of the non-NaN values."""
+    present = ~np.isnan(values)
+    groups = inverse[present]
+    ordered = values[present][np.argsort(groups, kind='stable')].tolist()
+    counts = np.bincount(groups, minlength=n)
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    sums = [math.fsum(ordered[bounds[i]:bounds[i + 1]]) for i in range(n)]
+    return sums, counts
+
+
+def vectorized_batter_stats(columns: StatcastColumns, min_pitches: int = 10) -> dict[str, tuple[str, dict]]:
+    """
+    Compute BatterStatcast.get_stats() for every batter in a set of archived rows at once.
+
+    Returns dict mapping player_id -> (name, stats) for batters with at least
+    `min_pitches` pitches and one batted ball, in order of first appearance.
+    """
+    valid, players, first, inv = group_players(columns, 'batter')
+    n = len(players)
+    if n == 0:
+        return {}
+
+    pitches = np.bincount(inv, minlength=n)
+    swing, whiff, _ = (mask[valid] for mask in description_masks(columns))
+    swings = np.bincount(inv[swing], minlength=n)
+    whiffs = np.bincount(inv[swing & whiff], minlength=n)
+
+    ev = column_values(columns, 'launch_speed')[valid]
+    la = column_values(columns, 'launch_angle')[valid]
+    bbe = ~np.isnan(ev) & ~np.isnan(la)
+    binv, bev, bla = inv[bbe], ev[bbe], la[bbe]
+    total_bbe = np.bincount(binv, minlength=n)
+
+    ev_sum, _ = masked_sums(binv, bev, n)
+    # Exit velocity sketch bins sorted within each player, for max and percentiles
+    ev_bins = np.rint(bev * EV_SKETCH_SCALE).astype(np.int64)
+    sorted_bins = ev_bins[np.lexsort((ev_bins, binv))]
+    starts = np.concatenate(([0], np.cumsum(total_bbe)[:-1]))
+
+    la_sum, _ = masked_sums(binv, bla, n)
+    barrels = np.bincount(binv[barrel_mask(bev, bla)], minlength=n)
+    hard_hits = np.bincount(binv[bev >= 95], minlength=n)
+    sweet_spots = np.bincount(binv[(bla >= 8) & (bla <= 32)], minlength=n)
+
+    bb_codes = column_values(columns, 'bb_type')[valid][bbe]
+    bb_lookup = {value: code for code, value in enumerate(columns.dictionaries['bb_type'])}
+    bb_counts = {}
+    for bb_type in ('ground_ball', 'fly_ball', 'line_drive', 'popup'):
+        code = bb_lookup.get(bb_type)
+        bb_counts[bb_type] = np.bincount(binv[bb_codes == code], minlength=n) if code is not None \
+            else np.zeros(n, dtype=np.intp)
+
+    expected = {
+        key: masked_sums(binv, column_values(columns, col)[valid][bbe], n)
+        for key, col in (('xBA', 'estimated_ba_using_speedangle'),
+                         ('xSLG', 'estimated_slg_using_speedangle'),
+                         ('xwOBA', 'estimated_woba_using_speedangle'))
+    }
+
+    names = player_names(columns, valid, first)
+    results = {}
+    for i in range(n):
+        count = int(total_bbe[i])
+        if pitches[i] < min_pitches or count == 0:
+            continue
+
+        start = int(starts[i])
+        result = {
+            'BBE': count,
+            'Pitches': int(pitches[i]),
+        }
+        result['EV'] = average(ev_sum[i], count, 1)
+        result['maxEV'] = round(int(sorted_bins[start + count - 1]) / EV_SKETCH_SCALE, 1)
+        result['EV50'] = round(int(sorted_bins[start + min(int(count * 0.5), count - 1)]) / EV_SKETCH_SCALE, 1)
+        result['EV90'] = round(int(sorted_bins[start + min(int(count * 0.9), count - 1)]) / EV_SKETCH_SCALE, 1)
+        result['LA'] = average(la_sum[i], count, 1)
+        result['Barrel%'] = round(int(barrels[i]) / count, 3)
+        result['Barrels'] = int(barrels[i])
+        result['Hard%'] = round(int(hard_hits[i]) / count, 3)
+        result['Sweet Spot%'] = round(int(sweet_spots[i]) / count, 3)
+        result['GB%'] = round(int(bb_counts['ground_ball'][i]) / count, 3)
+        result['FB%'] = round(int(bb_counts['fly_ball'][i]) / count, 3)
+        result['LD%'] = round(int(bb_counts['line_drive'][i]) / count, 3)
+        result['PU%'] = round(int(bb_counts['popup'][i]) / count, 3)
+        for key, (sums, counts) in expected.items():
+            if counts[i]:
+                result[key] = average(sums[i], int(counts[i]), 3)
+        if swings[i] > 0:
+            result['Whiff%'] = round(int(whiffs[i]) / int(swings[i]), 3)
+
+        results[str(int(players[i]))] = (names[i], result)
+
+    return results
+
+
+def vectorized_pitcher_stats(columns: StatcastColumns, min_pitches: int = 50) -> dict[str, tuple[str, dict]]:
+    """
+    Compute PitcherStatcast.get_stats() for every pitcher in a set of archived rows at once.
+
+    Returns dict mapping player_id -> (name, stats) for pitchers with at least
+    `min_pitches` pitches, in order of first appearance.
+    """
+    valid, players, first, inv = group_players(columns, 'pitcher')
+    n = len(players)
+    if n == 0:
+        return {}
+
+    pitches = np.bincount(inv, minlength=n)
+    swing, whiff, called = (mask[valid] for mask in description_masks(columns))
+    called_strikes = np.bincount(inv[called], minlength=n)
+    swinging_strikes = np.bincount(inv[whiff], minlength=n)
+    swings = np.bincount(inv[swing], minlength=n)
+
+    ext = column_values(columns, 'release_extension')[valid]
+    ext_sum, ext_count = masked_sums(inv, ext, n)
+
+    # Arsenal groups: (player, pitch type) over pitches with a recorded velocity
+    velo = column_values(columns, 'release_speed')[valid]
+    has_velo = ~np.isnan(velo)
+    type_names = columns.dictionaries['pitch_type']
+    type_codes = column_values(columns, 'pitch_type')[valid][has_velo].astype(np.int64)
+    group_keys = inv[has_velo].astype(np.int64) * max(len(type_names), 1) + type_codes
+    groups, group_first, ginv = np.unique(group_keys, return_index=True, return_inverse=True)
+    ginv = ginv.reshape(-1)
+    g = len(groups)
+    group_player = groups // max(len(type_names), 1)
+    group_type = groups % max(len(type_names), 1)
+
+    velo = velo[has_velo]
+    group_n = np.bincount(ginv, minlength=g)
+    velo_sum, _ = masked_sums(ginv, velo, g)
+    velo_max = np.full(g, -np.inf)
+    np.maximum.at(velo_max, ginv, velo)
+    spin = column_values(columns, 'release_spin_rate')[valid][has_velo]
+    spin_sum, spin_count = masked_sums(ginv, spin, g)
+    # Movement in inches (convert from feet)
+    h_mov_sum, h_mov_count = masked_sums(ginv, column_values(columns, 'pfx_x')[valid][has_velo] * 12, g)
+    v_mov_sum, v_mov_count = masked_sums(ginv, column_values(columns, 'pfx_z')[valid][has_velo] * 12, g)
+    type_ext_sum, type_ext_count = masked_sums(ginv, ext[has_velo], g)
+    type_swings = np.bincount(ginv[swing[has_velo]], minlength=g)
+    type_whiffs = np.bincount(ginv[whiff[has_velo]], minlength=g)
+
+    # Per-pitcher totals over several pitch types, summed exactly from the pitches
+    pinv = inv[has_velo]
+    fastball_codes = [code for code, name in enumerate(type_names) if name in PitcherStatcast.FASTBALL_TYPES]
+    is_fastball = np.isin(type_codes, fastball_codes)
+    fastball_sum, _ = masked_sums(pinv[is_fastball], velo[is_fastball], n)
+    all_spin_sum, _ = masked_sums(pinv, spin, n)
+
+    # Each pitcher's groups in order of first appearance, like PitcherStatcast.pitch_types
+    group_order = np.lexsort((group_first, group_player))
+    group_bounds = np.searchsorted(group_player[group_order], np.arange(n + 1))
+
+    names = player_names(columns, valid, first)
+    results = {}
+    for i in range(n):
+        total = int(pitches[i])
+        if total < min_pitches:
+            continue
+
+        player_groups = group_order[group_bounds[i]:group_bounds[i + 1]]
+        by_type = {type_names[group_type[j]]: j for j in player_groups}
+
+        result = {
+            'Pitches': total,
+        }
+
+        fastballs = [by_type[pt] for pt in PitcherStatcast.FASTBALL_TYPES if pt in by_type]
+        fastball_count = sum(int(group_n[j]) for j in fastballs)
+        if fastball_count:
+            result['Velo'] = average(fastball_sum[i], fastball_count, 1)
+            result['maxVelo'] = round(max(float(velo_max[j]) for j in fastballs), 1)
+
+        total_spin_count = sum(int(spin_count[j]) for j in player_groups)
+        if total_spin_count:
+            result['SpinRate'] = average(all_spin_sum[i], total_spin_count)
+
+        if ext_count[i]:
+            result['Extension'] = average(ext_sum[i], int(ext_count[i]), 1)
+
+        if swings[i] > 0:
+            result['Whiff%'] = round(int(swinging_strikes[i]) / int(swings[i]), 3)
+
+        result['CSW%'] = round(int(called_strikes[i] + swinging_strikes[i]) / total, 3)
+
+        arsenal = {}
+        for pitch_type, j in by_type.items():
+            count = int(group_n[j])
+            if count < 5:
+                continue
+
+            pitch_info = {
+                'n': count,
+                'pct': round(count / total, 3),
+                'v': average(velo_sum[j], count, 1),
+                'maxV': round(float(velo_max[j]), 1),
+            }
+            if spin_count[j]:
+                pitch_info['s'] = average(spin_sum[j], int(spin_count[j]))
+            if h_mov_count[j]:
+                pitch_info['hMov'] = average(h_mov_sum[j], int(h_mov_count[j]), 1)
+            if v_mov_count[j]:
+                pitch_info['vMov'] = average(v_mov_sum[j], int(v_mov_count[j]), 1)
+            if type_ext_count[j]:
+                pitch_info['ext'] = average(type_ext_sum[j], int(type_ext_count[j]), 1)
+            if type_swings[j] > 0:
+                pitch_info['whiff'] = round(int(type_whiffs[j]) / int(type_swings[j]), 3)
+
+            arsenal[pitch_type] = pitch_info
+
+        if arsenal:
+            result['arsenal'] = arsenal
+
+        results[str(int(players[i]))] = (names[i], result)
+
+    return results
+
+
+def sketch_lists(groups: np.ndarray, values: np.ndarray, scale: int, n: int) -> list[Optional[list[int]]]:
+    """Serialized sketch of `values` for each of `n` groups (None for groups without values)."""
+    sketches = [None] * n
+    if not len(values):
+        return sketches
+
+    bins = np.rint(values * scale).astype(np.int64)
+    pairs, counts = np.unique(np.column_stack((groups, bins)), axis=0, return_counts=True)
+    bounds = np.searchsorted(pairs[:, 0], np.arange(n + 1))
+    for i in range(n):
+        lo, hi = bounds[i], bounds[i + 1]
+        if hi > lo:
+            sketches[i] = encode_sketch_bins(scale, zip(pairs[lo:hi, 1].tolist(), counts[lo:hi].tolist()))
+    return sketches
+
+
+def vectorized_sketches(batters: StatcastColumns, pitchers: StatcastColumns) -> dict[str, dict]:
+    """
+    Serialized EV/LA/velocity sketches for every player of one level, like collect_sketches.
+
+    Returns dict mapping player_id -> {'ev': [...], 'la': [...], 'velo': {pitch_type: [...]}}
+    """
+    blocks = {}
+
+    valid, players, _, inv = group_players(batters, 'batter')
+    if len(players):
+        ev = column_values(batters, 'launch_speed')[valid]
+        la = column_values(batters, 'launch_angle')[valid]
+        bbe = ~np.isnan(ev) & ~np.isnan(la)
+        ev_sketches = sketch_lists(inv[bbe], ev[bbe], EV_SKETCH_SCALE, len(players))
+        la_sketches = sketch_lists(inv[bbe], la[bbe], LA_SKETCH_SCALE, len(players))
+        for i, player_id in enumerate(players):
+            if ev_sketches[i] is not None:
+                blocks[str(int(player_id))] = {'ev': ev_sketches[i], 'la': la_sketches[i]}
+
+    valid, players, _, inv = group_players(pitchers, 'pitcher')
+    if len(players):
+        velo = column_values(pitchers, 'release_speed')[valid]
+        has_velo = ~np.isnan(velo)
+        type_names = pitchers.dictionaries['pitch_type']
+        width = max(len(type_names), 1)
+        group_keys = inv[has_velo].astype(np.int64) * width \
+            + column_values(pitchers, 'pitch_type')[valid][has_velo].astype(np.int64)
+        groups, ginv = np.unique(group_keys, return_inverse=True)
+        velo_sketches = sketch_lists(ginv.reshape(-1), velo[has_velo], VELO_SKETCH_SCALE, len(groups))
+
+        # Pitch types in name order, like collect_sketches
+        for j in sorted(range(len(groups)), key=lambda j: (groups[j] // width, type_names[groups[j] % width])):
+            player_id = str(int(players[groups[j] // width]))
+            block = blocks.setdefault(player_id, {})
+            block.setdefault('velo', {})[type_names[groups[j] % width]] = velo_sketches[j]
+
+    return blocks
+
+
+def collect_sketches(aggregates: dict[tuple[str, str], StatcastAggregate], player_ids: Iterable[str]) -> dict:
+    """
+    Serialized EV/LA/velocity sketches for the given players at every level they appear.
+
+    Returns dict mapping player_id -> level -> {'ev': [...], 'la': [...], 'velo': {pitch_type: [...]}}
+    """
+    sketches = {}
+    player_ids = list(player_ids)
+    for level in STATCAST_LEVELS:
+        batters = aggregates[(level, 'batter')].players
+        pitchers = aggregates[(level, 'pitcher')].players
+        for player_id in player_ids:
+            block = {}
+            acc = batters.get(player_id)
+            if acc is not None and acc.ev_sketch.count:
+                block['ev'] = acc.ev_sketch.to_list()
+                block['la'] = acc.la_sketch.to_list()
+            acc = pitchers.get(player_id)
+            if acc is not None and acc.pitch_types:
+                block['velo'] = {
+                    pitch_type: pt.velo_sketch.to_list() for pitch_type, pt in sorted(acc.pitch_types.items())
+                }
+            if block:
+                sketches.setdefault(player_id, {})[level.upper()] = block
+    return sketches
+
+
+def sketch_percentiles(blocks: Iterable[dict]) -> dict:
+    """
+    EV/LA/velocity percentiles from sketch blocks merged across months and/or levels.
+
+    Each block is one level's entry from collect_sketches (or a month file's
+    'sketches'), so combining periods or levels is a sum over bins.
+    """
+    ev = QuantileSketch(EV_SKETCH_SCALE)
+    la = QuantileSketch(LA_SKETCH_SCALE)
+    velo: dict[str, QuantileSketch] = {}
+    for block in blocks:
+        if 'ev' in block:
+            ev.merge(QuantileSketch.from_list(block['ev']))
+            la.merge(QuantileSketch.from_list(block['la']))
+        for pitch_type, data in block.get('velo', {}).items():
+            velo.setdefault(pitch_type, QuantileSketch(VELO_SKETCH_SCALE)).merge(QuantileSketch.from_list(data))
+
+    result = {}
+    if ev.count:
+        result['BBE'] = ev.count
+        result['EV50'] = round(ev.quantile(0.5), 1)
+        result['EV90'] = round(ev.quantile(0.9), 1)
+        result['maxEV'] = round(ev.max(), 1)
+        result['LA10'] = round(la.quantile(0.1), 1)
+        result['LA50'] = round(la.quantile(0.5), 1)
+        result['LA90'] = round(la.quantile(0.9), 1)
+    pitch_velos = {
+        pitch_type: {
+            'n': sketch.count,
+            'v10': round(sketch.quantile(0.1), 1),
+            'v50': round(sketch.quantile(0.5), 1),
+            'v90': round(sketch.quantile(0.9), 1),
+        }
+        for pitch_type, sketch in velo.items() if sketch.count >= 5
+    }
+    if pitch_velos:
+        result['velo'] = pitch_velos
+    return result
+
+
+def build_level_players_vectorized(batters: StatcastColumns, pitchers: StatcastColumns, level: str) -> dict:
+    """
+    Vectorized build_level_players over archived rows, computing all players at once.
+
+    Returns dict mapping player_id -> statcast metrics
+    """
+    players = {}
+
+    for player_id, (name, stats) in vectorized_batter_stats(batters).items():
+        players[player_id] = {
+            'id': player_id,
+            'name': name,
+            'type': 'batter',
+            'level': level,
+            'bat': stats,
+        }
+
+    for player_id, (name, stats) in vectorized_pitcher_stats(pitchers).items():
+        if player_id in players:
+            players[player_id]['pit'] = stats
+            if stats.get('Pitches', 0) > players[player_id].get('bat', {}).get('BBE', 0) * 3:
+                players[player_id]['type'] = 'pitcher'
+        else:
+            players[player_id] = {
+                'id': player_id,
+                'name': name,
+                'type': 'pitcher',
+                'level': level,
+                'pit': stats,
+            }
+
+    return players
+
+
 def submit_initial_requests(
     session: requests.Session,
     year: int,
@@ -605,134 +1597,556 @@ def submit_initial_requests(
             pass
 
 
+class ChunkPlanner:
+    """
+    Hands out date chunks for one (level, player_type) stream.
+
+    Chunks start at CHUNK_DAYS and are then sized from the row density of the
+    last completed chunk, so sparse periods use fewer, larger requests and
+    dense periods stay under the row limit. Failed chunks say nothing about
+    density and are not observed; chunks at the row limit only bound it below.
+    """
+
+    def __init__(self, start_date: datetime, end_date: datetime):
+        self.cursor = start_date
+        self.end_date = end_date
+        self.rows_per_day: Optional[float] = None
+
+    def has_more(self) -> bool:
+        return self.cursor <= self.end_date
+
+    def chunk_days(self) -> int:
+        if self.rows_per_day is None:
+            return CHUNK_DAYS
+        if self.rows_per_day <= 0:
+            return MAX_CHUNK_DAYS
+        days = int(ROW_LIMIT_WARNING * TARGET_CHUNK_FILL / self.rows_per_day)
+        return max(1, min(days, MAX_CHUNK_DAYS))
+
+    def next_chunk(self) -> tuple[str, str]:
+        chunk_end = min(self.cursor + timedelta(days=self.chunk_days() - 1), self.end_date)
+        chunk = (self.cursor.strftime('%Y-%m-%d'), chunk_end.strftime('%Y-%m-%d'))
+        self.cursor = chunk_end + timedelta(days=1)
+        return chunk
+
+    def observe(self, rows: int, chunk_start: str, chunk_end: str) -> None:
+        """Learn the row density of a downloaded chunk (rows at ROW_LIMIT_WARNING mean truncated)."""
+        days = (datetime.strptime(chunk_end, '%Y-%m-%d') - datetime.strptime(chunk_start, '%Y-%m-%d')).days + 1
+        rows_per_day = rows / days
+        if rows >= ROW_LIMIT_WARNING:
+            # The true density is at least this - never shrink the estimate on a truncated chunk
+            rows_per_day = max(rows_per_day, self.rows_per_day or 0.0)
+        self.rows_per_day = rows_per_day
+
+
+def split_chunk(chunk_start: str, chunk_end: str, filters: tuple) -> list[tuple[str, str, tuple]]:
+    """
+    Split a chunk that hit the row limit into smaller chunks covering the same rows.
+
+    Multi-day chunks are bisected by date. A single day is partitioned by the
+    next unused entry in SPLIT_FILTERS. Returns [] when no further split exists.
+    """
+    start = datetime.strptime(chunk_start, '%Y-%m-%d')
+    end = datetime.strptime(chunk_end, '%Y-%m-%d')
+
+    if end > start:
+        mid = start + timedelta(days=(end - start).days // 2)
+        return [
+            (chunk_start, mid.strftime('%Y-%m-%d'), filters),
+            ((mid + timedelta(days=1)).strftime('%Y-%m-%d'), chunk_end, filters),
+        ]
+
+    used = {key for key, _ in filters}
+    for key, values in SPLIT_FILTERS:
+        if key not in used:
+            return [(chunk_start, chunk_end, filters + ((key, value),)) for value in values]
+
+    return []
+
+
+def fetch_statcast_chunk(
+    year: int,
+    chunk_start: str,
+    chunk_end: str,
+    player_type: str,
+    level: str,
+    limiter: AdaptiveRateLimiter,
+    filters: tuple = (),
+    archive: bool = False,
+) -> DailyStatcastAggregate:
+    """Download and aggregate a single chunk on the calling worker thread's session."""
+    with span('statcast_chunk', level=level, playerType=player_type, start=chunk_start, end=chunk_end):
+        return fetch_statcast_aggregate(get_thread_session(), year, chunk_start, chunk_end,
+                                        player_type, level, limiter, dict(filters), archive)
+
+
 def fetch_chunked_statcast(
-    session: requests.Session,
     year: int,
     start_date: datetime,
     end_date: datetime,
-    player_type: str,
-    level: str,
-) -> list[dict]:
+    streams: list[tuple[str, str]],
+    max_workers: int = MAX_IN_FLIGHT,
+    rate: float = REQUESTS_PER_SECOND,
+    warmup: bool = False,
+    archive: bool = False,
+) -> dict[tuple[str, str], DailyStatcastAggregate]:
     """
-    Fetch Statcast data using 5-day chunks (sabRmetrics strategy).
-
-    This approach (following sabRmetrics and the R implementation):
-    1. Splits date range into 5-day chunks
-    2. Submits initial warm-up requests to queue data on server
-    3. Downloads each chunk with full timeout and retries
-    4. Warns if any chunk hits the 25,000 row limit
-    5. Combines all data
+    Fetch Statcast data for several (level, player_type) streams using adaptive chunks.
+
+    This approach (building on sabRmetrics and the R implementation):
+    1. Optionally submits warm-up requests for 5-day chunks to queue data on server
+    2. Downloads chunks of every stream concurrently, with at most `max_workers`
+       requests in flight and `rate` request starts per second (the shared Savant
+       limiter lowers both while Savant throttles or fails, see rate_limiter.py)
+    3. Sizes each stream's next chunk from the row density it has seen so far,
+       growing up to MAX_CHUNK_DAYS through sparse periods
+    4. Refetches any chunk that hits the 25,000 row limit as smaller pieces
+       (bisected by date, then partitioned by SPLIT_FILTERS on a single day)
+    5. Merges each stream's per-chunk player aggregates in date order
 
     Args:
-        session: Requests session
         year: Season year
         start_date: Start of the date range
         end_date: End of the date range
-        player_type: 'batter' or 'pitcher'
-        level: 'aaa' for Triple-A or 'a' for Single-A
+        streams: List of (level, player_type) pairs, e.g. ('aaa', 'batter')
+        max_workers: Maximum concurrent requests
+        rate: Maximum request starts per second
+        warmup: Submit sabRmetrics-style warm-up requests before downloading
+        archive: Keep the raw rows of each stream in its aggregate's column buffers
 
     Returns:
-        Combined list of all records from all chunks
+        Dict mapping (level, player_type) -> DailyStatcastAggregate for the whole range,
+        with the date ranges of chunks that failed in its failed_ranges
     """
-    chunks = generate_date_chunks(start_date, end_date)
-    n_chunks = len(chunks)
-    level_name = 'AAA' if level == 'aaa' else 'A'
-
-    logger.info(f"    Downloading {n_chunks} chunk(s) ({CHUNK_DAYS}-day periods) for {level_name} {player_type}s...")
+    logger.info(f"    Downloading {len(streams)} stream(s) in adaptive chunks "
+                f"(starting at {CHUNK_DAYS} days) with up to {max_workers} in flight...")
 
-    # Phase 1: Submit initial warm-up requests (sabRmetrics strategy)
-    submit_initial_requests(session, year, chunks, player_type, level)
+    # Phase 1 (optional): Submit warm-up requests (sabRmetrics strategy)
+    if warmup:
+        session = get_session()
+        chunks = generate_date_chunks(start_date, end_date)
+        for level, player_type in streams:
+            submit_initial_requests(session, year, chunks, player_type, level)
 
     # Phase 2: Download actual data with full timeout and retries
-    logger.debug("    Downloading data chunks...")
-    all_records = []
-    chunks_at_limit = 0
-
-    for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
-        logger.debug(f"      Chunk {i}/{n_chunks}: {chunk_start} to {chunk_end}")
-
-        csv_data = fetch_statcast_csv(session, year, chunk_start, chunk_end, player_type, level)
-        records = parse_statcast_csv(csv_data) if csv_data else []
+    limiter = get_savant_limiter(rate, max_workers)
+    planners = {stream: ChunkPlanner(start_date, end_date) for stream in streams}
+    split_jobs = deque()
+    chunk_aggregates: dict[tuple, DailyStatcastAggregate] = {}
+    requests_made = 0
+    chunks_split = 0
+    chunks_truncated = 0
+    chunks_failed = 0
+
+    def next_job() -> Optional[tuple]:
+        # Refetches of split chunks go first, then the stream furthest behind
+        if split_jobs:
+            return split_jobs.popleft()
+        remaining = [(planner.cursor, stream) for stream, planner in planners.items() if planner.has_more()]
+        if not remaining:
+            return None
+        _, (level, player_type) = min(remaining)
+        chunk_start, chunk_end = planners[(level, player_type)].next_chunk()
+        return level, player_type, chunk_start, chunk_end, ()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+
+        while True:
+            while len(in_flight) < max_workers:
+                job = next_job()
+                if job is None:
+                    break
+                level, player_type, chunk_start, chunk_end, filters = job
+                future = executor.submit(fetch_statcast_chunk, year, chunk_start, chunk_end,
+                                         player_type, level, limiter, filters, archive)
+                in_flight[future] = job
+                requests_made += 1
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                level, player_type, chunk_start, chunk_end, filters = in_flight.pop(future)
+                label = f"{level.upper()} {player_type} {chunk_start} to {chunk_end}"
+                if filters:
+                    label += ' [' + ', '.join(f'{k}={v}' for k, v in filters) + ']'
+
+                try:
+                    aggregate = future.result()
+                except Exception as e:
+                    logger.warning(f"      Chunk {label} failed: {e}")
+                    aggregate = failed_download(player_type, chunk_start, chunk_end, archive)
+                if aggregate.failed_ranges:
+                    chunks_failed += 1
+
+                if not filters and not aggregate.failed_ranges:
+                    planners[(level, player_type)].observe(aggregate.row_count, chunk_start, chunk_end)
+
+                # Chunks at the row limit are truncated - refetch them in smaller pieces
+                if aggregate.row_count >= ROW_LIMIT_WARNING:
+                    pieces = split_chunk(chunk_start, chunk_end, filters)
+                    if pieces:
+                        chunks_split += 1
+                        logger.debug(f"      {label}: hit {ROW_LIMIT_WARNING} row limit, splitting into {len(pieces)}")
+                        split_jobs.extend((level, player_type, *piece) for piece in pieces)
+                        continue
+                    chunks_truncated += 1
+                    logger.warning(f"        ⚠ {label} returned {ROW_LIMIT_WARNING} rows and cannot be split "
+                                   f"further - data may be truncated")
+
+                chunk_aggregates[(level, player_type, chunk_start, filters)] = aggregate
+                logger.debug(f"      {label}: {aggregate.row_count} rows")
+
+    logger.info(f"    {requests_made} request(s), {chunks_split} chunk(s) split at the row limit")
+    if chunks_truncated > 0:
+        logger.warning(f"    ⚠ {chunks_truncated} chunk(s) returned {ROW_LIMIT_WARNING} rows. Data may be missing.")
+    if chunks_failed > 0:
+        logger.error(f"    ✗ {chunks_failed} chunk(s) could not be downloaded")
+
+    # Merge in date order so each player's name comes from their earliest row
+    results = {
+        (level, player_type): DailyStatcastAggregate(player_type, StatcastColumns() if archive else None)
+        for level, player_type in streams
+    }
+    for key in sorted(chunk_aggregates):
+        results[(key[0], key[1])].merge(chunk_aggregates.pop(key))
+
+    for (level, player_type), aggregate in results.items():
+        level_name = 'AAA' if level == 'aaa' else 'A'
+        logger.info(f"    ✓ Total {level_name} {player_type} rows: {aggregate.row_count} "
+                    f"({len(aggregate.days)} days)")
+
+    return results
+
+
+def merge_level_players(all_players: dict, level_players: dict) -> None:
+    """Merge one level's player entries into all_players in place (earlier levels win)."""
+    for player_id, player_data in level_players.items():
+        if player_id in all_players:
+            existing = all_players[player_id]
+            if 'bat' in player_data and 'bat' not in existing:
+                existing['bat'] = player_data['bat']
+            if 'pit' in player_data and 'pit' not in existing:
+                existing['pit'] = player_data['pit']
+        else:
+            all_players[player_id] = player_data
 
-        if records:
-            all_records.extend(records)
-            logger.debug(f"        ✓ {len(records)} rows")
 
-            # Check for row limit (data may be truncated)
-            if len(records) == ROW_LIMIT_WARNING:
-                chunks_at_limit += 1
-                logger.warning(f"        ⚠ Chunk {i} returned exactly {ROW_LIMIT_WARNING} rows - data may be truncated")
-        else:
-            logger.debug(f"        • No data (likely no games)")
+def combine_level_players(aggregates: dict[tuple[str, str], StatcastAggregate], log_counts: bool = True) -> dict:
+    """Build player entries for every level and merge them into one dict keyed by player id."""
+    all_players = {}
 
-        # Rate limiting between chunks
-        if i < n_chunks:
-            time.sleep(1)
+    for level in STATCAST_LEVELS:
+        level_name = 'Triple-A' if level == 'aaa' else 'Single-A (FSL)'
 
-    if chunks_at_limit > 0:
-        logger.warning(f"    ⚠ {chunks_at_limit} chunk(s) returned exactly {ROW_LIMIT_WARNING} rows. Data may be missing.")
+        # Process into player aggregations
+        level_players = build_level_players(
+            aggregates[(level, 'batter')], aggregates[(level, 'pitcher')], level.upper()
+        )
+        if log_counts:
+            logger.info(f"    {level_name} players with sufficient data: {len(level_players)}")
+        merge_level_players(all_players, level_players)
 
-    logger.info(f"    ✓ Total {level_name} {player_type} rows: {len(all_records)}")
-    return all_records
+    return all_players
 
 
-def fetch_month_statcast(
-    session: requests.Session,
-    year: int,
-    month: int,
-) -> dict:
-    """Fetch Statcast data for a specific month using 5-day chunking."""
-    # Calculate month date range
+def get_month_range(year: int, month: int) -> tuple[datetime, datetime]:
+    """First and last day of a month."""
     start_date = datetime(year, month, 1)
     if month == 12:
         end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
     else:
         end_date = datetime(year, month + 1, 1) - timedelta(days=1)
+    return start_date, end_date
 
-    # Don't fetch future dates
-    today = datetime.now()
-    if start_date > today:
-        return {}
-    if end_date > today:
-        end_date = today
 
-    all_players = {}
+def get_day_path(date_str: str) -> Path:
+    """Path of the per-day Statcast aggregates for a date (YYYY-MM-DD)."""
+    year, month, day = date_str.split('-')
+    return DAILY_DIR / year / month / f'{day}.json'
 
-    # Fetch for each supported level
-    for level in ['aaa', 'a']:  # AAA and Single-A (FSL)
-        level_name = 'Triple-A' if level == 'aaa' else 'Single-A (FSL)'
-        logger.info(f"  Fetching {level_name} data (using {CHUNK_DAYS}-day chunks)...")
 
-        # Fetch batter data with chunking
-        batter_records = fetch_chunked_statcast(session, year, start_date, end_date, 'batter', level)
+def load_fetched_days(year: int) -> set[str]:
+    """Dates of a season already fetched from Savant (including days without games)."""
+    index_file = DAILY_DIR / str(year) / 'index.json'
+    if not index_file.exists():
+        return set()
+    try:
+        with open(index_file) as f:
+            return set(json.load(f).get('dates', []))
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to read {index_file}: {e}")
+        return set()
 
-        time.sleep(2)
 
-        # Fetch pitcher data with chunking
-        pitcher_records = fetch_chunked_statcast(session, year, start_date, end_date, 'pitcher', level)
+def mark_days_fetched(year: int, dates: list[str]) -> None:
+    """Record completed dates in the season's fetched-days index."""
+    # Today's games are still in progress, so today is never marked as complete
+    today = datetime.now().strftime('%Y-%m-%d')
+    fetched = load_fetched_days(year) | {date for date in dates if date < today}
 
-        # Process into player aggregations
-        level_players = process_statcast_data(batter_records, pitcher_records, level.upper())
-        logger.info(f"    Players with sufficient data: {len(level_players)}")
-
-        # Merge into all_players
-        for player_id, player_data in level_players.items():
-            if player_id in all_players:
-                existing = all_players[player_id]
-                if 'bat' in player_data and 'bat' not in existing:
-                    existing['bat'] = player_data['bat']
-                if 'pit' in player_data and 'pit' not in existing:
-                    existing['pit'] = player_data['pit']
-            else:
-                all_players[player_id] = player_data
+    index_file = DAILY_DIR / str(year) / 'index.json'
+    write_json(index_file, {'year': year, 'updated': datetime.now().isoformat(), 'dates': sorted(fetched)})
 
-        time.sleep(3)
 
-    return all_players
+def save_day_aggregates(aggregates: dict[tuple[str, str], DailyStatcastAggregate], dates: list[str]) -> int:
+    """
+    Save per-day, per-player Statcast totals for each fetched date.
 
+    Days without any rows get no file (a stale file from an earlier fetch is
+    removed). Returns the number of day files whose content changed.
+    """
+    written = 0
+    for date_str in dates:
+        streams = {
+            f'{level}-{player_type}': aggregate.days[date_str].to_state()
+            for (level, player_type), aggregate in aggregates.items()
+            if date_str in aggregate.days
+        }
+        day_file = get_day_path(date_str)
+
+        if not streams:
+            if day_file.exists():
+                day_file.unlink()
+            continue
+
+        output = {
+            'date': date_str,
+            'updated': datetime.now().isoformat(),
+            'streams': streams,
+        }
+        if write_json(day_file, output):
+            written += 1
+
+    if dates:
+        mark_days_fetched(int(dates[0][:4]), dates)
+    return written
+
+
+def list_day_dates(year: int, start: str = '', end: str = '9999') -> list[str]:
+    """Dates with saved per-day aggregates in [start, end], in order."""
+    year_dir = DAILY_DIR / str(year)
+    if not year_dir.exists():
+        return []
+    dates = [
+        f'{year}-{day_file.parent.name}-{day_file.stem}'
+        for day_file in year_dir.glob('[0-9][0-9]/[0-9][0-9].json')
+    ]
+    return sorted(date for date in dates if start <= date <= end)
+
+
+def read_day_states(dates: list[str]) -> dict[str, dict]:
+    """Load the saved stream states for each date: date -> {'aaa-batter': state, ...}."""
+    states = {}
+    for date_str in dates:
+        day_file = get_day_path(date_str)
+        try:
+            with open(day_file) as f:
+                states[date_str] = json.load(f).get('streams', {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {day_file}: {e}")
+    return states
+
+
+def merge_day_states(states: dict[str, dict], dates: list[str]) -> dict[tuple[str, str], StatcastAggregate]:
+    """Merge per-day states for `dates` into one aggregate per (level, player_type)."""
+    aggregates = {
+        (level, player_type): StatcastAggregate(player_type)
+        for level in STATCAST_LEVELS for player_type in PLAYER_TYPES
+    }
+    # Merge in date order so each player's name comes from their earliest day
+    for date_str in sorted(dates):
+        for stream, state in states.get(date_str, {}).items():
+            level, player_type = stream.split('-')
+            if (level, player_type) in aggregates:
+                aggregates[(level, player_type)].merge(StatcastAggregate.from_state(player_type, state))
+    return aggregates
+
+
+def build_month_from_days(year: int, month: int) -> tuple[dict, dict]:
+    """
+    Build a month's Statcast player data by merging its saved per-day aggregates.
 
-def save_month_data(year: int, month: int, players: dict) -> None:
-    """Save monthly Statcast data to file."""
+    Returns:
+        (players, sketches) - see combine_level_players and collect_sketches
+    """
+    dates = list_day_dates(year, f'{year}-{month:02d}-01', f'{year}-{month:02d}-31')
+    if not dates:
+        return {}, {}
+    aggregates = merge_day_states(read_day_states(dates), dates)
+    players = combine_level_players(aggregates)
+    return players, collect_sketches(aggregates, players)
+
+
+def save_season_views(year: int) -> None:
+    """
+    Save season-to-date and rolling (L7/L14/L30) Statcast views merged from the per-day aggregates.
+
+      data/statcast/{year}/season.json  - Season to date
+      data/statcast/{year}/rolling.json - Last N days ending at the latest day with data
+    """
+    dates = list_day_dates(year)
+    if not dates:
+        return
+
+    # Day files live in the Actions cache, not git. If the cache lost earlier
+    # months, views built from what's left would silently drop them.
+    year_dir = STATCAST_DIR / str(year)
+    day_months = {int(date[5:7]) for date in dates}
+    missing = sorted(int(f.stem) for f in year_dir.glob('[0-9][0-9].json') if int(f.stem) not in day_months)
+    if missing:
+        logger.warning(f"\nNo per-day aggregates for month(s) {', '.join(map(str, missing))} of {year}; "
+                       f"leaving the season and rolling views unchanged. Rebuild them with "
+                       f"--reaggregate (raw archive) or --all-months (refetch).")
+        return
+
+    logger.info(f"\nBuilding season-to-date and rolling Statcast views from {len(dates)} day(s)...")
+    states = read_day_states(dates)
+    through = dates[-1]
+    year_dir.mkdir(parents=True, exist_ok=True)
+
+    aggregates = merge_day_states(states, dates)
+    players = combine_level_players(aggregates, log_counts=False)
+    sketches = collect_sketches(aggregates, players)
+    season = {
+        'year': year,
+        'updated': datetime.now().isoformat(),
+        'through': through,
+        'players': players,
+        # Percentiles across all levels, merged from the per-level sketches
+        'percentiles': {player_id: sketch_percentiles(levels.values()) for player_id, levels in sketches.items()},
+        'sketches': sketches,
+    }
+    if write_json(year_dir / 'season.json', season):
+        logger.info(f"Saved {len(season['players'])} players to {year_dir / 'season.json'}")
+
+    windows = {}
+    through_date = datetime.strptime(through, '%Y-%m-%d')
+    for days in ROLLING_WINDOWS:
+        window_start = (through_date - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        window_dates = [date for date in dates if date >= window_start]
+        windows[f'L{days}'] = combine_level_players(merge_day_states(states, window_dates), log_counts=False)
+
+    rolling = {
+        'year': year,
+        'updated': datetime.now().isoformat(),
+        'through': through,
+        'windows': windows,
+    }
+    if write_json(year_dir / 'rolling.json', rolling):
+        logger.info(f"Saved rolling windows ({', '.join(windows)}) to {year_dir / 'rolling.json'}")
+
+
+def fetch_statcast_days(
+    year: int,
+    start_date: datetime,
+    end_date: datetime,
+    max_workers: int = MAX_IN_FLIGHT,
+    rate: float = REQUESTS_PER_SECOND,
+    warmup: bool = False,
+    archive: bool = True,
+) -> list[str]:
+    """
+    Fetch Statcast data for a date range within one month using concurrent adaptive chunks.
+
+    Saves per-day aggregates for every date in the range and, unless disabled,
+    replaces those dates in the month's raw archive partitions.
+
+    Dates covered by a chunk that failed to download are left untouched: their
+    day files and archived rows are kept, and they are not marked as fetched,
+    so the next --yesterday run retries them.
+
+    Returns:
+        Dates fetched (YYYY-MM-DD), without the failed ones
+    """
+    dates = [
+        (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
+        for i in range((end_date - start_date).days + 1)
+    ]
+
+    # Fetch every level and player type at once
+    streams = [(level, player_type) for level in STATCAST_LEVELS for player_type in PLAYER_TYPES]
+    logger.info(f"  Fetching Triple-A and Single-A (FSL) data ({dates[0]} to {dates[-1]})...")
+    aggregates = fetch_chunked_statcast(year, start_date, end_date, streams, max_workers, rate, warmup, archive)
+
+    failed = set()
+    for aggregate in aggregates.values():
+        failed |= aggregate.failed_dates(dates)
+    if failed:
+        count('failed_days', len(failed))
+        logger.error(f"    ✗ Savant downloads failed for {len(failed)} day(s) ({min(failed)} to {max(failed)}); "
+                     f"keeping their existing data")
+
+    if archive:
+        for (level, player_type), aggregate in aggregates.items():
+            # Rows of a partly downloaded day would replace complete archived ones
+            stream_failed = aggregate.failed_dates(dates)
+            columns = aggregate.columns.without_dates(stream_failed) if stream_failed else aggregate.columns
+            update_partition(year, start_date.month, level, player_type, columns, set(dates) - stream_failed)
+            aggregate.columns = None
+        logger.info(f"    Archived raw rows to {STATCAST_DIR / 'raw' / str(year) / f'{start_date.month:02d}'}")
+
+    dates = [date for date in dates if date not in failed]
+    written = save_day_aggregates(aggregates, dates)
+    logger.info(f"    Per-day aggregates changed for {written} day(s)")
+    return dates
+
+
+def reaggregate_month_statcast(year: int, month: int) -> tuple[dict, dict]:
+    """
+    Rebuild a month's Statcast player data from the raw archive, without fetching.
+
+    The month file uses the vectorized aggregations, which produce the same
+    output as the streaming accumulators used while fetching: rows are taken in
+    date order (so names come from each player's earliest game and arsenals
+    list pitch types in order of first appearance) and sums are exact. The
+    month's per-day aggregates are rebuilt from the archive too, so season and rolling
+    views pick up any aggregation changes.
+    """
+    partitions = {}
+    for level in STATCAST_LEVELS:
+        for player_type in PLAYER_TYPES:
+            # Partitions written before rows were kept date-sorted may be in download order
+            columns = read_partition(year, month, level, player_type) or StatcastColumns()
+            partitions[(level, player_type)] = columns.sorted_by_date()
+
+    archived_rows = sum(len(columns) for columns in partitions.values())
+    if not archived_rows:
+        return {}, {}
+
+    logger.info(f"  Re-aggregating {archived_rows} archived rows...")
+    all_players = {}
+
+    for level in STATCAST_LEVELS:
+        level_name = 'Triple-A' if level == 'aaa' else 'Single-A (FSL)'
+        level_players = build_level_players_vectorized(
+            partitions[(level, 'batter')], partitions[(level, 'pitcher')], level.upper()
+        )
+        logger.info(f"    {level_name} players with sufficient data: {len(level_players)}")
+        merge_level_players(all_players, level_players)
+
+    sketches = {}
+    for level in STATCAST_LEVELS:
+        blocks = vectorized_sketches(partitions[(level, 'batter')], partitions[(level, 'pitcher')])
+        for player_id in all_players:
+            if player_id in blocks:
+                sketches.setdefault(player_id, {})[level.upper()] = blocks[player_id]
+
+    daily = {}
+    for (level, player_type), columns in partitions.items():
+        daily[(level, player_type)] = DailyStatcastAggregate(player_type)
+        for rec in columns.records(STATCAST_COLUMNS):
+            daily[(level, player_type)].add_row(rec)
+    dates = sorted({date for aggregate in daily.values() for date in aggregate.days if date})
+    save_day_aggregates(daily, dates)
+
+    return all_players, sketches
+
+
+def save_month_data(year: int, month: int, players: dict, sketches: Optional[dict] = None) -> None:
+    """Save monthly Statcast data (and the players' EV/LA/velocity sketches) to file."""
     year_dir = STATCAST_DIR / str(year)
     year_dir.mkdir(parents=True, exist_ok=True)
 
@@ -744,11 +2158,13 @@ def save_month_data(year: int, month: int, players: dict) -> None:
         'updated': datetime.now().isoformat(),
         'players': players,
     }
+    if sketches:
+        output['sketches'] = sketches
 
-    with open(month_file, 'w') as f:
-        json.dump(output, f, separators=(',', ':'))
-
-    logger.info(f"Saved {len(players)} players to {month_file}")
+    if write_json(month_file, output):
+        logger.info(f"Saved {len(players)} players to {month_file}")
+    else:
+        logger.info(f"No changes for {len(players)} players in {month_file}")
 
 
 def update_manifest(year: int, months: list[int]) -> None:
@@ -768,18 +2184,85 @@ def update_manifest(year: int, months: list[int]) -> None:
         },
     }
 
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    if write_json(manifest_file, manifest, indent=2):
+        logger.info(f"Updated manifest: {manifest_file}")
+
+
+def statcast_block_hash(block: dict) -> str:
+    """Content hash of a player's Statcast block, independent of key order."""
+    return content_hash(block)[:16]
+
+
+def get_sidecar_path(year: int, month: int) -> Path:
+    """Path of the Statcast sidecar for a monthly stats file."""
+    return STATS_DIR / str(year) / f'{month:02d}{STATCAST_SIDECAR_SUFFIX}'
+
+
+def build_statcast_blocks(sc_players: dict, st_players: dict) -> dict[str, dict]:
+    """Statcast blocks ({bat, pit, level}) for the players present in a monthly stats file."""
+    blocks = {}
+    for player_id, sc in sc_players.items():
+        if player_id not in st_players:
+            continue
+        block = {key: sc[key] for key in ('bat', 'pit', 'level') if key in sc}
+        if block:
+            blocks[player_id] = block
+    return blocks
+
+
+def update_stats_manifest_sidecars(year: int) -> None:
+    """List the months with a Statcast sidecar in the stats manifest, so the loader knows to join them."""
+    manifest_file = STATS_DIR / str(year) / 'manifest.json'
+    if not manifest_file.exists():
+        return
+
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+
+    sidecar_months = list_statcast_sidecar_months(manifest_file.parent)
+    if manifest.get('statcastMonths', []) == sidecar_months:
+        return
+
+    if sidecar_months:
+        manifest['statcastMonths'] = sidecar_months
+    else:
+        manifest.pop('statcastMonths', None)
 
-    logger.info(f"Updated manifest: {manifest_file}")
+    write_json(manifest_file, manifest, indent=2)
+    logger.info(f"Updated Statcast sidecar months in {manifest_file}")
 
 
-def enrich_stats_with_statcast(year: int, month: int) -> None:
+def save_statcast_sidecar(year: int, month: int, blocks: dict[str, dict], hashes: dict[str, str]) -> bool:
+    """
+    Write the Statcast sidecar for a month unless its blocks are unchanged.
+
+    Returns:
+        True if the sidecar was written
+    """
+    sidecar = {
+        'year': year,
+        'month': month,
+        'updated': datetime.now().isoformat(),
+        'hashes': hashes,
+        'players': blocks,
+    }
+    return write_json(get_sidecar_path(year, month), sidecar)
+
+
+def enrich_stats_with_statcast(year: int, month: int, sidecar: bool = False) -> None:
     """
     Enrich the monthly stats file with Statcast data.
 
-    Reads the statcast monthly file and the stats monthly file,
-    then adds statcast fields to each player's data in the stats file.
+    Each player's Statcast block ({bat, pit, level}) is compared by content hash
+    with what the stats month already has, and nothing is rewritten unless a
+    block changed.
+
+    Args:
+        year: Season year
+        month: Month number
+        sidecar: Write the blocks to data/stats/{year}/{month}.statcast.json,
+            keyed by player, instead of embedding them in the stats file. The
+            frontend loader joins the sidecar onto the month's players.
     """
     statcast_file = STATCAST_DIR / str(year) / f'{month:02d}.json'
     stats_file = STATS_DIR / str(year) / f'{month:02d}.json'
@@ -798,31 +2281,44 @@ def enrich_stats_with_statcast(year: int, month: int) -> None:
     with open(stats_file) as f:
         stats_data = json.load(f)
 
-    sc_players = statcast_data.get('players', {})
     st_players = stats_data.get('players', {})
-
-    enriched_count = 0
-    for player_id, sc in sc_players.items():
-        if player_id in st_players:
-            # Add statcast block to the player's stats
-            statcast_block = {}
-            if 'bat' in sc:
-                statcast_block['bat'] = sc['bat']
-            if 'pit' in sc:
-                statcast_block['pit'] = sc['pit']
-            if 'level' in sc:
-                statcast_block['level'] = sc['level']
-
-            if statcast_block:
-                st_players[player_id]['statcast'] = statcast_block
-                enriched_count += 1
-
-    stats_data['players'] = st_players
-
-    with open(stats_file, 'w') as f:
-        json.dump(stats_data, f, separators=(',', ':'))
-
-    logger.info(f"Enriched {enriched_count} players in stats/{year}/{month:02d}.json with Statcast data")
+    blocks = build_statcast_blocks(statcast_data.get('players', {}), st_players)
+    hashes = {player_id: statcast_block_hash(block) for player_id, block in blocks.items()}
+    sidecar_file = get_sidecar_path(year, month)
+
+    stats_changed = 0
+    if sidecar:
+        # Blocks live in the sidecar - drop any embedded by an earlier run
+        for player_data in st_players.values():
+            if player_data.pop('statcast', None) is not None:
+                stats_changed += 1
+
+        if save_statcast_sidecar(year, month, blocks, hashes):
+            logger.info(f"Wrote {len(blocks)} Statcast blocks to {sidecar_file}")
+        else:
+            logger.info(f"Statcast blocks for {year}/{month:02d} unchanged, sidecar not rewritten")
+    else:
+        for player_id, block in blocks.items():
+            existing = st_players[player_id].get('statcast')
+            if existing is None or statcast_block_hash(existing) != hashes[player_id]:
+                st_players[player_id]['statcast'] = block
+                stats_changed += 1
+
+        # Blocks are embedded again - a stale sidecar would shadow them
+        if sidecar_file.exists():
+            sidecar_file.unlink()
+            logger.info(f"Removed {sidecar_file}")
+
+    update_stats_manifest_sidecars(year)
+
+    if stats_changed:
+        write_json(stats_file, stats_data)
+        if sidecar:
+            logger.info(f"Moved {stats_changed} embedded Statcast blocks out of stats/{year}/{month:02d}.json")
+        else:
+            logger.info(f"Updated {stats_changed} of {len(blocks)} Statcast blocks in stats/{year}/{month:02d}.json")
+    elif not sidecar:
+        logger.info(f"All {len(blocks)} Statcast blocks in stats/{year}/{month:02d}.json unchanged, not rewritten")
 
 
 def main():
@@ -832,90 +2328,145 @@ def main():
                         help='Specific month to fetch (default: current or all)')
     parser.add_argument('--all-months', action='store_true',
                         help='Fetch all season months (April-September)')
+    parser.add_argument('--yesterday', action='store_true',
+                        help="Fetch only the days of yesterday's month not fetched yet (usually just yesterday) "
+                             "and rebuild the month, season and rolling views from per-day aggregates")
     parser.add_argument('--enrich-only', action='store_true',
                         help='Only enrich stats files with existing Statcast data (no fetching)')
+    parser.add_argument('--workers', type=int, default=MAX_IN_FLIGHT,
+                        help=f'Maximum concurrent Savant requests (default: {MAX_IN_FLIGHT})')
+    parser.add_argument('--rate', type=float, default=REQUESTS_PER_SECOND,
+                        help=f'Maximum Savant requests started per second (default: {REQUESTS_PER_SECOND})')
+    parser.add_argument('--warmup', action='store_true',
+                        help='Submit warm-up requests to queue chunks on the server before downloading')
+    parser.add_argument('--reaggregate', action='store_true',
+                        help='Rebuild monthly files from the raw pitch archive (no fetching). '
+                             'Without --month/--all-months, every archived month of the year')
+    parser.add_argument('--no-archive', action='store_true',
+                        help="Don't keep fetched pitch rows in the raw archive")
+    parser.add_argument('--statcast-sidecar', action='store_true',
+                        help='Write Statcast blocks to data/stats/{year}/{month}.statcast.json '
+                             'instead of embedding them in the monthly stats files')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    add_run_arguments(parser)
     args = parser.parse_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Determine which months to process
-    if args.month:
-        months_to_fetch = [args.month]
-    elif args.all_months:
-        months_to_fetch = SEASON_MONTHS
-    else:
-        current_month = datetime.now().month
-        if current_month in SEASON_MONTHS:
-            months_to_fetch = [current_month]
+    with run_report('fetch_statcast', args):
+        # Nightly runs fetch through yesterday only, in yesterday's season
+        yesterday = datetime.now() - timedelta(days=1)
+        if args.yesterday:
+            args.year = yesterday.year
+
+        # Determine which months to process
+        if args.yesterday:
+            months_to_fetch = [yesterday.month]
+        elif args.month:
+            months_to_fetch = [args.month]
+        elif args.all_months:
+            months_to_fetch = SEASON_MONTHS
+        elif args.reaggregate:
+            months_to_fetch = list_archived_months(args.year)
         else:
-            logger.info(f"Month {current_month} is outside season (April-September)")
-            months_to_fetch = []
-
-    # Enrich-only mode: skip fetching, just merge existing statcast data into stats files
-    if args.enrich_only:
-        logger.info(f"Enriching stats files with existing Statcast data for {args.year}...")
-        for month in months_to_fetch:
-            enrich_stats_with_statcast(args.year, month)
-        return
-
-    logger.info(f"Fetching {args.year} MiLB Statcast data...")
-    logger.info("Note: Statcast data is only available for AAA and Florida State League games")
-
-    session = get_session()
-    months_fetched = []
+            current_month = datetime.now().month
+            if current_month in SEASON_MONTHS:
+                months_to_fetch = [current_month]
+            else:
+                logger.info(f"Month {current_month} is outside season (April-September)")
+                months_to_fetch = []
+
+        # Enrich-only mode: skip fetching, just merge existing statcast data into stats files
+        if args.enrich_only:
+            logger.info(f"Enriching stats files with existing Statcast data for {args.year}...")
+            for month in months_to_fetch:
+                enrich_stats_with_statcast(args.year, month, sidecar=args.statcast_sidecar)
+            return
+
+        if args.reaggregate:
+            logger.info(f"Re-aggregating {args.year} MiLB Statcast data from the raw archive...")
+        else:
+            logger.info(f"Fetching {args.year} MiLB Statcast data...")
+            logger.info("Note: Statcast data is only available for AAA and Florida State League games")
 
-    for month in months_to_fetch:
-        month_name = datetime(args.year, month, 1).strftime('%B')
-        logger.info(f"\nFetching {month_name} {args.year}...")
+        months_fetched = []
 
-        try:
-            players = fetch_month_statcast(session, args.year, month)
+        for month in months_to_fetch:
+            month_name = datetime(args.year, month, 1).strftime('%B')
+            logger.info(f"\n{'Re-aggregating' if args.reaggregate else 'Fetching'} {month_name} {args.year}...")
 
-            if players:
-                save_month_data(args.year, month, players)
-                months_fetched.append(month)
+            try:
+                if args.reaggregate:
+                    with span('reaggregate_month', month=month), track_allocations('reaggregate_month'):
+                        players, sketches = reaggregate_month_statcast(args.year, month)
+                else:
+                    start_date, end_date = get_month_range(args.year, month)
+                    # Don't fetch future dates
+                    end_date = min(end_date, yesterday if args.yesterday else datetime.now())
+
+                    if args.yesterday:
+                        # Resume from the first day of the month not fetched yet
+                        fetched = load_fetched_days(args.year)
+                        while start_date <= end_date and start_date.strftime('%Y-%m-%d') in fetched:
+                            start_date += timedelta(days=1)
+
+                    if start_date <= end_date:
+                        with span('fetch_days', month=month), track_allocations('fetch_days'):
+                            fetch_statcast_days(args.year, start_date, end_date, args.workers, args.rate, args.warmup,
+                                                archive=not args.no_archive)
+                    else:
+                        logger.info("  All days already fetched")
+
+                    with span('aggregate_month', month=month), track_allocations('aggregate_month'):
+                        players, sketches = build_month_from_days(args.year, month)
+
+                if players:
+                    with span('save_month', month=month):
+                        save_month_data(args.year, month, players, sketches)
+                    months_fetched.append(month)
+                else:
+                    logger.info(f"No data available for {month_name}")
+
+            except Exception as e:
+                logger.error(f"Error fetching {month_name}: {e}")
+                if args.debug:
+                    raise
+
+        # Update manifest with all available months
+        if months_fetched:
+            # Check for existing months
+            year_dir = STATCAST_DIR / str(args.year)
+            if year_dir.exists():
+                existing_months = [
+                    int(f.stem) for f in year_dir.glob('*.json')
+                    if f.stem.isdigit()
+                ]
+                all_months = sorted(set(existing_months + months_fetched))
             else:
-                logger.info(f"No data available for {month_name}")
-
-        except Exception as e:
-            logger.error(f"Error fetching {month_name}: {e}")
-            if args.debug:
-                raise
-
-        time.sleep(5)  # Rate limiting between months
-
-    # Update manifest with all available months
-    if months_fetched:
-        # Check for existing months
-        year_dir = STATCAST_DIR / str(args.year)
-        if year_dir.exists():
-            existing_months = [
-                int(f.stem) for f in year_dir.glob('*.json')
-                if f.stem.isdigit()
-            ]
-            all_months = sorted(set(existing_months + months_fetched))
-        else:
-            all_months = months_fetched
+                all_months = months_fetched
 
-        update_manifest(args.year, all_months)
+            update_manifest(args.year, all_months)
+            with span('season_views'):
+                save_season_views(args.year)
 
-    total_players = sum(
-        len(json.load(open(STATCAST_DIR / str(args.year) / f'{m:02d}.json')).get('players', {}))
-        for m in months_fetched
-        if (STATCAST_DIR / str(args.year) / f'{m:02d}.json').exists()
-    ) if months_fetched else 0
+        total_players = sum(
+            len(json.load(open(STATCAST_DIR / str(args.year) / f'{m:02d}.json')).get('players', {}))
+            for m in months_fetched
+            if (STATCAST_DIR / str(args.year) / f'{m:02d}.json').exists()
+        ) if months_fetched else 0
 
-    logger.info(f"\nFetched {len(months_fetched)} months, ~{total_players} player-months of data")
+        logger.info(f"\nFetched {len(months_fetched)} months, ~{total_players} player-months of data")
 
-    # Enrich stats files with the fetched Statcast data
-    if months_fetched:
-        logger.info("\nEnriching stats files with Statcast data...")
-        for month in months_fetched:
-            enrich_stats_with_statcast(args.year, month)
+        # Enrich stats files with the fetched Statcast data
+        if months_fetched:
+            logger.info("\nEnriching stats files with Statcast data...")
+            for month in months_fetched:
+                with span('enrich_stats', month=month):
+                    enrich_stats_with_statcast(args.year, month, sidecar=args.statcast_sidecar)
 
-    logger.info("Complete!")
+        log_write_summary()
+        logger.info("Complete!")
 
 
 if __name__ == '__main__':
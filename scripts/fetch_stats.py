@@ -4,6 +4,9 @@ Fetch MiLB stats using the MLB Stats API.
 
 This script fetches stats ONLY for minor league play using leagueListId=milb_all.
 Stats include level information (A, A+, AA, AAA) for displaying splits by level.
+Stats are fetched for batches of players per request (/people?personIds=...
+hydrated with their hitting and pitching stats), falling back to one
+/people/{id}/stats request per player (group=hitting,pitching) for a failed batch.
 
 Data is stored in monthly files to avoid GitHub's file size limits:
   data/stats/{year}/{month}.json  - Player data for that month
@@ -16,15 +19,23 @@ by loading and aggregating the relevant monthly files.
 import argparse
 import json
 import logging
+import os
 import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlencode
 
 import requests
 
+from data_writer import log_write_summary, write_json
+from instrumentation import (add_run_arguments, count, endpoint_class, error_status, record_failure,
+                             record_request, record_retry, run_report, span)
+from player_activity import get_activity_summary, update_activity_summary
+from rate_limiter import CircuitOpenError, get_limiter, is_retryable, retry_after_seconds
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,12 +47,15 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent / 'data'
 STATS_DIR = DATA_DIR / 'stats'
 META_FILE = DATA_DIR / 'meta.json'
+INDEX_FILE = DATA_DIR / 'player-index.json'
+# Statcast blocks of a monthly stats file written separately: stats/{year}/{month}.statcast.json
+STATCAST_SIDECAR_SUFFIX = '.statcast.json'
 
 # API
-MLB_API_BASE = 'https://statsapi.mlb.com/api/v1'
+# Overridable to point at a stand-in server (see mock_statsapi.py)
+MLB_API_BASE = os.environ.get('MLB_API_BASE', 'https://statsapi.mlb.com/api/v1')
 REQUEST_TIMEOUT = 60
 MAX_RETRIES = 3
-RETRY_DELAY = 2
 
 # MiLB levels and their sport IDs
 MILB_SPORT_IDS = {
@@ -61,6 +75,16 @@ LEVEL_ORDER = ['AAA', 'AA', 'A+', 'A', 'CPX', 'MiLB']
 # Season months (April = 4 through September = 9)
 SEASON_MONTHS = [4, 5, 6, 7, 8, 9]
 
+# Stat groups requested together in one /people/{id}/stats call
+STAT_GROUPS = ['hitting', 'pitching']
+
+# Roster positions of players who both hit and pitch
+TWO_WAY_POSITIONS = {'TWP'}
+
+# Batched /people requests: players per request, capped by the request URL length
+PEOPLE_BATCH_SIZE = 50
+MAX_URL_LENGTH = 4000
+
 
 class APIClient:
     """Simple MLB Stats API client with retry logic."""
@@ -71,20 +95,46 @@ class APIClient:
             'Accept': 'application/json',
             'User-Agent': 'MiLB-Tracker/1.0'
         })
+        self.limiter = get_limiter('statsapi')
 
     def get(self, endpoint: str, params: dict = None) -> Optional[dict]:
-        """GET request with retries."""
+        """GET request paced by the shared Stats API limiter, retried on 429/5xx and transport errors."""
         url = f"{MLB_API_BASE}{endpoint}"
+        kind = endpoint_class(endpoint)
 
         for attempt in range(MAX_RETRIES):
+            try:
+                self.limiter.acquire()
+            except CircuitOpenError as e:
+                logger.debug(f"Request skipped: {e}")
+                break
+            started = time.perf_counter()
+            retry_after = None
             try:
                 resp = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                latency = time.perf_counter() - started
+                retry_after = retry_after_seconds(resp.headers.get('Retry-After'))
                 resp.raise_for_status()
-                return resp.json()
+                decode_started = time.perf_counter()
+                data = resp.json()
+                self.limiter.release(resp.status_code)
+                record_request(kind, resp.status_code, latency, len(resp.content),
+                               time.perf_counter() - decode_started)
+                return data
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+                status = error_status(e)
+                self.limiter.release(status, retry_after)
+                response = getattr(e, 'response', None)
+                record_request(kind, status, time.perf_counter() - started,
+                               len(response.content) if response is not None else 0)
+                if not is_retryable(status):
+                    break
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
+                    delay = self.limiter.backoff(attempt, retry_after)
+                    record_retry(kind, delay)
+                    time.sleep(delay)
+        record_failure(kind)
         return None
 
 
@@ -99,16 +149,140 @@ def get_roster(client: APIClient, team_id: int, season: int) -> Optional[dict]:
     return client.get(f'/teams/{team_id}/roster', params={'season': season})
 
 
-def get_player_milb_stats(client: APIClient, player_id: int, season: int, group: str) -> Optional[dict]:
-    """Fetch MiLB-only stats for a player using leagueListId=milb_all."""
-    return client.get(f'/people/{player_id}/stats', params={
+def get_teams_with_rosters(client: APIClient, sport_id: int, season: int) -> list[dict]:
+    """Get all teams for a sport/level with rosters hydrated in a single request."""
+    data = client.get('/teams', params={
+        'sportId': sport_id,
+        'season': season,
+        'hydrate': f'roster(season={season})',
+    })
+    return data.get('teams', []) if data else []
+
+
+def get_hydrated_roster(team: dict) -> Optional[list[dict]]:
+    """Extract roster entries from a roster-hydrated team, or None if not hydrated."""
+    roster = team.get('roster')
+    if isinstance(roster, dict):
+        roster = roster.get('roster')
+    return roster if isinstance(roster, list) else None
+
+
+def harvest_level_rosters(client: APIClient, sport_id: int, season: int) -> list[tuple[dict, list[dict]]]:
+    """
+    Get every team's roster for a sport/level using as few requests as possible.
+
+    Rosters are pulled in bulk via the roster-hydrated teams endpoint. Any team
+    that comes back without a hydrated roster (or the whole level, if the bulk
+    request fails) falls back to the per-team roster endpoint.
+
+    Returns:
+        List of (team, roster entries) tuples
+    """
+    teams = get_teams_with_rosters(client, sport_id, season)
+    if not teams:
+        teams = get_teams(client, sport_id, season)
+
+    rosters = []
+    fallback_count = 0
+
+    for team in teams:
+        team_id = team.get('id')
+        if not team_id:
+            continue
+
+        entries = get_hydrated_roster(team)
+        if entries is None:
+            fallback_count += 1
+            roster_data = get_roster(client, team_id, season)
+            entries = roster_data.get('roster', []) if roster_data else []
+
+        rosters.append((team, entries))
+
+    logger.info(f"  {len(rosters)} teams ({len(rosters) - fallback_count} bulk, {fallback_count} per-team)")
+    return rosters
+
+
+def get_player_milb_stats(client: APIClient, player_id: int, season: int, groups: list[str],
+                          date_range: Optional[tuple[str, str]] = None) -> Optional[dict]:
+    """
+    Fetch MiLB-only stats for a player using leagueListId=milb_all.
+
+    Several groups (e.g. STAT_GROUPS) come back in one response, each stat
+    block labelled with its group; see split_stat_groups().
+
+    With a date_range (startDate, endDate as YYYY-MM-DD) only the game logs
+    of those dates are requested, without the season totals.
+    """
+    params = {
         'stats': 'season,gameLog',
         'leagueListId': 'milb_all',
-        'group': group,
+        'group': ','.join(groups),
         'hydrate': 'team(league)',
         'season': season,
         'gameType': 'R',
-    })
+    }
+    if date_range:
+        params['stats'] = 'gameLog'
+        params['startDate'], params['endDate'] = date_range
+    return client.get(f'/people/{player_id}/stats', params=params)
+
+
+def split_stat_groups(data: dict, groups: list[str]) -> dict[str, dict]:
+    """Split a multi-group stats response into one response per group."""
+    if len(groups) == 1:
+        return {groups[0]: data}
+    by_group = {group: {'stats': []} for group in groups}
+    for stat_group in data.get('stats', []):
+        group = stat_group.get('group', {}).get('displayName')
+        if group in by_group:
+            by_group[group]['stats'].append(stat_group)
+    return by_group
+
+
+def stat_groups_for(player: Optional[dict]) -> list[str]:
+    """
+    Stat groups worth requesting separately for a player-index entry.
+
+    Two-way players and players missing from the index get both groups;
+    otherwise pitchers only get pitching and everyone else only hitting.
+    """
+    if not player or player.get('position') in TWO_WAY_POSITIONS:
+        return STAT_GROUPS
+    return ['pitching'] if player.get('type') == 'pitcher' else ['hitting']
+
+
+def load_player_index() -> dict[int, dict]:
+    """Player-index entries by MLB ID (empty if the index has not been built)."""
+    if not INDEX_FILE.exists():
+        return {}
+    try:
+        with open(INDEX_FILE) as f:
+            players = json.load(f).get('players', [])
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to read {INDEX_FILE}: {e}")
+        return {}
+    return {int(p['mlbId']): p for p in players if str(p.get('mlbId', '')).isdigit()}
+
+
+def fetch_stat_groups(client: APIClient, player_id: int, season: int, player: Optional[dict] = None,
+                      date_range: Optional[tuple[str, str]] = None) -> dict[str, Optional[dict]]:
+    """
+    Fetch a player's hitting and pitching stats, in a single request when possible.
+
+    If the combined request fails, falls back to one request per group,
+    skipping the group the player's index entry rules out (stat_groups_for).
+    date_range limits the request to game logs of those dates (see get_player_milb_stats).
+
+    Returns:
+        Dict mapping group ('hitting', 'pitching') -> stats response or None
+    """
+    data = get_player_milb_stats(client, player_id, season, STAT_GROUPS, date_range)
+    if data is not None:
+        return split_stat_groups(data, STAT_GROUPS)
+
+    count('stat_group_fallbacks')
+    return {group: get_player_milb_stats(client, player_id, season, [group], date_range)
+            for group in stat_groups_for(player)}
 
 
 def safe_float(val) -> Optional[float]:
@@ -548,12 +722,101 @@ def filter_player_stats_by_month(player_stats: dict, year: int, month: int) -> O
     return None
 
 
-def fetch_player_stats(client: APIClient, player_id: int, season: int) -> Optional[dict]:
-    """Fetch MiLB stats for a single player."""
-    hitting_data = get_player_milb_stats(client, player_id, season, 'hitting')
-    pitching_data = get_player_milb_stats(client, player_id, season, 'pitching')
+def people_stats_hydrate(season: int, date_range: Optional[tuple[str, str]] = None) -> str:
+    """hydrate value of a /people request returning the same stats as get_player_milb_stats."""
+    # team(league) as in the per-player request, so get_level_from_split can fall
+    # back to the league when a split has no sport
+    if date_range:
+        return (f"stats(group=[{','.join(STAT_GROUPS)}],type=[gameLog],startDate={date_range[0]},"
+                f"endDate={date_range[1]},season={season},leagueListId=milb_all,gameType=R,"
+                f"hydrate=team(league))")
+    return (f"stats(group=[{','.join(STAT_GROUPS)}],type=[season,gameLog],season={season},"
+            f"leagueListId=milb_all,gameType=R,hydrate=team(league))")
+
+
+def get_people_milb_stats(client: APIClient, player_ids: list[int], season: int,
+                          date_range: Optional[tuple[str, str]] = None) -> Optional[dict]:
+    """Fetch MiLB-only stats of several players in one /people request."""
+    return client.get('/people', params={
+        'personIds': ','.join(str(player_id) for player_id in player_ids),
+        'hydrate': people_stats_hydrate(season, date_range),
+    })
+
 
-    return extract_player_stats_full(str(player_id), hitting_data, pitching_data, season)
+def batch_player_ids(player_ids: list[int], season: int, batch_size: int = PEOPLE_BATCH_SIZE,
+                     max_url_length: int = MAX_URL_LENGTH,
+                     date_range: Optional[tuple[str, str]] = None) -> list[list[int]]:
+    """Split player IDs into /people batches of at most batch_size players and max_url_length URL characters."""
+    hydrate = people_stats_hydrate(season, date_range)
+    base_length = len(f"{MLB_API_BASE}/people?" + urlencode({'personIds': '', 'hydrate': hydrate}))
+    batches = []
+    batch, length = [], base_length
+    for player_id in player_ids:
+        # Each ID adds its digits plus an encoded comma (%2C)
+        id_length = len(str(player_id)) + 3
+        if batch and (len(batch) >= batch_size or length + id_length > max_url_length):
+            batches.append(batch)
+            batch, length = [], base_length
+        batch.append(player_id)
+        length += id_length
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def fetch_stat_groups_batch(client: APIClient, player_ids: list[int], season: int,
+                            index: Optional[dict[int, dict]] = None,
+                            date_range: Optional[tuple[str, str]] = None) -> dict[int, dict[str, Optional[dict]]]:
+    """
+    Fetch the hitting and pitching stats of a batch of players in one request.
+
+    Players the batch response does not cover - all of them if the request
+    failed - are fetched one at a time with fetch_stat_groups.
+
+    Args:
+        client: API client
+        player_ids: Players of the batch (see batch_player_ids)
+        season: Season year
+        index: Player-index entries by ID, for the per-player fallback
+        date_range: (startDate, endDate) to fetch only those dates' game logs
+
+    Returns:
+        Dict mapping player ID -> {group: stats response or None}
+    """
+    index = index or {}
+    data = get_people_milb_stats(client, player_ids, season, date_range)
+
+    results = {}
+    if data is not None:
+        for person in data.get('people', []):
+            if person.get('id') in player_ids:
+                results[person['id']] = split_stat_groups({'stats': person.get('stats', [])}, STAT_GROUPS)
+
+    missing = [player_id for player_id in player_ids if player_id not in results]
+    if missing:
+        count('batch_fallback_players', len(missing))
+        if data is None:
+            logger.debug(f"Batch of {len(player_ids)} players failed, fetching one at a time")
+        for player_id in missing:
+            results[player_id] = fetch_stat_groups(client, player_id, season, index.get(player_id), date_range)
+    return results
+
+
+def fetch_player_stats_batch(client: APIClient, player_ids: list[int], season: int,
+                             index: Optional[dict[int, dict]] = None) -> dict[str, dict]:
+    """Fetch MiLB stats for a batch of players. Returns stats by player ID (players with stats only)."""
+    all_stats = {}
+    for player_id, groups in fetch_stat_groups_batch(client, player_ids, season, index).items():
+        stats = extract_player_stats_full(str(player_id), groups.get('hitting'), groups.get('pitching'), season)
+        if stats:
+            all_stats[stats['playerId']] = stats
+    return all_stats
+
+
+def fetch_player_stats(client: APIClient, player_id: int, season: int, player: Optional[dict] = None) -> Optional[dict]:
+    """Fetch MiLB stats for a single player (player: its player-index entry, if known)."""
+    groups = fetch_stat_groups(client, player_id, season, player)
+    return extract_player_stats_full(str(player_id), groups.get('hitting'), groups.get('pitching'), season)
 
 
 def fetch_all_players(season: int) -> set[int]:
@@ -563,65 +826,57 @@ def fetch_all_players(season: int) -> set[int]:
 
     for level, sport_id in MILB_SPORT_IDS.items():
         logger.info(f"Getting {level} rosters (sportId={sport_id})...")
-        teams = get_teams(client, sport_id, season)
-        logger.info(f"  {len(teams)} teams")
-
-        for team in teams:
-            team_id = team.get('id')
-            if not team_id:
-                continue
-
-            roster_data = get_roster(client, team_id, season)
-            if not roster_data:
-                continue
-
-            for player in roster_data.get('roster', []):
-                person = player.get('person', {})
-                player_id = person.get('id')
-                if player_id:
-                    player_ids.add(player_id)
 
-            time.sleep(0.1)
+        with span('rosters', level=level):
+            for _, roster in harvest_level_rosters(client, sport_id, season):
+                for player in roster:
+                    person = player.get('person', {})
+                    player_id = person.get('id')
+                    if player_id:
+                        player_ids.add(player_id)
 
     logger.info(f"Found {len(player_ids)} unique players")
+    count('players', len(player_ids))
     return player_ids
 
 
 def fetch_all_stats(season: int, max_workers: int = 10) -> dict:
     """Fetch MiLB-only stats for all players."""
     player_ids = fetch_all_players(season)
+    index = load_player_index()
 
     all_stats = {}
     failed = 0
 
     logger.info(f"Fetching stats for {len(player_ids)} players...")
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_player = {}
-        for player_id in player_ids:
+    batches = batch_player_ids(sorted(player_ids), season)
+    logger.info(f"  {len(batches)} batched requests")
+
+    with span('player_stats', players=len(player_ids), batches=len(batches)), \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_batch = {}
+        for batch in batches:
             client = APIClient()
-            future = executor.submit(fetch_player_stats, client, player_id, season)
-            future_to_player[future] = player_id
+            future = executor.submit(fetch_player_stats_batch, client, batch, season, index)
+            future_to_batch[future] = batch
 
         done = 0
-        for future in as_completed(future_to_player):
-            player_id = future_to_player[future]
-            done += 1
+        for future in as_completed(future_to_batch):
+            batch = future_to_batch[future]
+            done += len(batch)
 
-            if done % 100 == 0:
+            if done // 100 > (done - len(batch)) // 100:
                 logger.info(f"  Progress: {done}/{len(player_ids)} players...")
 
             try:
-                stats = future.result()
-                if stats:
-                    all_stats[stats['playerId']] = stats
+                all_stats.update(future.result())
             except Exception as e:
-                logger.warning(f"Failed to fetch player {player_id}: {e}")
-                failed += 1
-
-            time.sleep(0.05)
+                logger.warning(f"Failed to fetch batch of {len(batch)} players starting at {batch[0]}: {e}")
+                failed += len(batch)
 
     logger.info(f"Done: {len(all_stats)} players with stats, {failed} failed")
+    count('players_failed', failed)
     return all_stats
 
 
@@ -648,13 +903,19 @@ def save_monthly_stats(all_stats: dict, season: int, month: int) -> int:
     }
 
     month_file = year_dir / f'{month:02d}.json'
-    with open(month_file, 'w') as f:
-        json.dump(output, f, separators=(',', ':'))
-
-    logger.info(f"  Saved {len(month_players)} players to {month_file}")
+    if write_json(month_file, output):
+        logger.info(f"  Saved {len(month_players)} players to {month_file}")
+    else:
+        logger.info(f"  No changes for {len(month_players)} players in {month_file}")
+    update_activity_summary(month_players, season, month)
     return len(month_players)
 
 
+def list_statcast_sidecar_months(year_dir: Path) -> list[int]:
+    """Months in a stats year directory with a Statcast sidecar (fetch_statcast.py --statcast-sidecar)."""
+    return sorted(int(f.name[:2]) for f in year_dir.glob(f'[0-9][0-9]{STATCAST_SIDECAR_SUFFIX}'))
+
+
 def update_manifest(season: int, months: list[int]) -> None:
     """Update the year's manifest file."""
     year_dir = STATS_DIR / str(season)
@@ -668,20 +929,24 @@ def update_manifest(season: int, months: list[int]) -> None:
         'months': sorted(months),
     }
 
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    sidecar_months = list_statcast_sidecar_months(year_dir)
+    if sidecar_months:
+        manifest['statcastMonths'] = sidecar_months
+
+    if write_json(manifest_file, manifest, indent=2):
+        logger.info(f"Updated manifest: {manifest_file}")
 
-    logger.info(f"Updated manifest: {manifest_file}")
 
+def update_meta() -> None:
+    """Update meta.json with player counts from the activity summary."""
+    summary = get_activity_summary()
 
-def update_meta(player_count: int) -> None:
-    """Update meta.json."""
-    META_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(META_FILE, 'w') as f:
-        json.dump({
-            'lastUpdated': datetime.now().isoformat(),
-            'playerCount': player_count,
-        }, f)
+    # lastUpdated alone doesn't count as a change, so unchanged counts leave meta.json untouched
+    write_json(META_FILE, {
+        'lastUpdated': datetime.now().isoformat(),
+        'playerCount': len(summary.get('players', {})),
+        'monthPlayerCounts': summary.get('monthPlayerCounts', {}),
+    })
 
 
 def main():
@@ -694,74 +959,78 @@ def main():
     parser.add_argument('--include-last-season', action='store_true')
     parser.add_argument('--workers', type=int, default=10, help='Number of parallel workers')
     parser.add_argument('--debug', action='store_true')
+    add_run_arguments(parser)
     args = parser.parse_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Determine which months to save
-    if args.month:
-        months_to_save = [args.month]
-    elif args.all_months:
-        months_to_save = SEASON_MONTHS
-    else:
-        # Default to current month
-        current_month = datetime.now().month
-        if current_month in SEASON_MONTHS:
-            months_to_save = [current_month]
-        else:
-            logger.info(f"Month {current_month} is outside season (April-September)")
-            months_to_save = []
-
-    # Fetch current season
-    logger.info(f"Fetching {args.season} MiLB stats...")
-    all_stats = fetch_all_stats(args.season, args.workers)
-
-    if all_stats:
-        total_players = 0
-        months_saved = []
-
-        for month in months_to_save:
-            month_name = datetime(args.season, month, 1).strftime('%B')
-            logger.info(f"Saving {month_name} {args.season}...")
-            count = save_monthly_stats(all_stats, args.season, month)
-            if count > 0:
-                months_saved.append(month)
-                total_players = max(total_players, count)
-
-        # Check for existing months in directory
-        year_dir = STATS_DIR / str(args.season)
-        if year_dir.exists():
-            existing_months = [
-                int(f.stem) for f in year_dir.glob('*.json')
-                if f.stem.isdigit()
-            ]
-            all_months = sorted(set(existing_months + months_saved))
+    with run_report('fetch_stats', args):
+        # Determine which months to save
+        if args.month:
+            months_to_save = [args.month]
+        elif args.all_months:
+            months_to_save = SEASON_MONTHS
         else:
-            all_months = months_saved
-
-        if all_months:
-            update_manifest(args.season, all_months)
-            update_meta(len(all_stats))
-
-    # Previous season (optional)
-    if args.include_last_season:
-        last_year = args.season - 1
-        logger.info(f"Fetching {last_year} MiLB stats...")
-        last_stats = fetch_all_stats(last_year, args.workers)
-        if last_stats:
-            for month in SEASON_MONTHS:
-                save_monthly_stats(last_stats, last_year, month)
-
-            year_dir = STATS_DIR / str(last_year)
+            # Default to current month
+            current_month = datetime.now().month
+            if current_month in SEASON_MONTHS:
+                months_to_save = [current_month]
+            else:
+                logger.info(f"Month {current_month} is outside season (April-September)")
+                months_to_save = []
+
+        # Fetch current season
+        logger.info(f"Fetching {args.season} MiLB stats...")
+        all_stats = fetch_all_stats(args.season, args.workers)
+
+        if all_stats:
+            total_players = 0
+            months_saved = []
+
+            for month in months_to_save:
+                month_name = datetime(args.season, month, 1).strftime('%B')
+                logger.info(f"Saving {month_name} {args.season}...")
+                with span('save_month', month=month):
+                    saved = save_monthly_stats(all_stats, args.season, month)
+                if saved > 0:
+                    months_saved.append(month)
+                    total_players = max(total_players, saved)
+
+            # Check for existing months in directory
+            year_dir = STATS_DIR / str(args.season)
             if year_dir.exists():
                 existing_months = [
                     int(f.stem) for f in year_dir.glob('*.json')
                     if f.stem.isdigit()
                 ]
-                update_manifest(last_year, existing_months)
-
-    logger.info("Complete!")
+                all_months = sorted(set(existing_months + months_saved))
+            else:
+                all_months = months_saved
+
+            if all_months:
+                update_manifest(args.season, all_months)
+                update_meta()
+
+        # Previous season (optional)
+        if args.include_last_season:
+            last_year = args.season - 1
+            logger.info(f"Fetching {last_year} MiLB stats...")
+            last_stats = fetch_all_stats(last_year, args.workers)
+            if last_stats:
+                for month in SEASON_MONTHS:
+                    save_monthly_stats(last_stats, last_year, month)
+
+                year_dir = STATS_DIR / str(last_year)
+                if year_dir.exists():
+                    existing_months = [
+                        int(f.stem) for f in year_dir.glob('*.json')
+                        if f.stem.isdigit()
+                    ]
+                    update_manifest(last_year, existing_months)
+
+        log_write_summary()
+        logger.info("Complete!")
 
 
 if __name__ == '__main__':
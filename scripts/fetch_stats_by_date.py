@@ -22,11 +22,15 @@ Usage:
 
   # Fetch a full year (all season months April-September)
   python fetch_stats_by_date.py --year 2025
+
+  # Request only the month-to-date game logs and merge them into the month file
+  python fetch_stats_by_date.py --yesterday --log-range month
 """
 
 import argparse
 import json
 import logging
+import os
 import time
 from calendar import monthrange
 from collections import defaultdict
@@ -37,6 +41,14 @@ from typing import Optional
 
 import requests
 
+from data_writer import log_write_summary, write_json
+from fetch_stats import (batch_player_ids, fetch_stat_groups, fetch_stat_groups_batch, list_statcast_sidecar_months,
+                         load_player_index)
+from instrumentation import (add_run_arguments, count, endpoint_class, error_status, record_failure,
+                             record_request, record_retry, run_report, span)
+from player_activity import get_activity_summary, update_activity_summary
+from rate_limiter import CircuitOpenError, get_limiter, is_retryable, retry_after_seconds
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -50,10 +62,10 @@ STATS_DIR = DATA_DIR / 'stats'
 META_FILE = DATA_DIR / 'meta.json'
 
 # API
-MLB_API_BASE = 'https://statsapi.mlb.com/api/v1'
+# Overridable to point at a stand-in server (see mock_statsapi.py)
+MLB_API_BASE = os.environ.get('MLB_API_BASE', 'https://statsapi.mlb.com/api/v1')
 REQUEST_TIMEOUT = 60
 MAX_RETRIES = 3
-RETRY_DELAY = 2
 
 # MiLB levels and their sport IDs
 MILB_SPORT_IDS = {
@@ -70,6 +82,12 @@ SPORT_ID_TO_LEVEL = {v: k for k, v in MILB_SPORT_IDS.items()}
 # Season months (April = 4 through September = 9)
 SEASON_MONTHS = [4, 5, 6, 7, 8, 9]
 
+# Game logs requested per player for a date (see log_date_range):
+#   season - the whole season's game logs
+#   month  - the month's game logs up to the date
+#   day    - the date's game logs only
+LOG_RANGES = ['season', 'month', 'day']
+
 
 class APIClient:
     """Simple MLB Stats API client with retry logic."""
@@ -80,20 +98,46 @@ class APIClient:
             'Accept': 'application/json',
             'User-Agent': 'MiLB-Tracker/1.0'
         })
+        self.limiter = get_limiter('statsapi')
 
     def get(self, endpoint: str, params: dict = None) -> Optional[dict]:
-        """GET request with retries."""
+        """GET request paced by the shared Stats API limiter, retried on 429/5xx and transport errors."""
         url = f"{MLB_API_BASE}{endpoint}"
+        kind = endpoint_class(endpoint)
 
         for attempt in range(MAX_RETRIES):
+            try:
+                self.limiter.acquire()
+            except CircuitOpenError as e:
+                logger.debug(f"Request skipped: {e}")
+                break
+            started = time.perf_counter()
+            retry_after = None
             try:
                 resp = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+                latency = time.perf_counter() - started
+                retry_after = retry_after_seconds(resp.headers.get('Retry-After'))
                 resp.raise_for_status()
-                return resp.json()
+                decode_started = time.perf_counter()
+                data = resp.json()
+                self.limiter.release(resp.status_code)
+                record_request(kind, resp.status_code, latency, len(resp.content),
+                               time.perf_counter() - decode_started)
+                return data
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+                status = error_status(e)
+                self.limiter.release(status, retry_after)
+                response = getattr(e, 'response', None)
+                record_request(kind, status, time.perf_counter() - started,
+                               len(response.content) if response is not None else 0)
+                if not is_retryable(status):
+                    break
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))
+                    delay = self.limiter.backoff(attempt, retry_after)
+                    record_retry(kind, delay)
+                    time.sleep(delay)
+        record_failure(kind)
         return None
 
 
@@ -146,23 +190,9 @@ def get_players_from_games(client: APIClient, games: list[dict]) -> set[int]:
                 if player_id:
                     player_ids.add(player_id)
 
-        time.sleep(0.1)  # Rate limiting
-
     return player_ids
 
 
-def get_player_milb_stats(client: APIClient, player_id: int, season: int, group: str) -> Optional[dict]:
-    """Fetch MiLB-only stats for a player using leagueListId=milb_all."""
-    return client.get(f'/people/{player_id}/stats', params={
-        'stats': 'season,gameLog',
-        'leagueListId': 'milb_all',
-        'group': group,
-        'hydrate': 'team(league)',
-        'season': season,
-        'gameType': 'R',
-    })
-
-
 def safe_float(val) -> Optional[float]:
     """Convert string to float, returning None for placeholder values."""
     if val is None:
@@ -478,10 +508,10 @@ def aggregate_game_logs_by_level(game_logs: list[dict], stat_type: str) -> dict:
     return {level: aggregator(stats) for level, stats in by_level.items() if stats}
 
 
-def fetch_player_stats(client: APIClient, player_id: int, season: int) -> Optional[dict]:
-    """Fetch MiLB stats for a single player and format for storage."""
-    hitting_data = get_player_milb_stats(client, player_id, season, 'hitting')
-    pitching_data = get_player_milb_stats(client, player_id, season, 'pitching')
+def format_player_stats(player_id: int, season: int, groups: dict[str, Optional[dict]]) -> Optional[dict]:
+    """Format a player's hitting and pitching stats responses for storage."""
+    hitting_data = groups.get('hitting')
+    pitching_data = groups.get('pitching')
 
     result = {
         'playerId': str(player_id),
@@ -508,28 +538,76 @@ def fetch_player_stats(client: APIClient, player_id: int, season: int) -> Option
                 for split in splits:
                     pitching_game_logs.append(format_game_log(split, 'pitching'))
 
-    has_batting = len(batting_game_logs) > 0
-    has_pitching = len(pitching_game_logs) > 0
-
-    if not has_batting and not has_pitching:
+    if not batting_game_logs and not pitching_game_logs:
         return None
 
-    if has_batting and has_pitching:
-        result['type'] = 'pitcher' if len(pitching_game_logs) > len(batting_game_logs) else 'batter'
-    elif has_batting:
-        result['type'] = 'batter'
-    else:
-        result['type'] = 'pitcher'
+    result['type'] = player_type(batting_game_logs, pitching_game_logs)
 
-    if has_batting:
+    if batting_game_logs:
         result['battingGameLog'] = sorted(batting_game_logs, key=lambda x: x.get('date', ''))
 
-    if has_pitching:
+    if pitching_game_logs:
         result['pitchingGameLog'] = sorted(pitching_game_logs, key=lambda x: x.get('date', ''))
 
     return result
 
 
+def player_type(batting_game_logs: list[dict], pitching_game_logs: list[dict]) -> str:
+    """'pitcher' or 'batter', by which kind of game log the player has more of."""
+    return 'pitcher' if len(pitching_game_logs) > len(batting_game_logs) else 'batter'
+
+
+def log_date_range(date_str: str, log_range: str) -> Optional[tuple[str, str]]:
+    """(startDate, endDate) of the game logs to request for a date, or None for the whole season."""
+    if log_range == 'month':
+        return date_str[:8] + '01', date_str
+    if log_range == 'day':
+        return date_str, date_str
+    return None
+
+
+def fetch_player_stats(client: APIClient, player_id: int, season: int, player: Optional[dict] = None,
+                       date_range: Optional[tuple[str, str]] = None) -> Optional[dict]:
+    """Fetch MiLB stats for a single player and format for storage (player: its player-index entry, if known)."""
+    return format_player_stats(player_id, season, fetch_stat_groups(client, player_id, season, player, date_range))
+
+
+def fetch_player_stats_batch(client: APIClient, player_ids: list[int], season: int,
+                             index: Optional[dict[int, dict]] = None,
+                             date_range: Optional[tuple[str, str]] = None) -> dict[str, dict]:
+    """Fetch MiLB stats for a batch of players in one request. Returns stats by player ID (players with stats only)."""
+    all_stats = {}
+    for player_id, groups in fetch_stat_groups_batch(client, player_ids, season, index, date_range).items():
+        stats = format_player_stats(player_id, season, groups)
+        if stats:
+            all_stats[stats['playerId']] = stats
+    return all_stats
+
+
+def merge_game_logs(existing_logs: list[dict], new_logs: list[dict]) -> list[dict]:
+    """Combine two game logs, deduped by date+gameId (new entries win), sorted by date."""
+    merged = {(log.get('date'), log.get('gameId')): log for log in existing_logs}
+    merged.update({(log.get('date'), log.get('gameId')): log for log in new_logs})
+    return sorted(merged.values(), key=lambda x: x.get('date', ''))
+
+
+def merge_player_logs(existing: dict, new: dict) -> dict:
+    """
+    Merge a player's newly fetched game logs into an existing entry.
+
+    Either may be a month-file entry or a format_player_stats() result; the
+    type is re-derived from the merged logs. The result is meant for
+    build_player_month_stats(), which re-aggregates the totals from the logs.
+    """
+    merged = {'playerId': new['playerId']}
+    for key in ('battingGameLog', 'pitchingGameLog'):
+        logs = merge_game_logs(existing.get(key, []), new.get(key, []))
+        if logs:
+            merged[key] = logs
+    merged['type'] = player_type(merged.get('battingGameLog', []), merged.get('pitchingGameLog', []))
+    return merged
+
+
 def filter_logs_for_month(game_logs: list[dict], year: int, month: int) -> list[dict]:
     """Filter game logs to only include games from a specific month."""
     month_prefix = f"{year}-{month:02d}"
@@ -591,10 +669,11 @@ def save_monthly_file(data: dict, year: int, month: int) -> None:
     data['updated'] = datetime.now().isoformat()
 
     month_file = year_dir / f'{month:02d}.json'
-    with open(month_file, 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
-
-    logger.info(f"Saved {len(data.get('players', {}))} players to {month_file}")
+    if write_json(month_file, data):
+        logger.info(f"Saved {len(data.get('players', {}))} players to {month_file}")
+    else:
+        logger.info(f"No changes for {len(data.get('players', {}))} players in {month_file}")
+    update_activity_summary(data.get('players', {}), year, month)
 
 
 def update_manifest(year: int) -> None:
@@ -614,49 +693,57 @@ def update_manifest(year: int) -> None:
         'months': sorted(existing_months),
     }
 
-    manifest_file = year_dir / 'manifest.json'
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    sidecar_months = list_statcast_sidecar_months(year_dir)
+    if sidecar_months:
+        manifest['statcastMonths'] = sidecar_months
 
-    logger.info(f"Updated manifest: {manifest_file}")
+    manifest_file = year_dir / 'manifest.json'
+    if write_json(manifest_file, manifest, indent=2):
+        logger.info(f"Updated manifest: {manifest_file}")
 
 
 def update_meta() -> None:
-    """Update meta.json with current timestamp."""
-    # Count total unique players across all files
-    total_players = set()
-    for year_dir in STATS_DIR.iterdir():
-        if year_dir.is_dir() and year_dir.name.isdigit():
-            for month_file in year_dir.glob('[0-9][0-9].json'):
-                try:
-                    with open(month_file) as f:
-                        data = json.load(f)
-                        total_players.update(data.get('players', {}).keys())
-                except (json.JSONDecodeError, IOError):
-                    pass
-
-    META_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(META_FILE, 'w') as f:
-        json.dump({
-            'lastUpdated': datetime.now().isoformat(),
-            'playerCount': len(total_players),
-        }, f)
-
-
-def fetch_and_update_for_date(date_str: str, max_workers: int = 100) -> dict:
-    """Fetch stats for all players who played on a specific date."""
+    """Update meta.json with current timestamp and player counts."""
+    # Counts come from the activity summary, which save_monthly_file has just
+    # updated for the month written - no other monthly files are read
+    summary = get_activity_summary()
+
+    # lastUpdated alone doesn't count as a change, so unchanged counts leave meta.json untouched
+    write_json(META_FILE, {
+        'lastUpdated': datetime.now().isoformat(),
+        'playerCount': len(summary.get('players', {})),
+        'monthPlayerCounts': summary.get('monthPlayerCounts', {}),
+    })
+
+
+def fetch_and_update_for_date(date_str: str, max_workers: int = 100, log_range: str = 'season') -> dict:
+    """
+    Fetch stats for all players who played on a specific date.
+
+    Args:
+        date_str: Date (YYYY-MM-DD)
+        max_workers: Parallel batch requests
+        log_range: Game logs requested per player, one of LOG_RANGES
+
+    Returns:
+        Formatted stats (format_player_stats) by player ID
+    """
     client = APIClient()
 
     logger.info(f"Fetching games for {date_str}...")
-    games = get_games_for_date(client, date_str)
+    with span('schedule', date=date_str):
+        games = get_games_for_date(client, date_str)
     logger.info(f"Found {len(games)} completed games")
+    count('games', len(games))
 
     if not games:
         return {}
 
     logger.info("Extracting player IDs from boxscores...")
-    player_ids = get_players_from_games(client, games)
+    with span('boxscores', date=date_str, games=len(games)):
+        player_ids = get_players_from_games(client, games)
     logger.info(f"Found {len(player_ids)} unique players")
+    count('players', len(player_ids))
 
     if not player_ids:
         return {}
@@ -666,73 +753,86 @@ def fetch_and_update_for_date(date_str: str, max_workers: int = 100) -> dict:
     year = date_obj.year
 
     # Fetch stats for all players
+    index = load_player_index()
+    date_range = log_date_range(date_str, log_range)
     all_stats = {}
     failed = 0
 
-    logger.info(f"Fetching stats for {len(player_ids)} players...")
+    if date_range:
+        logger.info(f"Fetching {date_range[0]} to {date_range[1]} game logs for {len(player_ids)} players in batches...")
+    else:
+        logger.info(f"Fetching stats for {len(player_ids)} players in batches...")
+
+    batches = batch_player_ids(sorted(player_ids), year, date_range=date_range)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_player = {}
-        for player_id in player_ids:
+    with span('player_stats', players=len(player_ids), batches=len(batches)), \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_batch = {}
+        for batch in batches:
             api_client = APIClient()
-            future = executor.submit(fetch_player_stats, api_client, player_id, year)
-            future_to_player[future] = player_id
+            future = executor.submit(fetch_player_stats_batch, api_client, batch, year, index, date_range)
+            future_to_batch[future] = batch
 
         done = 0
-        for future in as_completed(future_to_player):
-            player_id = future_to_player[future]
-            done += 1
+        for future in as_completed(future_to_batch):
+            batch = future_to_batch[future]
+            done += len(batch)
 
-            if done % 50 == 0:
+            if done // 50 > (done - len(batch)) // 50:
                 logger.info(f"  Progress: {done}/{len(player_ids)} players...")
 
             try:
-                stats = future.result()
-                if stats:
-                    all_stats[stats['playerId']] = stats
+                all_stats.update(future.result())
             except Exception as e:
-                logger.warning(f"Failed to fetch player {player_id}: {e}")
-                failed += 1
-
-            time.sleep(0.05)
+                logger.warning(f"Failed to fetch batch of {len(batch)} players starting at {batch[0]}: {e}")
+                failed += len(batch)
 
     logger.info(f"Fetched stats for {len(all_stats)} players ({failed} failed)")
     return all_stats
 
 
-def update_monthly_stats(all_stats: dict, year: int, month: int) -> int:
-    """Update monthly file with new player stats. Returns count of players updated."""
+def update_monthly_stats(all_stats: dict, year: int, month: int, merge: bool = False) -> int:
+    """
+    Update monthly file with new player stats. Returns count of players updated.
+
+    By default a player's entry is rebuilt from the fetched game logs alone.
+    With merge (for fetches limited to a date range), the fetched logs are
+    merged into the entry's existing logs and the totals re-aggregated.
+    """
     monthly_data = load_monthly_file(year, month)
     players = monthly_data.get('players', {})
 
     updated_count = 0
     for player_id, player_stats in all_stats.items():
+        if merge and player_id in players:
+            player_stats = merge_player_logs(players[player_id], player_stats)
         month_stats = build_player_month_stats(player_stats, year, month)
         if month_stats:
             players[player_id] = month_stats
             updated_count += 1
 
     monthly_data['players'] = players
-    save_monthly_file(monthly_data, year, month)
+    with span('save_month', month=f'{year}-{month:02d}'):
+        save_monthly_file(monthly_data, year, month)
 
     return updated_count
 
 
-def fetch_date(date_str: str, max_workers: int = 100) -> None:
+def fetch_date(date_str: str, max_workers: int = 100, log_range: str = 'season') -> None:
     """Fetch and save stats for a specific date."""
     date_obj = datetime.strptime(date_str, '%Y-%m-%d')
     year = date_obj.year
     month = date_obj.month
 
-    all_stats = fetch_and_update_for_date(date_str, max_workers)
+    all_stats = fetch_and_update_for_date(date_str, max_workers, log_range)
     if all_stats:
-        updated = update_monthly_stats(all_stats, year, month)
+        updated = update_monthly_stats(all_stats, year, month, merge=log_range != 'season')
         logger.info(f"Updated {updated} players for {date_str}")
         update_manifest(year)
         update_meta()
 
 
-def fetch_month(year: int, month: int, max_workers: int = 100) -> None:
+def fetch_month(year: int, month: int, max_workers: int = 100, log_range: str = 'season') -> None:
     """Fetch stats for an entire month."""
     logger.info(f"Fetching all games for {year}-{month:02d}...")
 
@@ -746,38 +846,12 @@ def fetch_month(year: int, month: int, max_workers: int = 100) -> None:
         date_str = f"{year}-{month:02d}-{day:02d}"
         logger.info(f"Processing {date_str}...")
 
-        day_stats = fetch_and_update_for_date(date_str, max_workers)
+        day_stats = fetch_and_update_for_date(date_str, max_workers, log_range)
 
-        # Merge player stats
+        # Merge player stats (game logs combined and deduped by date+gameId)
         for player_id, stats in day_stats.items():
             if player_id in all_player_stats:
-                # Merge game logs
-                existing = all_player_stats[player_id]
-                if 'battingGameLog' in stats:
-                    existing_logs = existing.get('battingGameLog', [])
-                    new_logs = stats['battingGameLog']
-                    # Combine and dedupe by date+gameId
-                    all_logs = existing_logs + new_logs
-                    seen = set()
-                    deduped = []
-                    for log in all_logs:
-                        key = (log.get('date'), log.get('gameId'))
-                        if key not in seen:
-                            seen.add(key)
-                            deduped.append(log)
-                    existing['battingGameLog'] = sorted(deduped, key=lambda x: x.get('date', ''))
-                if 'pitchingGameLog' in stats:
-                    existing_logs = existing.get('pitchingGameLog', [])
-                    new_logs = stats['pitchingGameLog']
-                    all_logs = existing_logs + new_logs
-                    seen = set()
-                    deduped = []
-                    for log in all_logs:
-                        key = (log.get('date'), log.get('gameId'))
-                        if key not in seen:
-                            seen.add(key)
-                            deduped.append(log)
-                    existing['pitchingGameLog'] = sorted(deduped, key=lambda x: x.get('date', ''))
+                all_player_stats[player_id] = merge_player_logs(all_player_stats[player_id], stats)
             else:
                 all_player_stats[player_id] = stats
 
@@ -789,7 +863,7 @@ def fetch_month(year: int, month: int, max_workers: int = 100) -> None:
         update_meta()
 
 
-def fetch_year(year: int, max_workers: int = 100) -> None:
+def fetch_year(year: int, max_workers: int = 100, log_range: str = 'season') -> None:
     """Fetch stats for all season months of a year."""
     logger.info(f"Fetching all season months for {year}...")
 
@@ -798,7 +872,7 @@ def fetch_year(year: int, max_workers: int = 100) -> None:
         logger.info(f"\n{'='*50}")
         logger.info(f"Processing {month_name} {year}...")
         logger.info(f"{'='*50}")
-        fetch_month(year, month, max_workers)
+        fetch_month(year, month, max_workers, log_range)
 
     logger.info(f"\nCompleted fetching all data for {year}")
 
@@ -813,6 +887,8 @@ Examples:
   %(prog)s --date 2025-06-15     Fetch specific date
   %(prog)s --month 2025-06       Fetch entire month
   %(prog)s --year 2025           Fetch full season (April-September)
+  %(prog)s --yesterday --log-range month
+                                 Fetch yesterday's games, requesting only month-to-date game logs
         """
     )
 
@@ -828,39 +904,46 @@ Examples:
 
     parser.add_argument('--workers', type=int, default=200,
                         help='Number of parallel workers (default: 200)')
+    parser.add_argument('--log-range', choices=LOG_RANGES, default='season',
+                        help="Game logs requested per player: the whole season, the month up to the date, "
+                             "or the date only; month and day merge into the month file's existing logs "
+                             "(default: season)")
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug logging')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    if args.yesterday:
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-        logger.info(f"Fetching yesterday's games ({yesterday})...")
-        fetch_date(yesterday, args.workers)
-
-    elif args.date:
-        # Validate date format
-        try:
-            datetime.strptime(args.date, '%Y-%m-%d')
-        except ValueError:
-            parser.error(f"Invalid date format: {args.date}. Use YYYY-MM-DD")
-        fetch_date(args.date, args.workers)
-
-    elif args.month:
-        # Parse month (YYYY-MM)
-        try:
-            date_obj = datetime.strptime(args.month + '-01', '%Y-%m-%d')
-            fetch_month(date_obj.year, date_obj.month, args.workers)
-        except ValueError:
-            parser.error(f"Invalid month format: {args.month}. Use YYYY-MM")
-
-    elif args.year:
-        fetch_year(args.year, args.workers)
-
-    logger.info("Complete!")
+    with run_report('fetch_stats_by_date', args):
+        if args.yesterday:
+            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+            logger.info(f"Fetching yesterday's games ({yesterday})...")
+            fetch_date(yesterday, args.workers, args.log_range)
+
+        elif args.date:
+            # Validate date format
+            try:
+                datetime.strptime(args.date, '%Y-%m-%d')
+            except ValueError:
+                parser.error(f"Invalid date format: {args.date}. Use YYYY-MM-DD")
+            fetch_date(args.date, args.workers, args.log_range)
+
+        elif args.month:
+            # Parse month (YYYY-MM)
+            try:
+                date_obj = datetime.strptime(args.month + '-01', '%Y-%m-%d')
+                fetch_month(date_obj.year, date_obj.month, args.workers, args.log_range)
+            except ValueError:
+                parser.error(f"Invalid month format: {args.month}. Use YYYY-MM")
+
+        elif args.year:
+            fetch_year(args.year, args.workers, args.log_range)
+
+        log_write_summary()
+        logger.info("Complete!")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic seasons of data for load testing the data pipeline.
+
+Writes a complete data directory - play-by-play day files, monthly stats files,
+Statcast files, manifests and a player index - for any number of seasons,
+games per day and players, so scripts can be run against more data than the
+checked-in archive holds:
+  {output}/data/pbp/{year}/{month}/{day}.json
+  {output}/data/stats/{year}/{month}.json
+  {output}/data/statcast/{year}/{month}.json
+  {output}/data/player-index.json
+  {output}/scripts/                         - Copy of scripts/, reading {output}/data
+
+The shape of the data is drawn from the real archive (data/pbp, data/statcast
+and the player index of --source-year):
+  - Schedule: the archive's game days, and games per day for each level
+  - Games: at-bats per game and batters faced per pitcher stint
+  - At-bats: resampled real outcomes (result, pitch calls, hit coordinates)
+  - Players: bat/throw hands, batter/pitcher mix and roster sizes per level
+  - Statcast: real AAA/Single-A player blocks, attached to synthetic players
+
+Monthly stats are built from the synthetic games with the same game log
+formatting and aggregation as fetch_stats_by_date.py. Player and game ids are
+offset far above real ids; players turn over between seasons.
+
+Usage:
+  python generate_synthetic_data.py --output /tmp/synthetic --seasons 5
+  python generate_synthetic_data.py --output /tmp/synthetic --players 25000 --games-per-day 300
+  python /tmp/synthetic/scripts/calculate_advanced_stats.py --year 2021
+"""
+
+import argparse
+import json
+import logging
+import random
+import shutil
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from calculate_advanced_stats import load_pbp_day
+from data_writer import log_write_summary, write_json
+from fetch_stats_by_date import build_player_month_stats, format_game_log
+from mock_statsapi import MILB_SPORT_IDS, OUTS_BY_EVENT, batting_line, pitching_line
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Paths
+SCRIPTS_DIR = Path(__file__).parent
+DATA_DIR = SCRIPTS_DIR.parent / 'data'
+
+LEVELS = list(MILB_SPORT_IDS)
+
+# Synthetic ids start here, well above real MLBAM player ids and gamePks
+PLAYER_ID_OFFSET = 5_000_000
+GAME_PK_OFFSET = 5_000_000
+TEAM_ID_OFFSET = 50_000
+
+# Share of each roster replaced by new players between seasons
+SEASON_TURNOVER = 0.2
+
+# Share of a level's teams with Statcast coverage (all Triple-A, the Florida
+# State League's 10 of 30 Single-A teams)
+STATCAST_TEAM_SHARE = {'AAA': 1.0, 'A': 1 / 3}
+STATCAST_COVERAGE = {
+    'AAA': 'All Triple-A games',
+    'A': 'Florida State League (Single-A)',
+}
+
+# At-bat fields that describe the outcome, as opposed to the matchup
+MATCHUP_FIELDS = {'batterId', 'batterName', 'batterHand', 'pitcherId', 'pitcherName', 'pitcherHand'}
+
+# Lineup size
+LINEUP_SIZE = 9
+
+
+class ArchiveModel:
+    """Distributions sampled from the real archive."""
+
+    def __init__(self, source_year: int, sample_days: int, rng: random.Random):
+        self.rng = rng
+        self.season_days: dict[int, list[int]] = {}
+        self.games_per_day: dict[str, list[int]] = defaultdict(list)
+        self.at_bats_per_game: dict[str, list[int]] = defaultdict(list)
+        self.stint_lengths: list[int] = []
+        self.outcomes: list[dict] = []
+        self.batter_hands: list[str] = []
+        self.pitcher_hands: list[str] = []
+        self.teams_per_level: dict[str, int] = {}
+        self.players_per_level: dict[str, int] = {}
+        self.pitcher_share: float = 0.5
+        self.first_names: list[str] = []
+        self.last_names: list[str] = []
+        self.statcast_blocks: dict[tuple[str, str], list[dict]] = defaultdict(list)
+
+        self.load_schedule(source_year)
+        self.load_games(source_year, sample_days)
+        self.load_player_index()
+        self.load_statcast(source_year)
+
+    def load_schedule(self, year: int) -> None:
+        manifest_file = DATA_DIR / 'pbp' / str(year) / 'manifest.json'
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        self.season_days = {int(month): sorted(days) for month, days in manifest.get('months', {}).items() if days}
+
+    def load_games(self, year: int, sample_days: int) -> None:
+        """Sample game, at-bat and hand distributions from evenly spaced archive days."""
+        all_days = [(month, day) for month, days in sorted(self.season_days.items()) for day in days]
+        step = max(1, len(all_days) // sample_days)
+        sampled = all_days[::step][:sample_days]
+
+        teams = defaultdict(set)
+        batter_hands, pitcher_hands = {}, {}
+        for month, day in sampled:
+            games = load_pbp_day(DATA_DIR / 'pbp' / str(year) / f'{month:02d}' / f'{day:02d}')
+            per_level = Counter()
+            for game in games:
+                at_bats = game.get('atBats', [])
+                # Lean captures lack names and full pitch records; model full-format days only
+                if not at_bats or 'calls' in at_bats[0]:
+                    continue
+                level = game.get('level', 'MiLB')
+                per_level[level] += 1
+                teams[level].update({game['awayTeam']['id'], game['homeTeam']['id']})
+                self.at_bats_per_game[level].append(len(at_bats))
+
+                stint = 0
+                previous = None
+                for at_bat in at_bats:
+                    self.outcomes.append({key: value for key, value in at_bat.items() if key not in MATCHUP_FIELDS}
+                                         | {'batterName': at_bat.get('batterName', '')})
+                    batter_hands[at_bat['batterId']] = at_bat.get('batterHand')
+                    pitcher_hands[at_bat.get('pitcherId')] = at_bat.get('pitcherHand')
+                    if at_bat.get('pitcherId') == previous:
+                        stint += 1
+                    else:
+                        if stint:
+                            self.stint_lengths.append(stint)
+                        previous, stint = at_bat.get('pitcherId'), 1
+                if stint:
+                    self.stint_lengths.append(stint)
+            for level, count in per_level.items():
+                self.games_per_day[level].append(count)
+
+        self.teams_per_level = {level: len(ids) for level, ids in teams.items()}
+        self.batter_hands = [hand for hand in batter_hands.values() if hand]
+        self.pitcher_hands = [hand for hand in pitcher_hands.values() if hand]
+        logger.info(f"Sampled {len(self.outcomes)} at-bats from {len(sampled)} days of {year}")
+
+    def load_player_index(self) -> None:
+        with open(DATA_DIR / 'player-index.json') as f:
+            players = json.load(f).get('players', [])
+        self.players_per_level = dict(Counter(player.get('level') for player in players if player.get('level') in LEVELS))
+        pitchers = sum(1 for player in players if player.get('type') == 'pitcher')
+        self.pitcher_share = pitchers / len(players) if players else 0.5
+        for player in players:
+            first, _, last = player.get('name', '').partition(' ')
+            if first and last:
+                self.first_names.append(first)
+                self.last_names.append(last)
+
+    def load_statcast(self, year: int) -> None:
+        for month_file in sorted((DATA_DIR / 'statcast' / str(year)).glob('[0-9][0-9].json')):
+            with open(month_file) as f:
+                players = json.load(f).get('players', {})
+            for block in players.values():
+                self.statcast_blocks[(block.get('type'), block.get('level'))].append(
+                    {key: value for key, value in block.items() if key in ('bat', 'pit')})
+
+    def outcome(self) -> dict:
+        return self.rng.choice(self.outcomes)
+
+    def name(self) -> str:
+        return f'{self.rng.choice(self.first_names)} {self.rng.choice(self.last_names)}'
+
+
+class SyntheticLeague:
+    """Teams and rosters of synthetic players, carried across seasons."""
+
+    def __init__(self, model: ArchiveModel, total_players: int, games_per_day: Optional[int]):
+        self.model = model
+        self.rng = model.rng
+        self.next_player_id = PLAYER_ID_OFFSET
+        self.players: dict[int, dict] = {}
+        self.teams: dict[str, list[dict]] = {}
+
+        # Daily games per level, scaled to --games-per-day if given
+        real_daily = {level: sum(counts) / len(counts) for level, counts in model.games_per_day.items() if counts}
+        scale = games_per_day / sum(real_daily.values()) if games_per_day else 1.0
+        self.daily_scale = scale
+
+        real_players = sum(model.players_per_level.values()) or 1
+        for level in LEVELS:
+            if level not in real_daily:
+                continue
+            max_games = max(model.games_per_day[level]) * scale
+            team_count = max(model.teams_per_level.get(level, 2), 2 * round(max_games + 0.5))
+            level_players = max(team_count * (LINEUP_SIZE + 5),
+                                round(total_players * model.players_per_level.get(level, 0) / real_players))
+            roster_size = level_players // team_count
+            self.teams[level] = []
+            for index in range(team_count):
+                team = {
+                    'id': TEAM_ID_OFFSET + len(self.teams) * 1000 + index,
+                    'name': f'Synthetic {level} Club {index + 1}',
+                    'level': level,
+                    'batters': [],
+                    'pitchers': [],
+                    'roster_size': roster_size,
+                }
+                self.fill_roster(team)
+                self.teams[level].append(team)
+
+        logger.info(f"League: {sum(len(teams) for teams in self.teams.values())} teams, "
+                    f"{len(self.players)} players, ~{sum(real_daily.values()) * scale:.0f} games/day")
+
+    def new_player(self, team: dict, is_pitcher: bool) -> int:
+        player_id = self.next_player_id
+        self.next_player_id += 1
+        self.players[player_id] = {
+            'id': player_id,
+            'name': self.model.name(),
+            'type': 'pitcher' if is_pitcher else 'batter',
+            'bats': self.rng.choice(self.model.batter_hands),
+            'throws': self.rng.choice(self.model.pitcher_hands),
+            'team': team,
+        }
+        return player_id
+
+    def fill_roster(self, team: dict) -> None:
+        pitchers = max(5, round(team['roster_size'] * self.model.pitcher_share))
+        batters = max(LINEUP_SIZE, team['roster_size'] - pitchers)
+        while len(team['pitchers']) < pitchers:
+            team['pitchers'].append(self.new_player(team, True))
+        while len(team['batters']) < batters:
+            team['batters'].append(self.new_player(team, False))
+
+    def turn_over(self) -> None:
+        """Replace a share of every roster with new players before a new season."""
+        for teams in self.teams.values():
+            for team in teams:
+                for key in ('batters', 'pitchers'):
+                    kept = [player_id for player_id in team[key] if self.rng.random() >= SEASON_TURNOVER]
+                    team[key] = kept
+                self.fill_roster(team)
+
+    def games_for_day(self, level: str) -> int:
+        counts = self.model.games_per_day[level]
+        return min(len(self.teams[level]) // 2, round(self.rng.choice(counts) * self.daily_scale))
+
+    def matchup_at_bat(self, batter_id: int, pitcher_id: int) -> dict:
+        """A resampled real outcome with a synthetic batter and pitcher."""
+        outcome = dict(self.model.outcome())
+        real_name = outcome.pop('batterName', '')
+        batter, pitcher = self.players[batter_id], self.players[pitcher_id]
+        bats = batter['bats']
+        if bats == 'S':
+            bats = 'L' if pitcher['throws'] == 'R' else 'R'
+        if real_name and outcome.get('description'):
+            outcome['description'] = outcome['description'].replace(real_name, batter['name'])
+        return {
+            'batterId': batter_id,
+            'batterName': batter['name'],
+            'batterHand': bats,
+            'pitcherId': pitcher_id,
+            'pitcherName': pitcher['name'],
+            'pitcherHand': pitcher['throws'],
+        } | outcome
+
+    def play_game(self, game_pk: int, date_str: str, level: str, away: dict, home: dict) -> dict:
+        """Simulate one game, half-inning by half-inning."""
+        target = self.rng.choice(self.model.at_bats_per_game[level])
+        lineups = {side: self.rng.sample(team['batters'], LINEUP_SIZE)
+                   for side, team in (('away', away), ('home', home))}
+        bullpens = {side: self.rng.sample(team['pitchers'], len(team['pitchers']))
+                    for side, team in (('away', away), ('home', home))}
+        next_batter = {'away': 0, 'home': 0}
+        # Pitcher in the game for each fielding side, and batters left in his stint
+        pitching = {side: [0, self.rng.choice(self.model.stint_lengths)] for side in ('away', 'home')}
+
+        at_bats = []
+        batting_side = 'away'
+        while True:
+            fielding_side = 'home' if batting_side == 'away' else 'away'
+            outs = 0
+            while outs < 3:
+                stint = pitching[fielding_side]
+                if stint[1] <= 0 and stint[0] + 1 < len(bullpens[fielding_side]):
+                    stint[0] += 1
+                    stint[1] = self.rng.choice(self.model.stint_lengths)
+                pitcher_id = bullpens[fielding_side][stint[0]]
+                batter_id = lineups[batting_side][next_batter[batting_side] % LINEUP_SIZE]
+                at_bat = self.matchup_at_bat(batter_id, pitcher_id)
+                at_bats.append(at_bat)
+                outs += OUTS_BY_EVENT.get(at_bat.get('eventType'), 0)
+                next_batter[batting_side] += 1
+                stint[1] -= 1
+            if batting_side == 'home' and len(at_bats) >= target:
+                break
+            batting_side = fielding_side
+
+        return {
+            'gamePk': game_pk,
+            'date': date_str,
+            'level': level,
+            'awayTeam': {'id': away['id'], 'name': away['name']},
+            'homeTeam': {'id': home['id'], 'name': home['name']},
+            'atBats': at_bats,
+        }
+
+
+def player_month_logs(games: list[dict], league: SyntheticLeague) -> dict[int, dict]:
+    """
+    Game logs of every player in a month's games, shaped like fetch_player_stats() output.
+    """
+    logs: dict[int, dict[str, list]] = defaultdict(lambda: {'batting': [], 'pitching': []})
+    for game in games:
+        by_player = defaultdict(list)
+        for at_bat in game['atBats']:
+            by_player[(at_bat['batterId'], 'batting')].append(at_bat)
+            by_player[(at_bat['pitcherId'], 'pitching')].append(at_bat)
+
+        for (player_id, stat_type), at_bats in by_player.items():
+            team = league.players[player_id]['team']
+            is_home = team['id'] == game['homeTeam']['id']
+            line = batting_line(at_bats) if stat_type == 'batting' else pitching_line(at_bats)
+            split = {
+                'date': game['date'],
+                'game': {'gamePk': game['gamePk']},
+                'team': {'name': team['name']},
+                'opponent': game['awayTeam'] if is_home else game['homeTeam'],
+                'isHome': is_home,
+                'sport': {'id': MILB_SPORT_IDS[game['level']]},
+                'stat': line,
+            }
+            logs[player_id][stat_type].append(format_game_log(split, stat_type))
+
+    players = {}
+    for player_id, player_logs in logs.items():
+        batting, pitching = player_logs['batting'], player_logs['pitching']
+        entry = {'playerId': str(player_id), 'type': 'pitcher' if len(pitching) > len(batting) else 'batter'}
+        if batting:
+            entry['battingGameLog'] = sorted(batting, key=lambda x: x.get('date', ''))
+        if pitching:
+            entry['pitchingGameLog'] = sorted(pitching, key=lambda x: x.get('date', ''))
+        players[player_id] = entry
+    return players
+
+
+def statcast_month(players: dict[int, dict], league: SyntheticLeague) -> dict:
+    """Statcast blocks for the month's players at covered levels, resampled from real blocks."""
+    rng = league.rng
+    statcast = {}
+    for player_id in players:
+        player = league.players[player_id]
+        team = player['team']
+        share = STATCAST_TEAM_SHARE.get(team['level'], 0)
+        teams = league.teams[team['level']]
+        if teams.index(team) >= round(len(teams) * share):
+            continue
+        blocks = league.model.statcast_blocks.get((player['type'], team['level']))
+        if not blocks:
+            continue
+        first, _, last = player['name'].partition(' ')
+        statcast[str(player_id)] = {
+            'id': str(player_id),
+            'name': f'{last}, {first}',
+            'type': player['type'],
+            'level': team['level'],
+        } | rng.choice(blocks)
+    return statcast
+
+
+def generate_season(year: int, league: SyntheticLeague, data_dir: Path, next_game_pk: int,
+                    last_game_dates: dict[int, str]) -> int:
+    """
+    Generate and write one season.
+
+    Returns:
+        The next unused gamePk
+    """
+    now = datetime.now().isoformat()
+    pbp_months, stats_months, statcast_months = {}, [], []
+
+    for month, days in sorted(league.model.season_days.items()):
+        month_games = []
+        for day in days:
+            date_str = f'{year}-{month:02d}-{day:02d}'
+            day_games = []
+            for level, teams in league.teams.items():
+                matchups = league.rng.sample(teams, 2 * league.games_for_day(level))
+                for away, home in zip(matchups[::2], matchups[1::2]):
+                    day_games.append(league.play_game(next_game_pk, date_str, level, away, home))
+                    next_game_pk += 1
+            write_json(data_dir / 'pbp' / str(year) / f'{month:02d}' / f'{day:02d}.json',
+                       {'date': date_str, 'updated': now, 'gameCount': len(day_games), 'games': day_games})
+            month_games.extend(day_games)
+        pbp_months[str(month)] = days
+
+        players = player_month_logs(month_games, league)
+        month_stats = {}
+        for player_id, player_stats in players.items():
+            entry = build_player_month_stats(player_stats, year, month)
+            if entry:
+                month_stats[str(player_id)] = entry
+            last_log = max((log['date'] for key in ('battingGameLog', 'pitchingGameLog')
+                            for log in player_stats.get(key, [])), default='')
+            last_game_dates[player_id] = max(last_game_dates.get(player_id, ''), last_log)
+        write_json(data_dir / 'stats' / str(year) / f'{month:02d}.json',
+                   {'year': year, 'month': month, 'updated': now, 'players': month_stats})
+        stats_months.append(month)
+
+        statcast = statcast_month(players, league)
+        if statcast:
+            write_json(data_dir / 'statcast' / str(year) / f'{month:02d}.json',
+                       {'year': year, 'month': month, 'updated': now, 'players': statcast})
+            statcast_months.append(month)
+
+        at_bats = sum(len(game['atBats']) for game in month_games)
+        logger.info(f"  {year}-{month:02d}: {len(month_games)} games, {at_bats} at-bats, "
+                    f"{len(month_stats)} players, {len(statcast)} Statcast players")
+        del month_games, players
+
+    write_json(data_dir / 'pbp' / str(year) / 'manifest.json',
+               {'year': year, 'updated': now, 'months': pbp_months}, indent=2)
+    write_json(data_dir / 'stats' / str(year) / 'manifest.json',
+               {'year': year, 'updated': now, 'months': stats_months}, indent=2)
+    if statcast_months:
+        write_json(data_dir / 'statcast' / str(year) / 'manifest.json',
+                   {'year': year, 'updated': now, 'months': statcast_months, 'coverage': STATCAST_COVERAGE},
+                   indent=2)
+    return next_game_pk
+
+
+def save_player_index(data_dir: Path, league: SyntheticLeague, year: int, last_game_dates: dict[int, str]) -> None:
+    """Player index of every synthetic player, in the format of build_player_index.py."""
+    players = []
+    for player_id, player in league.players.items():
+        entry = {
+            'mlbId': str(player_id),
+            'name': player['name'],
+            'team': player['team']['name'],
+            'org': 'SYN',
+            'level': player['team']['level'],
+            'position': 'P' if player['type'] == 'pitcher' else 'DH',
+            'type': player['type'],
+            'inRegistry': False,
+        }
+        if last_game_dates.get(player_id):
+            entry['lastGameDate'] = last_game_dates[player_id]
+        players.append(entry)
+
+    write_json(data_dir / 'player-index.json', {
+        'players': players,
+        'year': year,
+        'requestedYear': year,
+        'lastUpdated': datetime.now().isoformat(),
+        'count': len(players),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic seasons of MiLB data for load testing')
+    parser.add_argument('--output', type=Path, required=True,
+                        help='Output directory (gets data/ and a copy of scripts/)')
+    parser.add_argument('--seasons', type=int, default=1, help='Number of seasons (default: 1)')
+    parser.add_argument('--end-year', type=int, default=None,
+                        help='Last generated season (default: --source-year)')
+    parser.add_argument('--games-per-day', type=int, default=None,
+                        help='Average games per day across levels (default: as in the archive)')
+    parser.add_argument('--players', type=int, default=None,
+                        help='Player pool size (default: as in the player index)')
+    parser.add_argument('--months', type=str, default=None,
+                        help='Comma-separated months to generate (default: all archive months)')
+    parser.add_argument('--source-year', type=int, default=2025, help='Archive season to model (default: 2025)')
+    parser.add_argument('--sample-days', type=int, default=20,
+                        help='Archive days sampled for the model (default: 20)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--no-scripts', action='store_true', help="Don't copy scripts/ into the output")
+    args = parser.parse_args()
+
+    if args.output.resolve() == DATA_DIR.parent.resolve():
+        parser.error("--output must not be the repository itself")
+
+    rng = random.Random(args.seed)
+    model = ArchiveModel(args.source_year, args.sample_days, rng)
+    if args.months:
+        months = {int(month) for month in args.months.split(',')}
+        model.season_days = {month: days for month, days in model.season_days.items() if month in months}
+    total_players = args.players or sum(model.players_per_level.values())
+    league = SyntheticLeague(model, total_players, args.games_per_day)
+
+    data_dir = args.output / 'data'
+    end_year = args.end_year or args.source_year
+    years = list(range(end_year - args.seasons + 1, end_year + 1))
+
+    next_game_pk = GAME_PK_OFFSET
+    last_game_dates: dict[int, str] = {}
+    for index, year in enumerate(years):
+        if index:
+            league.turn_over()
+        logger.info(f"Generating {year} ({len(league.players)} players so far)...")
+        next_game_pk = generate_season(year, league, data_dir, next_game_pk, last_game_dates)
+
+    save_player_index(data_dir, league, end_year, last_game_dates)
+
+    if not args.no_scripts:
+        shutil.copytree(SCRIPTS_DIR, args.output / 'scripts', dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns('__pycache__'))
+
+    log_write_summary()
+    logger.info(f"Complete! {len(years)} seasons, {len(league.players)} players, "
+                f"{next_game_pk - GAME_PK_OFFSET} games in {data_dir}")
+
+
+if __name__ == '__main__':
+    main()
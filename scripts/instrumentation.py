@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Run instrumentation for the data scripts: timed spans, counters and histograms.
+
+Pipeline scripts wrap their main work in run_report(), and mark stages and
+events with span(), count() and observe(). When the run ends the slowest stages
+and the HTTP summary are logged, and with --report a structured report is
+appended to the day's run file:
+  runs/{YYYY-MM-DD}.json - {date, runs: [run, ...]}, one run per invocation
+
+Run files live outside data/ and are ignored by git, so instrumented runs
+don't add commits or get deployed with the site.
+
+Each run records its script, arguments, status and duration, the time spent in
+every span name (count, total, max), the top-level stages in order, the final
+counter values and a summary (count, sum, min, p50, p90, p99, max) of every
+histogram. HTTP requests are also summarized per endpoint class (schedule,
+boxscore, playByPlay, people, teams, roster, savant): requests by status,
+retries, backoff time, failures, bytes, and latency and decode-time
+percentiles. With --trace, every span is also written as a Chrome trace
+(chrome://tracing or https://ui.perfetto.dev):
+  runs/{YYYY-MM-DD}-{script}.trace.json
+
+With --profile the run is also profiled (see profiling.py), and the run
+record lists the profile files and the tracemalloc report of its stages.
+
+All recording is thread-safe; spans nest per thread.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from profiling import PROFILE_MODES, start_profiling, stop_profiling
+
+logger = logging.getLogger(__name__)
+
+# Paths
+RUNS_DIR = Path(__file__).parent.parent / 'runs'
+
+HISTOGRAM_PERCENTILES = (0.5, 0.9, 0.99)
+
+# Span names listed in the end-of-run log line
+SUMMARY_SPANS = 6
+
+# Prefix of the per-endpoint-class HTTP counters and histograms
+HTTP_PREFIX = 'http.'
+
+
+class Recorder:
+    """Spans, counters and histograms of one run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+        self.spans: list[dict] = []
+        self.counters: dict[str, float] = defaultdict(int)
+        self.histograms: dict[str, list[float]] = defaultdict(list)
+
+    def stack(self) -> list[str]:
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[None]:
+        stack = self.stack()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            stack.pop()
+            record = {
+                'name': name,
+                'parent': parent,
+                'start': started - self.origin,
+                'duration': duration,
+                'thread': threading.get_ident(),
+            }
+            if attrs:
+                record['attrs'] = attrs
+            with self.lock:
+                self.spans.append(record)
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self.lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        with self.lock:
+            self.histograms[name].append(value)
+
+    def summarize_spans(self) -> dict[str, dict]:
+        """Time per span name: count, total and max seconds."""
+        with self.lock:
+            spans = list(self.spans)
+        summary: dict[str, dict] = {}
+        for record in spans:
+            entry = summary.setdefault(record['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += record['duration']
+            entry['max'] = max(entry['max'], record['duration'])
+        return {
+            name: {'count': entry['count'], 'total': round(entry['total'], 4), 'max': round(entry['max'], 4)}
+            for name, entry in sorted(summary.items(), key=lambda item: -item[1]['total'])
+        }
+
+    def summarize_histograms(self) -> dict[str, dict]:
+        with self.lock:
+            histograms = {name: sorted(values) for name, values in self.histograms.items()}
+        summary = {}
+        for name, values in sorted(histograms.items()):
+            if not values:
+                continue
+            entry = {
+                'count': len(values),
+                'sum': round(sum(values), 4),
+                'min': round(values[0], 4),
+            }
+            for q in HISTOGRAM_PERCENTILES:
+                entry[f'p{round(q * 100)}'] = round(values[min(int(len(values) * q), len(values) - 1)], 4)
+            entry['max'] = round(values[-1], 4)
+            summary[name] = entry
+        return summary
+
+    def chrome_trace(self, script: str) -> dict:
+        """Spans as Chrome trace 'complete' events."""
+        with self.lock:
+            spans = list(self.spans)
+        events = [{
+            'name': record['name'],
+            'ph': 'X',
+            'ts': round(record['start'] * 1e6),
+            'dur': round(record['duration'] * 1e6),
+            'pid': os.getpid(),
+            'tid': record['thread'],
+            'args': record.get('attrs', {}),
+        } for record in sorted(spans, key=lambda record: record['start'])]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'script': script}}
+
+
+_recorder = Recorder()
+
+
+def span(name: str, **attrs):
+    """Context manager timing a stage; attrs are kept in the Chrome trace."""
+    return _recorder.span(name, **attrs)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add to a counter (requests, retries, bytes, rows, players, ...)."""
+    _recorder.count(name, value)
+
+
+def observe(name: str, value: float) -> None:
+    """Record a value in a histogram (latencies, sizes, ...)."""
+    _recorder.observe(name, value)
+
+
+def endpoint_class(path: str) -> str:
+    """Endpoint class of a request path or URL, for per-endpoint metrics."""
+    if 'statcast-search' in path:
+        return 'savant'
+    if path.endswith('/schedule'):
+        return 'schedule'
+    if path.endswith('/boxscore'):
+        return 'boxscore'
+    if path.endswith('/playByPlay'):
+        return 'playByPlay'
+    if '/people' in path:
+        return 'people'
+    if path.endswith('/roster'):
+        return 'roster'
+    if path.endswith('/teams'):
+        return 'teams'
+    return 'other'
+
+
+def error_status(error: Exception):
+    """Status of a failed request: the HTTP status, or the exception name if none."""
+    response = getattr(error, 'response', None)
+    if response is not None:
+        return response.status_code
+    return type(error).__name__
+
+
+def record_request(
+    endpoint: str,
+    status,
+    seconds: float,
+    size: int = 0,
+    decode_seconds: Optional[float] = None,
+) -> None:
+    """
+    Record one HTTP request attempt.
+
+    Args:
+        endpoint: Endpoint class (see endpoint_class)
+        status: HTTP status code, or the exception name for transport errors
+        seconds: Time until the response headers (or the error)
+        size: Response body bytes received
+        decode_seconds: Time spent decoding/parsing the body
+    """
+    count('requests')
+    count('bytes', size)
+    count(f'{HTTP_PREFIX}{endpoint}.requests')
+    count(f'{HTTP_PREFIX}{endpoint}.status.{status}')
+    count(f'{HTTP_PREFIX}{endpoint}.bytes', size)
+    observe(f'{HTTP_PREFIX}{endpoint}.latency_seconds', seconds)
+    if decode_seconds is not None:
+        observe(f'{HTTP_PREFIX}{endpoint}.decode_seconds', decode_seconds)
+
+
+def record_retry(endpoint: str, backoff: float) -> None:
+    """Record a retry and the time slept before it."""
+    count('retries')
+    count(f'{HTTP_PREFIX}{endpoint}.retries')
+    count(f'{HTTP_PREFIX}{endpoint}.backoff_seconds', backoff)
+
+
+def record_failure(endpoint: str) -> None:
+    """Record a request given up on after its retries."""
+    count('request_failures')
+    count(f'{HTTP_PREFIX}{endpoint}.failures')
+
+
+def summarize_http(counters: dict[str, float], histograms: dict[str, dict]) -> dict[str, dict]:
+    """Group the http.* counters and histograms by endpoint class."""
+    summary: dict[str, dict] = {}
+    for name, value in counters.items():
+        if not name.startswith(HTTP_PREFIX):
+            continue
+        endpoint, _, metric = name[len(HTTP_PREFIX):].partition('.')
+        entry = summary.setdefault(endpoint, {'requests': 0, 'statuses': {}, 'retries': 0,
+                                              'backoffSeconds': 0, 'failures': 0, 'bytes': 0})
+        if metric.startswith('status.'):
+            entry['statuses'][metric[len('status.'):]] = value
+        elif metric == 'backoff_seconds':
+            entry['backoffSeconds'] = round(value, 3)
+        else:
+            entry[metric] = value
+    for name, histogram in histograms.items():
+        if not name.startswith(HTTP_PREFIX):
+            continue
+        endpoint, _, metric = name[len(HTTP_PREFIX):].partition('.')
+        if endpoint in summary:
+            summary[endpoint]['latency' if metric == 'latency_seconds' else 'decode'] = histogram
+    return dict(sorted(summary.items(), key=lambda item: -item[1]['requests']))
+
+
+def log_http_summary(http: dict[str, dict]) -> None:
+    """Log one line per endpoint class."""
+    for endpoint, entry in http.items():
+        statuses = ' '.join(f'{status}:{n}' for status, n in sorted(entry['statuses'].items()))
+        line = (f"HTTP {endpoint}: {entry['requests']} requests ({statuses}), {entry['retries']} retries, "
+                f"{entry['backoffSeconds']:.1f}s backoff, {entry['failures']} failed, "
+                f"{entry['bytes'] / 1e6:.1f} MB")
+        latency = entry.get('latency')
+        if latency:
+            line += f", latency p50 {latency['p50'] * 1000:.0f}ms p99 {latency['p99'] * 1000:.0f}ms"
+        decode = entry.get('decode')
+        if decode:
+            line += f", decode {decode['sum']:.1f}s"
+        logger.info(line)
+
+
+def add_run_arguments(parser) -> None:
+    """Add the instrumentation options to a script's argument parser."""
+    parser.add_argument('--report', action='store_true',
+                        help='Append a run report to runs/{date}.json')
+    parser.add_argument('--trace', action='store_true',
+                        help='Also write a Chrome trace of the run to runs/')
+    parser.add_argument('--profile', nargs='?', const='cprofile', default=None, choices=PROFILE_MODES,
+                        help='Profile the run with cProfile (default) or a stack sampler, '
+                             'writing the profile to runs/')
+
+
+def get_report_path(started: datetime) -> Path:
+    return RUNS_DIR / f"{started.strftime('%Y-%m-%d')}.json"
+
+
+def get_trace_path(started: datetime, script: str) -> Path:
+    return RUNS_DIR / f"{started.strftime('%Y-%m-%d')}-{script}.trace.json"
+
+
+def get_profile_base(started: datetime, script: str) -> Path:
+    """Profile output path without its suffix (see profiling.py)."""
+    return RUNS_DIR / f"{started.strftime('%Y-%m-%d')}-{script}"
+
+
+def append_run(path: Path, date: str, run: dict) -> None:
+    """Append a run to a day's run file."""
+    report = {'date': date, 'runs': []}
+    if path.exists():
+        try:
+            with open(path) as f:
+                report = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {path}, starting a new run file: {e}")
+    report.setdefault('runs', []).append(run)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+@contextmanager
+def run_report(script: str, args=None) -> Iterator[Recorder]:
+    """
+    Instrument a script run and write its report when it ends.
+
+    Args:
+        script: Script name (e.g. 'fetch_pbp')
+        args: Parsed arguments; `report` enables the run report, `trace` the Chrome
+            trace, `profile` the profiler
+    """
+    started = datetime.now(timezone.utc)
+    status = 'ok'
+    profile_mode = getattr(args, 'profile', None)
+    if profile_mode:
+        start_profiling(profile_mode)
+    try:
+        with _recorder.span(script):
+            yield _recorder
+    except KeyboardInterrupt:
+        status = 'interrupted'
+        raise
+    except BaseException as e:
+        status = 'error' if not isinstance(e, SystemExit) or e.code else 'ok'
+        raise
+    finally:
+        finished = datetime.now(timezone.utc)
+        profile = None
+        if profile_mode:
+            try:
+                profiler = stop_profiling(get_profile_base(started, script))
+                profile = {'mode': profile_mode, 'allocations': profiler.allocations}
+            except IOError as e:
+                logger.warning(f"Failed to write profile: {e}")
+        spans = _recorder.summarize_spans()
+        with _recorder.lock:
+            stages = [{'name': record['name'], 'start': round(record['start'], 3),
+                       'duration': round(record['duration'], 3)}
+                      for record in _recorder.spans if record['parent'] == script]
+            counters = {name: round(value, 4) if isinstance(value, float) else value
+                        for name, value in sorted(_recorder.counters.items())}
+        histograms = _recorder.summarize_histograms()
+        http = summarize_http(counters, histograms)
+        run = {
+            'script': script,
+            'argv': sys.argv[1:],
+            'status': status,
+            'started': started.isoformat(),
+            'finished': finished.isoformat(),
+            'duration': round((finished - started).total_seconds(), 3),
+            'stages': sorted(stages, key=lambda stage: stage['start']),
+            'spans': spans,
+            'counters': {name: value for name, value in counters.items() if not name.startswith(HTTP_PREFIX)},
+            'histograms': {name: value for name, value in histograms.items() if not name.startswith(HTTP_PREFIX)},
+            'http': http,
+        }
+        if profile:
+            run['profile'] = profile
+
+        slowest = [f"{name} {entry['total']:.1f}s" for name, entry in spans.items() if name != script][:SUMMARY_SPANS]
+        if slowest:
+            logger.info(f"Time by stage: {', '.join(slowest)}")
+        log_http_summary(http)
+
+        try:
+            if getattr(args, 'report', False):
+                report_path = get_report_path(started)
+                append_run(report_path, started.strftime('%Y-%m-%d'), run)
+                logger.info(f"Run report appended to {report_path}")
+            if getattr(args, 'trace', False):
+                trace_path = get_trace_path(started, script)
+                trace_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(trace_path, 'w') as f:
+                    json.dump(_recorder.chrome_trace(script), f, separators=(',', ':'))
+                logger.info(f"Chrome trace written to {trace_path}")
+        except IOError as e:
+            logger.warning(f"Failed to write run report: {e}")
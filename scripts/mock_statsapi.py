@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the MLB Stats API, for reproducible fetch benchmarks.
+
+Replays the endpoints the fetch scripts use, with responses generated from the
+play-by-play archive (data/pbp) for a range of dates:
+  /api/v1/schedule                  - Completed games of a date
+  /api/v1/game/{gamePk}/boxscore    - Players of each team
+  /api/v1/game/{gamePk}/playByPlay  - allPlays rebuilt from the archived at-bats
+  /api/v1/people/{id}/stats         - season and gameLog splits derived from the at-bats
+                                      (only games within startDate/endDate when given)
+  /api/v1/people?personIds=...      - the same splits for many players (hydrate=stats(...))
+  /api/v1/teams, /teams/{id}/roster - Teams of the replayed games and their players
+
+Latency, jitter, error rate and 429 throttling are configurable, and every
+request is recorded (endpoint class, status, latency, bytes) for benchmark_fetch.py.
+
+With --league-only the splits carry no sport block, so a split's level can only
+come from a team(league) hydrate, as with some real responses; the per-player
+and batched stats fetches should then still resolve the same levels.
+
+The fetch scripts read the API base URL from the MLB_API_BASE environment variable.
+
+Usage:
+  python mock_statsapi.py --start 2025-06-01 --end 2025-06-03 --latency 50 --jitter 20
+  MLB_API_BASE=http://127.0.0.1:8765/api/v1 python fetch_pbp.py --date 2025-06-01
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from calculate_advanced_stats import LEAN_CALL_CODES, load_pbp_for_date
+from instrumentation import endpoint_class
+
+# Logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+# MiLB levels and their sport IDs
+MILB_SPORT_IDS = {
+    'AAA': 11,
+    'AA': 12,
+    'A+': 13,
+    'A': 14,
+    'CPX': 16,
+}
+
+# League abbreviations of each level, as hydrate=team(league) returns them
+# (get_level_from_split recognizes none for CPX)
+LEAGUE_ABBREVIATIONS = {
+    'AAA': 'INT',
+    'AA': 'EL',
+    'A+': 'SAL',
+    'A': 'CAR',
+}
+
+# Outs recorded by each event type, for pitching lines
+OUTS_BY_EVENT = {
+    'field_out': 1, 'strikeout': 1, 'force_out': 1, 'fielders_choice_out': 1,
+    'sac_fly': 1, 'sac_bunt': 1, 'other_out': 1,
+    'caught_stealing_2b': 1, 'caught_stealing_3b': 1, 'caught_stealing_home': 1,
+    'pickoff_1b': 1, 'pickoff_2b': 1, 'pickoff_3b': 1,
+    'pickoff_caught_stealing_2b': 1, 'pickoff_caught_stealing_3b': 1, 'pickoff_caught_stealing_home': 1,
+    'grounded_into_double_play': 2, 'double_play': 2, 'strikeout_double_play': 2,
+    'sac_fly_double_play': 2, 'sac_bunt_double_play': 2, 'triple_play': 3,
+}
+
+# Events that aren't plate appearances
+NON_PA_EVENTS = {
+    'caught_stealing_2b', 'caught_stealing_3b', 'caught_stealing_home',
+    'stolen_base_2b', 'stolen_base_3b', 'stolen_base_home',
+    'pickoff_1b', 'pickoff_2b', 'pickoff_3b',
+    'pickoff_caught_stealing_2b', 'pickoff_caught_stealing_3b', 'pickoff_caught_stealing_home',
+    'wild_pitch', 'passed_ball', 'balk', 'other_advance', 'game_advisory', 'runner_double_play',
+}
+
+
+def percentile(values: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class RequestLog:
+    """Thread-safe record of served requests."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: list[tuple[str, int, float, int]] = []
+
+    def record(self, endpoint: str, status: int, latency: float, size: int) -> None:
+        with self.lock:
+            self.entries.append((endpoint, status, latency, size))
+
+    def reset(self) -> None:
+        with self.lock:
+            self.entries = []
+
+    def summary(self, wall_time: float) -> dict:
+        """Requests/sec, latency percentiles and status counts, overall and per endpoint class."""
+        with self.lock:
+            entries = list(self.entries)
+
+        def summarize(rows: list[tuple[str, int, float, int]]) -> dict:
+            latencies = [row[2] for row in rows]
+            statuses = defaultdict(int)
+            for row in rows:
+                statuses[str(row[1])] += 1
+            p50 = percentile(latencies, 0.5)
+            p99 = percentile(latencies, 0.99)
+            return {
+                'requests': len(rows),
+                'requestsPerSec': round(len(rows) / wall_time, 1) if wall_time > 0 else None,
+                'p50Ms': round(p50 * 1000, 1) if p50 is not None else None,
+                'p99Ms': round(p99 * 1000, 1) if p99 is not None else None,
+                'bytes': sum(row[3] for row in rows),
+                'statuses': dict(sorted(statuses.items())),
+            }
+
+        by_endpoint = defaultdict(list)
+        for row in entries:
+            by_endpoint[row[0]].append(row)
+
+        result = summarize(entries)
+        result['wallTime'] = round(wall_time, 2)
+        result['endpoints'] = {name: summarize(rows) for name, rows in sorted(by_endpoint.items())}
+        return result
+
+
+class FaultConfig:
+    """Injected latency, errors and throttling."""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0,
+                 throttle_rps: float = 0, retry_after: int = 1, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rps = throttle_rps
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # Token bucket for 429 throttling (one second of burst)
+        self.tokens = throttle_rps
+        self.last_refill = time.monotonic()
+
+    def delay(self) -> float:
+        """Seconds to wait before answering a request."""
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def should_throttle(self) -> bool:
+        if not self.throttle_rps:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.throttle_rps, self.tokens + (now - self.last_refill) * self.throttle_rps)
+            self.last_refill = now
+            if self.tokens < 1:
+                return True
+            self.tokens -= 1
+            return False
+
+
+def assign_teams(at_bats: list[dict]) -> dict[int, str]:
+    """
+    Assign each player of a game to 'away' or 'home'.
+
+    The first at-bat is the away leadoff hitter facing the home pitcher, and every
+    at-bat pairs players of opposite teams, so sides propagate through the matchups.
+    """
+    sides: dict[int, str] = {}
+    if not at_bats:
+        return sides
+    sides[at_bats[0]['batterId']] = 'away'
+
+    other = {'away': 'home', 'home': 'away'}
+    changed = True
+    while changed:
+        changed = False
+        for at_bat in at_bats:
+            batter, pitcher = at_bat.get('batterId'), at_bat.get('pitcherId')
+            if not batter or not pitcher:
+                continue
+            if batter in sides and pitcher not in sides:
+                sides[pitcher] = other[sides[batter]]
+                changed = True
+            elif pitcher in sides and batter not in sides:
+                sides[batter] = other[sides[pitcher]]
+                changed = True
+
+    # Players never matched up with a known side
+    for at_bat in at_bats:
+        for key in ('batterId', 'pitcherId'):
+            if at_bat.get(key):
+                sides.setdefault(at_bat[key], 'away')
+    return sides
+
+
+def at_bat_pitches(at_bat: dict) -> list[dict]:
+    """Pitch events of an archived at-bat (full or lean record), in playByPlay form."""
+    if 'calls' in at_bat:
+        codes = [LEAN_CALL_CODES.get(code, code) for code in at_bat['calls']]
+        hit = at_bat.get('hit', {})
+    else:
+        codes = [pitch.get('call', '') for pitch in at_bat.get('pitches', [])]
+        hit = at_bat['pitches'][-1] if at_bat.get('pitches') else {}
+
+    events = [{'isPitch': True, 'details': {'call': {'code': code, 'description': ''}}} for code in codes]
+    if events and hit.get('trajectory'):
+        events[-1]['hitData'] = {
+            'trajectory': hit['trajectory'],
+            'coordinates': {'coordX': hit.get('coordX'), 'coordY': hit.get('coordY')},
+        }
+    return events
+
+
+def batting_line(at_bats: list[dict]) -> dict:
+    """API-style hitting stat line for a player's at-bats."""
+    line = defaultdict(int)
+    for at_bat in at_bats:
+        event = at_bat.get('eventType') or ''
+        if event in NON_PA_EVENTS:
+            continue
+        line['plateAppearances'] += 1
+        line['rbi'] += at_bat.get('rbi', 0)
+        if event in ('walk', 'intent_walk'):
+            line['baseOnBalls'] += 1
+        elif event == 'hit_by_pitch':
+            line['hitByPitch'] += 1
+        elif event in ('sac_fly', 'sac_fly_double_play'):
+            line['sacFlies'] += 1
+        elif event in ('sac_bunt', 'sac_bunt_double_play'):
+            line['sacBunts'] += 1
+        elif event != 'catcher_interf':
+            line['atBats'] += 1
+        if event in ('strikeout', 'strikeout_double_play'):
+            line['strikeOuts'] += 1
+        if event in ('single', 'double', 'triple', 'home_run'):
+            line['hits'] += 1
+        if event == 'double':
+            line['doubles'] += 1
+        elif event == 'triple':
+            line['triples'] += 1
+        elif event == 'home_run':
+            line['homeRuns'] += 1
+        if event == 'grounded_into_double_play':
+            line['groundIntoDoublePlay'] += 1
+
+    line = dict(line)
+    line['gamesPlayed'] = 1
+    ab = line.get('atBats', 0)
+    pa = line.get('plateAppearances', 0)
+    hits = line.get('hits', 0)
+    if ab:
+        total_bases = hits + line.get('doubles', 0) + 2 * line.get('triples', 0) + 3 * line.get('homeRuns', 0)
+        line['avg'] = f"{hits / ab:.3f}".lstrip('0')
+        line['slg'] = f"{total_bases / ab:.3f}".lstrip('0')
+    if pa:
+        on_base = hits + line.get('baseOnBalls', 0) + line.get('hitByPitch', 0)
+        line['obp'] = f"{on_base / pa:.3f}".lstrip('0')
+    return line
+
+
+def pitching_line(at_bats: list[dict]) -> dict:
+    """API-style pitching stat line for a pitcher's at-bats."""
+    line = defaultdict(int)
+    for at_bat in at_bats:
+        event = at_bat.get('eventType') or ''
+        line['outs'] += OUTS_BY_EVENT.get(event, 0)
+        if event in NON_PA_EVENTS:
+            continue
+        line['battersFaced'] += 1
+        line['earnedRuns'] += at_bat.get('rbi', 0)
+        if event in ('walk', 'intent_walk'):
+            line['baseOnBalls'] += 1
+        elif event == 'hit_by_pitch':
+            line['hitBatsmen'] += 1
+        elif event in ('strikeout', 'strikeout_double_play'):
+            line['strikeOuts'] += 1
+        elif event in ('single', 'double', 'triple', 'home_run'):
+            line['hits'] += 1
+            if event == 'home_run':
+                line['homeRuns'] += 1
+        line['numberOfPitches'] += len(at_bat.get('calls') or at_bat.get('pitches') or [])
+
+    line = dict(line)
+    line['gamesPlayed'] = 1
+    outs = line.get('outs', 0)
+    line['inningsPitched'] = f"{outs // 3}.{outs % 3}"
+    return line
+
+
+def sum_lines(lines: list[dict]) -> dict:
+    """Season totals of per-game stat lines (counting stats only)."""
+    totals = defaultdict(int)
+    for line in lines:
+        for key, value in line.items():
+            if isinstance(value, int):
+                totals[key] += value
+    totals = dict(totals)
+    if 'outs' in totals:
+        totals['inningsPitched'] = f"{totals['outs'] // 3}.{totals['outs'] % 3}"
+    return totals
+
+
+class ReplayData:
+    """API responses generated from the archived play-by-play of a range of dates."""
+
+    def __init__(self, dates: list[str], league_only: bool = False):
+        # Leave the sport out of stats splits, so only a team(league) hydrate identifies the level
+        self.league_only = league_only
+        self.schedule: dict[str, list[dict]] = defaultdict(list)
+        self.games: dict[int, dict] = {}
+        self.sides: dict[int, dict[int, str]] = {}
+        self.names: dict[int, str] = {}
+        self.player_games: dict[tuple[int, str], list[tuple[dict, list[dict]]]] = defaultdict(list)
+        self.teams: dict[int, dict] = {}
+        self.rosters: dict[int, set[int]] = defaultdict(set)
+        self.cache: dict[str, bytes] = {}
+        self.cache_lock = threading.Lock()
+
+        for date_str in dates:
+            for game in load_pbp_for_date(date_str):
+                self.add_game(date_str, game)
+
+        logger.info(f"Replaying {len(self.games)} games over {len(dates)} dates, "
+                    f"{len(self.names)} players, {len(self.teams)} teams")
+
+    def add_game(self, date_str: str, game: dict) -> None:
+        game_pk = game['gamePk']
+        at_bats = game.get('atBats', [])
+        sport_id = MILB_SPORT_IDS.get(game.get('level'), 0)
+        self.games[game_pk] = game
+        sides = self.sides[game_pk] = assign_teams(at_bats)
+
+        teams = {'away': game.get('awayTeam', {}), 'home': game.get('homeTeam', {})}
+        for team in teams.values():
+            if team.get('id'):
+                self.teams[team['id']] = {'id': team['id'], 'name': team.get('name'),
+                                          'sport': {'id': sport_id}}
+
+        self.schedule[date_str].append({
+            'gamePk': game_pk,
+            'gameDate': f'{date_str}T23:05:00Z',
+            'officialDate': date_str,
+            'status': {'abstractGameState': 'Final', 'detailedState': 'Final'},
+            'sport': {'id': sport_id},
+            'teams': {side: {'team': self.teams.get(team.get('id'), team)} for side, team in teams.items()},
+        })
+
+        by_player: dict[tuple[int, str], list[dict]] = defaultdict(list)
+        for at_bat in at_bats:
+            if at_bat.get('batterId'):
+                by_player[(at_bat['batterId'], 'hitting')].append(at_bat)
+                if at_bat.get('batterName'):
+                    self.names[at_bat['batterId']] = at_bat['batterName']
+            if at_bat.get('pitcherId'):
+                by_player[(at_bat['pitcherId'], 'pitching')].append(at_bat)
+                if at_bat.get('pitcherName'):
+                    self.names[at_bat['pitcherId']] = at_bat['pitcherName']
+
+        for player_id, side in sides.items():
+            self.names.setdefault(player_id, f'Player {player_id}')
+            team = teams[side]
+            if team.get('id'):
+                self.rosters[team['id']].add(player_id)
+        for (player_id, group), player_at_bats in by_player.items():
+            self.player_games[(player_id, group)].append((game, player_at_bats))
+
+    def person(self, player_id: int) -> dict:
+        return {'id': player_id, 'fullName': self.names.get(player_id, f'Player {player_id}')}
+
+    def get_schedule(self, params: dict) -> dict:
+        date_str = params.get('date', [''])[0]
+        games = self.schedule.get(date_str, [])
+        return {'totalGames': len(games), 'dates': [{'date': date_str, 'games': games}] if games else []}
+
+    def get_boxscore(self, game_pk: int) -> Optional[dict]:
+        game = self.games.get(game_pk)
+        if game is None:
+            return None
+        teams = {}
+        for side, team_key in (('away', 'awayTeam'), ('home', 'homeTeam')):
+            players = {
+                f'ID{player_id}': {'person': self.person(player_id)}
+                for player_id, player_side in self.sides[game_pk].items() if player_side == side
+            }
+            teams[side] = {'team': game.get(team_key, {}), 'players': players}
+        return {'teams': teams}
+
+    def get_play_by_play(self, game_pk: int) -> Optional[dict]:
+        game = self.games.get(game_pk)
+        if game is None:
+            return None
+        plays = []
+        for at_bat in game.get('atBats', []):
+            plays.append({
+                'result': {
+                    'event': at_bat.get('result'),
+                    'eventType': at_bat.get('eventType'),
+                    'description': at_bat.get('description', ''),
+                    'rbi': at_bat.get('rbi', 0),
+                    'isOut': OUTS_BY_EVENT.get(at_bat.get('eventType'), 0) > 0,
+                },
+                'matchup': {
+                    'batter': self.person(at_bat['batterId']),
+                    'batSide': {'code': at_bat.get('batterHand')},
+                    'pitcher': self.person(at_bat['pitcherId']) if at_bat.get('pitcherId') else {},
+                    'pitchHand': {'code': at_bat.get('pitcherHand')},
+                },
+                'playEvents': at_bat_pitches(at_bat),
+            })
+        return {'allPlays': plays}
+
+    def game_split(self, player_id: int, game: dict, line: dict, team_league: bool = False) -> dict:
+        side = self.sides[game['gamePk']].get(player_id, 'away')
+        team = game.get('awayTeam' if side == 'away' else 'homeTeam', {})
+        opponent = game.get('homeTeam' if side == 'away' else 'awayTeam', {})
+        team = dict(self.teams.get(team.get('id'), team))
+        if team_league:
+            team['league'] = {'abbreviation': LEAGUE_ABBREVIATIONS.get(game.get('level'), '')}
+        split = {
+            'date': game.get('date'),
+            'game': {'gamePk': game['gamePk']},
+            'team': team,
+            'opponent': opponent,
+            'isHome': side == 'home',
+            'sport': {'id': MILB_SPORT_IDS.get(game.get('level'), 0)},
+            'stat': line,
+        }
+        if self.league_only:
+            del split['sport']
+            team.pop('sport', None)
+        return split
+
+    def get_person_stats(self, player_id: int, params: dict) -> dict:
+        stat_types = params.get('stats', ['season,gameLog'])[0].split(',')
+        groups = params.get('group', ['hitting'])[0].split(',')
+        start_date = params.get('startDate', [''])[0]
+        end_date = params.get('endDate', [''])[0]
+        team_league = 'team(league)' in params.get('hydrate', [''])[0]
+
+        stats = []
+        for group in groups:
+            build_line = batting_line if group == 'hitting' else pitching_line
+            games = sorted(self.player_games.get((player_id, group), []), key=lambda item: item[0].get('date', ''))
+            if start_date or end_date:
+                games = [(game, at_bats) for game, at_bats in games
+                         if (not start_date or game.get('date', '') >= start_date)
+                         and (not end_date or game.get('date', '') <= end_date)]
+            logs = [self.game_split(player_id, game, build_line(at_bats), team_league) for game, at_bats in games]
+            for stat_type in stat_types:
+                if stat_type == 'gameLog':
+                    splits = logs
+                elif stat_type == 'season':
+                    splits = [{'stat': sum_lines([log['stat'] for log in logs])}] if logs else []
+                else:
+                    continue
+                stats.append({'type': {'displayName': stat_type}, 'group': {'displayName': group},
+                              'splits': splits})
+        return {'stats': stats}
+
+    def get_people(self, params: dict) -> dict:
+        """People of personIds, with the stats of a stats(group=[...],type=[...]) hydrate."""
+        person_ids = [int(pid) for pid in params.get('personIds', [''])[0].split(',') if pid.isdigit()]
+        hydrate = params.get('hydrate', [''])[0]
+        stats_params = None
+        # Options may nest one level of parentheses, e.g. hydrate=team(league)
+        match = re.search(r'stats\(((?:[^()]|\([^()]*\))*)\)', hydrate)
+        if match:
+            options = dict(re.findall(r'(\w+)=(\[[^\]]*\]|[^,]*)', match.group(1)))
+            stats_params = {
+                'stats': [options.get('type', 'season,gameLog').strip('[]')],
+                'group': [options.get('group', 'hitting').strip('[]')],
+            }
+            for key in ('startDate', 'endDate', 'hydrate'):
+                if key in options:
+                    stats_params[key] = [options[key]]
+
+        people = []
+        for player_id in person_ids:
+            entry = self.person(player_id)
+            if stats_params:
+                stats = [block for block in self.get_person_stats(player_id, stats_params)['stats'] if block['splits']]
+                if stats:
+                    entry['stats'] = stats
+            people.append(entry)
+        return {'people': people}
+
+    def get_teams(self, params: dict) -> dict:
+        sport_ids = {int(sport_id) for sport_id in params.get('sportId', ['0'])[0].split(',') if sport_id.isdigit()}
+        hydrate = params.get('hydrate', [''])[0]
+        teams = []
+        for team in self.teams.values():
+            if team['sport']['id'] not in sport_ids:
+                continue
+            entry = dict(team)
+            if hydrate.startswith('roster'):
+                entry['roster'] = {'roster': self.roster_entries(team['id'])}
+            teams.append(entry)
+        return {'teams': teams}
+
+    def roster_entries(self, team_id: int) -> list[dict]:
+        return [{'person': self.person(player_id)} for player_id in sorted(self.rosters.get(team_id, ()))]
+
+    def respond(self, path: str, params: dict) -> Optional[dict]:
+        """Response for an API path (without the /api/v1 prefix), or None for 404."""
+        parts = [part for part in path.split('/') if part]
+        if parts == ['schedule']:
+            return self.get_schedule(params)
+        if parts == ['teams']:
+            return self.get_teams(params)
+        if len(parts) == 3 and parts[0] == 'teams' and parts[2] == 'roster' and parts[1].isdigit():
+            return {'roster': self.roster_entries(int(parts[1]))}
+        if len(parts) == 3 and parts[0] == 'game' and parts[1].isdigit():
+            if parts[2] == 'boxscore':
+                return self.get_boxscore(int(parts[1]))
+            if parts[2] == 'playByPlay':
+                return self.get_play_by_play(int(parts[1]))
+        if parts == ['people']:
+            return self.get_people(params)
+        if len(parts) == 3 and parts[0] == 'people' and parts[2] == 'stats' and parts[1].isdigit():
+            return self.get_person_stats(int(parts[1]), params)
+        return None
+
+    def respond_bytes(self, path: str, query: str) -> Optional[bytes]:
+        """Serialized response, cached per path and query."""
+        key = f'{path}?{query}'
+        with self.cache_lock:
+            body = self.cache.get(key)
+        if body is None:
+            data = self.respond(path, parse_qs(query))
+            if data is None:
+                return None
+            body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+            with self.cache_lock:
+                self.cache[key] = body
+        return body
+
+
+class StandInServer:
+    """Threaded HTTP server replaying ReplayData with injected faults."""
+
+    def __init__(self, data: ReplayData, faults: FaultConfig, host: str = '127.0.0.1', port: int = DEFAULT_PORT):
+        self.data = data
+        self.faults = faults
+        self.log = RequestLog()
+        self.httpd = ThreadingHTTPServer((host, port), self.make_handler())
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}/api/v1'
+
+    def make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                started = time.perf_counter()
+                url = urlparse(self.path)
+                path = url.path[len('/api/v1'):] if url.path.startswith('/api/v1') else url.path
+                endpoint = endpoint_class(path)
+
+                headers = {}
+                if server.faults.should_throttle():
+                    status, body = 429, b'{"message":"Too Many Requests"}'
+                    headers['Retry-After'] = str(server.faults.retry_after)
+                else:
+                    time.sleep(server.faults.delay())
+                    if server.faults.should_fail():
+                        status, body = 503, b'{"message":"Service Unavailable"}'
+                    else:
+                        body = server.data.respond_bytes(path, url.query)
+                        status = 200 if body is not None else 404
+                        if body is None:
+                            body = b'{"message":"Not Found"}'
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                server.log.record(endpoint, status, time.perf_counter() - started, len(body))
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+    def start(self) -> None:
+        """Serve in a background thread."""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Stand-in MLB Stats API listening at {self.base_url}")
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def date_range(start: str, end: str) -> list[str]:
+    """Dates from start to end inclusive, as YYYY-MM-DD strings."""
+    current = datetime.strptime(start, '%Y-%m-%d')
+    last = datetime.strptime(end, '%Y-%m-%d')
+    dates = []
+    while current <= last:
+        dates.append(current.strftime('%Y-%m-%d'))
+        current += timedelta(days=1)
+    return dates
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Latency/error/throttling options shared with benchmark_fetch.py."""
+    parser.add_argument('--latency', type=float, default=20, help='Base response latency in ms (default: 20)')
+    parser.add_argument('--jitter', type=float, default=10, help='Uniform latency jitter in ms, +/- (default: 10)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--throttle-rps', type=float, default=0.0,
+                        help='Answer 429 above this many requests/sec (default: no throttling)')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for jitter and errors')
+
+
+def faults_from_args(args: argparse.Namespace) -> FaultConfig:
+    return FaultConfig(args.latency, args.jitter, args.error_rate, args.throttle_rps, args.retry_after, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the MLB Stats API, replaying data/pbp')
+    parser.add_argument('--start', type=str, required=True, help='First date to replay (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, default=None, help='Last date to replay (default: --start)')
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--league-only', action='store_true',
+                        help='Leave the sport out of stats splits, so only the hydrated team league gives the level')
+    add_fault_arguments(parser)
+    parser.add_argument('--debug', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    data = ReplayData(date_range(args.start, args.end or args.start), args.league_only)
+    server = StandInServer(data, faults_from_args(args), args.host, args.port)
+    server.start()
+    started = time.perf_counter()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        logger.info(json.dumps(server.log.summary(time.perf_counter() - started), indent=2))
+
+
+if __name__ == '__main__':
+    main()
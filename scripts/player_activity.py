@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Incremental player activity summary for the monthly stats files.
+
+Keeps a small summary of every player seen in data/stats/{year}/{month}.json:
+  data/stats/activity.json - player -> last game date, seasons active, last team/level,
+                             months played (with each month's last game date),
+                             plus per-month player counts
+
+The stats writers replace the contribution of just the month they save, so
+readers (build_player_index.py, meta.json maintenance) don't need to rescan
+every monthly stats file. If the summary is missing or from an older version
+it is rebuilt from a full scan.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from data_writer import write_json
+
+logger = logging.getLogger(__name__)
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+STATS_DIR = DATA_DIR / 'stats'
+ACTIVITY_FILE = STATS_DIR / 'activity.json'
+
+# Bumped when the entry layout changes; summaries of an older version are rebuilt
+SUMMARY_VERSION = 2
+
+# Entry fields taken from the player's latest month
+SOURCE_FIELDS = ('lastGameDate', 'team', 'level', 'type', 'info')
+
+# Summary most recently loaded or written by this process, so callers that
+# update the summary and then read it back (e.g. meta.json) don't re-parse it
+_summary_cache: Optional[dict] = None
+
+
+def month_key(year: int, month: int) -> str:
+    return f'{year}-{month:02d}'
+
+
+def summarize_player_month(player_data: dict, year: int, month: int) -> Optional[dict]:
+    """
+    Summarize one player's monthly stats entry as an activity entry for that month alone.
+
+    Returns None if the entry has neither dated games nor a legacy info block.
+    """
+    last_log = None
+    for log_key in ('battingGameLog', 'pitchingGameLog'):
+        for log in player_data.get(log_key, []):
+            game_date = log.get('date', '')
+            if game_date and (last_log is None or game_date > last_log['date']):
+                last_log = log
+
+    # Legacy stats files may carry an explicit info block instead of game logs
+    info = player_data.get('info')
+    if last_log is None and not info:
+        return None
+
+    entry = {
+        'months': {month_key(year, month): last_log['date'] if last_log else ''},
+        'years': [year] if last_log else [],
+        'type': player_data.get('type', 'batter'),
+    }
+    if last_log:
+        entry['lastGameDate'] = last_log['date']
+        entry['team'] = last_log.get('team', 'Unknown')
+        entry['level'] = last_log.get('level', 'Unknown')
+    if info:
+        entry['info'] = info
+    return entry
+
+
+def set_source_fields(entry: dict, source: dict) -> None:
+    """Take the fields describing the player's latest month from that month's summary."""
+    for key in SOURCE_FIELDS:
+        if key in source:
+            entry[key] = source[key]
+        else:
+            entry.pop(key, None)
+
+
+def latest_month(entry: dict) -> str:
+    """The month the player's latest game falls in (the last month if none is dated)."""
+    return max(entry['months'], key=lambda key: (entry['months'][key], key))
+
+
+def years_active(entry: dict) -> list[int]:
+    """Years of the months in which the player has dated games."""
+    return sorted({int(key[:4]) for key, last_date in entry['months'].items() if last_date})
+
+
+def refresh_from_month_files(players: dict, player_ids: list[str]) -> None:
+    """
+    Recompute the latest-month fields of players from their stats files.
+
+    Needed when the month those fields came from was rewritten without the
+    player or with an earlier last game; each month file is read once.
+    """
+    by_month = {}
+    for player_id in player_ids:
+        by_month.setdefault(latest_month(players[player_id]), []).append(player_id)
+
+    for key, month_player_ids in by_month.items():
+        year, month = int(key[:4]), int(key[5:])
+        month_file = STATS_DIR / str(year) / f'{month:02d}.json'
+        try:
+            with open(month_file) as f:
+                month_players = json.load(f).get('players', {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to read {month_file}: {e}")
+            continue
+        for player_id in month_player_ids:
+            source = summarize_player_month(month_players.get(player_id, {}), year, month)
+            if source:
+                set_source_fields(players[player_id], source)
+
+
+def load_activity_summary() -> Optional[dict]:
+    """Load the activity summary file, or None if it doesn't exist or is unreadable."""
+    if not ACTIVITY_FILE.exists():
+        return None
+    try:
+        with open(ACTIVITY_FILE) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Failed to read {ACTIVITY_FILE}: {e}")
+        return None
+
+
+def save_activity_summary(summary: dict) -> None:
+    """Save the activity summary file."""
+    global _summary_cache
+
+    summary['version'] = SUMMARY_VERSION
+    summary['updated'] = datetime.now().isoformat()
+    write_json(ACTIVITY_FILE, summary)
+    _summary_cache = summary
+
+
+def apply_month_players(summary: dict, month_players: dict, year: int, month: int) -> int:
+    """
+    Replace one month's contribution to the summary in place. Returns players summarized.
+
+    Players the month previously had but no longer has lose it (and are
+    dropped once they have no months left), so a month file rewritten with
+    fewer players or games brings the summary and its counts down too.
+    """
+    players = summary.setdefault('players', {})
+    key = month_key(year, month)
+    refresh = []
+
+    month_entries = {}
+    for player_id, player_data in month_players.items():
+        entry = summarize_player_month(player_data, year, month)
+        if entry:
+            month_entries[player_id] = entry
+
+    # Players the rewritten month no longer has
+    dropped = [pid for pid, entry in players.items() if key in entry['months'] and pid not in month_entries]
+    for player_id in dropped:
+        entry = players[player_id]
+        was_latest = latest_month(entry) == key
+        del entry['months'][key]
+        if not entry['months']:
+            del players[player_id]
+            continue
+        entry['years'] = years_active(entry)
+        if was_latest:
+            refresh.append(player_id)
+
+    for player_id, month_entry in month_entries.items():
+        entry = players.get(player_id)
+        if entry is None:
+            players[player_id] = month_entry
+            continue
+        was_latest = key in entry['months'] and latest_month(entry) == key
+        entry['months'][key] = month_entry['months'][key]
+        entry['years'] = years_active(entry)
+        if latest_month(entry) == key:
+            set_source_fields(entry, month_entry)
+        elif was_latest:
+            # The month the latest fields came from now ends earlier than another month
+            refresh.append(player_id)
+
+    if refresh:
+        refresh_from_month_files(players, refresh)
+
+    # Per-month player counts, replaced wholesale for the month just applied
+    counts = summary.setdefault('monthPlayerCounts', {})
+    if month_entries:
+        counts[key] = len(month_entries)
+    else:
+        counts.pop(key, None)
+    return len(month_entries)
+
+
+def rebuild_activity_summary() -> dict:
+    """Rebuild the activity summary by scanning every monthly stats file."""
+    summary = {'players': {}}
+
+    if not STATS_DIR.exists():
+        logger.warning(f"Stats directory not found: {STATS_DIR}")
+        return summary
+
+    for year_dir in sorted(STATS_DIR.iterdir()):
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+
+        year = int(year_dir.name)
+        for month_file in sorted(year_dir.glob('[0-9][0-9].json')):
+            try:
+                with open(month_file) as f:
+                    data = json.load(f)
+                apply_month_players(summary, data.get('players', {}), year, int(month_file.stem))
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to read {month_file}: {e}")
+
+    save_activity_summary(summary)
+    logger.info(f"Rebuilt activity summary for {len(summary['players'])} players")
+    return summary
+
+
+def get_activity_summary() -> dict:
+    """Load the activity summary, rebuilding it from the stats files if missing."""
+    global _summary_cache
+
+    if _summary_cache is not None:
+        return _summary_cache
+
+    summary = load_activity_summary()
+    if summary is None:
+        logger.info("No activity summary found, rebuilding from stats files...")
+        summary = rebuild_activity_summary()
+    elif summary.get('version') != SUMMARY_VERSION:
+        logger.info("Activity summary is from an older version, rebuilding from stats files...")
+        summary = rebuild_activity_summary()
+    _summary_cache = summary
+    return summary
+
+
+def update_activity_summary(month_players: dict, year: int, month: int) -> dict:
+    """Update the activity summary with the players from a month file just written."""
+    summary = get_activity_summary()
+    count = apply_month_players(summary, month_players, year, month)
+    save_activity_summary(summary)
+    logger.info(f"Updated activity summary for {count} players ({len(summary['players'])} total)")
+    return summary
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Profiling of a whole script run, enabled with --profile (see instrumentation.py).
+
+Two profilers, both covering every thread of the run:
+  --profile / --profile cprofile - deterministic cProfile; each thread started
+      during the run gets its own profiler and the results are merged
+  --profile sample - a stack sampler that records every thread's stack each
+      SAMPLE_INTERVAL seconds; much lower overhead on the threaded fetchers
+
+Stages wrapped in track_allocations() are also traced with tracemalloc while
+profiling, recording their peak traced memory and the source lines with the
+largest net allocations.
+
+Output is written next to the run report:
+  runs/{YYYY-MM-DD}-{script}.prof         - pstats dump (cprofile; snakeviz, pstats)
+  runs/{YYYY-MM-DD}-{script}.folded       - collapsed stacks (sample; speedscope, flamegraph.pl)
+  runs/{YYYY-MM-DD}-{script}.profile.txt  - top functions and the allocation report
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ['cprofile', 'sample']
+
+SAMPLE_INTERVAL = 0.005  # Seconds between stack samples
+TOP_FUNCTIONS = 40  # Functions listed in the text report
+TOP_ALLOCATIONS = 15  # Source lines listed per tracked stage
+TRACEMALLOC_FRAMES = 1
+
+
+class CProfileRunner:
+    """cProfile of the main thread plus one profiler per thread started while running."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.main = cProfile.Profile()
+        self.threads: list[cProfile.Profile] = []
+
+    def thread_hook(self, frame, event, arg):
+        # First profile event of a new thread: replace this hook with a cProfile for the thread
+        profiler = cProfile.Profile()
+        with self.lock:
+            self.threads.append(profiler)
+        profiler.enable()
+
+    def start(self) -> None:
+        threading.setprofile(self.thread_hook)
+        self.main.enable()
+
+    def stop(self) -> pstats.Stats:
+        self.main.disable()
+        threading.setprofile(None)
+        stats = pstats.Stats(self.main)
+        with self.lock:
+            for profiler in self.threads:
+                # Threads still running are cut off at this point
+                profiler.create_stats()
+                stats.add(profiler)
+        return stats
+
+
+class StackSampler:
+    """Samples the stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f'{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+    def folded(self) -> str:
+        """Collapsed stacks, one `frame;frame;... count` line per distinct stack."""
+        return ''.join(f'{stack} {n}\n' for stack, n in self.stacks.most_common())
+
+    def top_functions(self, limit: int = TOP_FUNCTIONS) -> str:
+        """Functions by samples on top of a stack (self) and anywhere in it (total)."""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, n in self.stacks.items():
+            frames = stack.split(';')
+            own[frames[-1]] += n
+            for frame in set(frames):
+                total[frame] += n
+        samples = sum(self.stacks.values()) or 1
+        lines = [f"{self.samples} sampling rounds every {self.interval * 1000:.0f}ms, {samples} thread stacks",
+                 '', f"{'self %':>8}{'total %':>9}  function"]
+        for frame, n in own.most_common(limit):
+            lines.append(f'{100 * n / samples:>8.1f}{100 * total[frame] / samples:>9.1f}  {frame}')
+        return '\n'.join(lines) + '\n'
+
+
+class RunProfiler:
+    """Profiler and allocation tracker of one run."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.runner = CProfileRunner() if mode == 'cprofile' else StackSampler()
+        self.allocations: dict[str, dict] = {}
+        self.report = ''
+
+    def start(self) -> None:
+        self.runner.start()
+
+    def stop(self, base_path: Path) -> list[Path]:
+        """
+        Stop profiling and write the output files.
+
+        Args:
+            base_path: Output path without suffix (runs/{date}-{script})
+
+        Returns:
+            Paths written
+        """
+        written = []
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.mode == 'cprofile':
+            stats = self.runner.stop()
+            prof_path = base_path.with_name(base_path.name + '.prof')
+            stats.dump_stats(prof_path)
+            written.append(prof_path)
+            text = io.StringIO()
+            stats.stream = text
+            stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            stats.sort_stats('tottime').print_stats(TOP_FUNCTIONS)
+            self.report = text.getvalue()
+        else:
+            self.runner.stop()
+            folded_path = base_path.with_name(base_path.name + '.folded')
+            folded_path.write_text(self.runner.folded())
+            written.append(folded_path)
+            self.report = self.runner.top_functions()
+
+        text_path = base_path.with_name(base_path.name + '.profile.txt')
+        text_path.write_text(self.report + self.allocation_report())
+        written.append(text_path)
+        return written
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[None]:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+            top = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')[:TOP_ALLOCATIONS]
+            self.allocations.setdefault(stage, {'calls': 0, 'seconds': 0.0, 'peakMB': 0.0, 'top': []})
+            entry = self.allocations[stage]
+            entry['calls'] += 1
+            entry['seconds'] = round(entry['seconds'] + time.perf_counter() - started, 3)
+            entry['peakMB'] = max(entry['peakMB'], round(peak / 1e6, 1))
+            entry['top'] = [{
+                'where': f'{Path(diff.traceback[0].filename).name}:{diff.traceback[0].lineno}',
+                'sizeKB': round(diff.size_diff / 1024),
+                'count': diff.count_diff,
+            } for diff in top]
+
+    def allocation_report(self) -> str:
+        lines = []
+        for stage, entry in self.allocations.items():
+            lines.append(f"\ntracemalloc {stage}: {entry['calls']} call(s), {entry['seconds']:.1f}s, "
+                         f"peak {entry['peakMB']:.1f} MB; largest net allocations (last call):")
+            for alloc in entry['top']:
+                lines.append(f"  {alloc['sizeKB']:>10} KB {alloc['count']:>9} blocks  {alloc['where']}")
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+_profiler: Optional[RunProfiler] = None
+
+
+def start_profiling(mode: str) -> RunProfiler:
+    """Start profiling the run with a mode from PROFILE_MODES."""
+    global _profiler
+    _profiler = RunProfiler(mode)
+    _profiler.start()
+    logger.info(f"Profiling with {mode}")
+    return _profiler
+
+
+def stop_profiling(base_path: Path) -> Optional[RunProfiler]:
+    """Stop profiling and write the output files next to the run report."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler:
+        for path in profiler.stop(base_path):
+            logger.info(f"Profile written to {path}")
+    return profiler
+
+
+@contextmanager
+def track_allocations(stage: str) -> Iterator[None]:
+    """Trace a stage's allocations with tracemalloc while the run is being profiled."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.track(stage):
+        yield
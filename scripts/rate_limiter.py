@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Adaptive rate limiting shared by the fetch scripts.
+
+Every request a script sends to an upstream (the MLB Stats API, Baseball
+Savant) goes through that upstream's AdaptiveRateLimiter, shared by all of
+the script's threads (get_limiter):
+  - AIMD: the request rate and the number of requests in flight grow while
+    responses succeed and are halved on a 429, a 5xx or a transport error (at
+    most once per DECREASE_INTERVAL, so a burst of failures from requests
+    already in flight counts as one event). Like TCP, the rate starts in slow
+    start, doubling about once a second, until the first decrease; from then
+    on it grows additively
+  - A Retry-After header pauses every request until it has passed
+  - Retries back off exponentially with full jitter (or wait Retry-After)
+  - After FAILURE_THRESHOLD consecutive failures the circuit opens: nothing
+    is sent for COOLDOWN seconds, then a single probe request decides whether
+    it closes again. After MAX_TRIPS opens in a row without a success the
+    upstream is considered down and acquire() raises CircuitOpenError, so
+    the run fails fast instead of retrying for hours.
+
+Usage:
+    limiter = get_limiter('statsapi')
+    for attempt in range(MAX_RETRIES):
+        limiter.acquire()
+        ... send the request ...
+        limiter.release(status, retry_after)
+        if not is_retryable(status):
+            break
+        time.sleep(limiter.backoff(attempt, retry_after))
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from instrumentation import count
+
+logger = logging.getLogger(__name__)
+
+# AIMD
+DEFAULT_RATE = 50.0  # Initial request starts per second
+MIN_RATE = 0.5
+MAX_RATE = 200.0
+RATE_INCREASE = 2.0  # Requests/sec added per second of successful requests, after slow start
+DECREASE_FACTOR = 0.5  # Rate and concurrency multiplier on a 429/5xx/transport error
+DECREASE_INTERVAL = 1.0  # Minimum seconds between two decreases
+MAX_CONCURRENCY = 64
+
+# Retries
+BASE_DELAY = 0.5  # Backoff ceiling of the first retry, doubled per attempt
+MAX_DELAY = 60.0
+MAX_RETRY_AFTER = 300.0  # Longest Retry-After honoured
+
+# Circuit breaker
+FAILURE_THRESHOLD = 20  # Consecutive failures that open the circuit
+COOLDOWN = 30.0  # Seconds the circuit stays open before a probe
+MAX_TRIPS = 3  # Consecutive opens before failing fast
+
+# Per-upstream settings for get_limiter()
+UPSTREAMS = {
+    'statsapi': {'rate': DEFAULT_RATE},
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised by acquire() once an upstream has kept failing through MAX_TRIPS cooldowns."""
+
+
+def is_failure(status) -> bool:
+    """Whether a request outcome signals an overloaded or failing upstream.
+
+    Args:
+        status: HTTP status code, or the exception name for transport errors
+    """
+    if isinstance(status, str):
+        return True
+    return status == 429 or status >= 500
+
+
+def is_retryable(status) -> bool:
+    """Whether a request with this outcome is worth retrying."""
+    return is_failure(status)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD limiter with Retry-After pauses and a circuit breaker."""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = DEFAULT_RATE,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            name: Upstream name, used in log lines and metrics
+            rate: Initial request starts per second
+            min_rate: Floor of the rate after decreases
+            max_rate: Ceiling of the rate after increases
+            max_concurrency: Ceiling of the requests in flight
+        """
+        self.name = name
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+
+        self.cond = threading.Condition()
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.slow_start = True
+
+        self.state = 'closed'
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def acquire(self) -> None:
+        """
+        Block until a request may start.
+
+        Raises:
+            CircuitOpenError: If the upstream is considered down
+        """
+        waited_from = time.monotonic()
+        with self.cond:
+            while True:
+                if self.trips >= MAX_TRIPS:
+                    raise CircuitOpenError(f"{self.name} failed through {MAX_TRIPS} circuit cooldowns")
+                now = time.monotonic()
+                if self.state == 'open':
+                    if now < self.open_until:
+                        self.cond.wait(self.open_until - now)
+                        continue
+                    self.state = 'half-open'
+                if self.state == 'half-open' and self.probing:
+                    self.cond.wait()
+                    continue
+                if now < self.paused_until:
+                    self.cond.wait(self.paused_until - now)
+                    continue
+                if self.in_flight >= max(1, int(self.concurrency)):
+                    self.cond.wait()
+                    continue
+                break
+
+            self.in_flight += 1
+            if self.state == 'half-open':
+                self.probing = True
+            start = max(now, self.next_start)
+            self.next_start = start + 1.0 / self.rate
+
+        if start > now:
+            time.sleep(start - now)
+        count(f'limiter.{self.name}.wait_seconds', time.monotonic() - waited_from)
+
+    def release(self, status, retry_after: Optional[float] = None) -> None:
+        """
+        Report the outcome of a request started with acquire().
+
+        Args:
+            status: HTTP status code, or the exception name for transport errors
+            retry_after: Seconds from the response's Retry-After header
+        """
+        with self.cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            probe = self.probing and self.state == 'half-open'
+            if probe:
+                self.probing = False
+
+            if is_failure(status):
+                self.failures += 1
+                if retry_after:
+                    self.paused_until = max(self.paused_until, now + retry_after)
+                if now - self.last_decrease >= DECREASE_INTERVAL:
+                    self.last_decrease = now
+                    self.slow_start = False
+                    self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+                    self.concurrency = max(1.0, self.concurrency * DECREASE_FACTOR)
+                    count(f'limiter.{self.name}.decreases')
+                if probe or (self.state == 'closed' and self.failures >= FAILURE_THRESHOLD):
+                    self.open_circuit(now)
+            else:
+                self.failures = 0
+                self.trips = 0
+                if probe:
+                    self.state = 'closed'
+                    logger.info(f"{self.name}: circuit closed")
+                increase = 1.0 if self.slow_start else RATE_INCREASE / self.rate
+                self.rate = min(self.max_rate, self.rate + increase)
+                self.concurrency = min(float(self.max_concurrency), self.concurrency + 1.0 / self.concurrency)
+
+            self.cond.notify_all()
+
+    def open_circuit(self, now: float) -> None:
+        """Stop sending requests for COOLDOWN seconds (caller holds the lock)."""
+        self.state = 'open'
+        self.trips += 1
+        self.open_until = now + COOLDOWN
+        count(f'limiter.{self.name}.circuit_opens')
+        logger.warning(f"{self.name}: {self.failures} consecutive failures, circuit open for {COOLDOWN:.0f}s "
+                       f"(trip {self.trips}/{MAX_TRIPS})")
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait before retrying.
+
+        Args:
+            attempt: Zero-based attempt that just failed
+            retry_after: Seconds from the response's Retry-After header, honoured if given
+        """
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2 ** attempt))
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, **settings) -> AdaptiveRateLimiter:
+    """
+    Get the process-wide limiter of an upstream, creating it on first use.
+
+    Args:
+        name: Upstream name ('statsapi', 'savant', ...)
+        settings: AdaptiveRateLimiter arguments, overriding UPSTREAMS[name]
+            (only used when the limiter is created)
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = AdaptiveRateLimiter(name, **{**UPSTREAMS.get(name, {}), **settings})
+        return _limiters[name]
@@ -13,6 +13,8 @@ from pathlib import Path
 
 from mlbstatsapi import Mlb
 
+from instrumentation import add_run_arguments, count, run_report
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -253,79 +255,82 @@ def main():
     parser.add_argument('--output', type=str, help='Output file path (default: stdout)')
     parser.add_argument('--format', choices=['json', 'table'], default='json',
                         help='Output format')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
 
     if not args.name and not args.team and not args.level:
         parser.error("At least one of --name, --team, or --level is required")
 
-    results = []
+    with run_report('search_players', args):
+        results = []
+
+        if args.use_api:
+            # Search via MLB Stats API
+            mlb = Mlb()
+
+            if args.name:
+                results = search_player_by_name(mlb, args.name)
+            elif args.team:
+                results = get_players_by_team(mlb, args.team, args.year)
+            elif args.level:
+                results = get_players_by_level(mlb, args.level, args.year)
+
+            # Apply additional filters
+            if args.name and (args.team or args.level):
+                name_lower = args.name.lower()
+                results = [r for r in results if name_lower in r.get('name', '').lower()]
 
-    if args.use_api:
-        # Search via MLB Stats API
-        mlb = Mlb()
-
-        if args.name:
-            results = search_player_by_name(mlb, args.name)
-        elif args.team:
-            results = get_players_by_team(mlb, args.team, args.year)
-        elif args.level:
-            results = get_players_by_level(mlb, args.level, args.year)
-
-        # Apply additional filters
-        if args.name and (args.team or args.level):
-            name_lower = args.name.lower()
-            results = [r for r in results if name_lower in r.get('name', '').lower()]
-
-        if args.team and args.level:
-            team_lower = args.team.lower()
-            results = [r for r in results if team_lower in r.get('team', '').lower()]
-
-        if args.position:
-            pos_upper = args.position.upper()
-            results = [r for r in results if r.get('position', '').upper() == pos_upper]
-
-    else:
-        # Search local index
-        results = search_index(
-            name=args.name,
-            team=args.team,
-            level=args.level,
-            position=args.position
-        )
-
-    # Deduplicate by mlbId
-    seen = set()
-    unique_results = []
-    for player in results:
-        pid = player.get('mlbId', player.get('fangraphsId', ''))
-        if pid and pid not in seen:
-            seen.add(pid)
-            unique_results.append(player)
-    results = unique_results
-
-    logger.info(f"Found {len(results)} players")
-
-    # Output results
-    if args.format == 'json':
-        output = json.dumps(results, indent=2)
-    else:
-        # Table format
-        if results:
-            header = ['mlbId', 'name', 'team', 'level', 'position']
-            lines = ['\t'.join(header)]
-            for p in results:
-                lines.append('\t'.join([str(p.get(h, '')) for h in header]))
-            output = '\n'.join(lines)
+            if args.team and args.level:
+                team_lower = args.team.lower()
+                results = [r for r in results if team_lower in r.get('team', '').lower()]
+
+            if args.position:
+                pos_upper = args.position.upper()
+                results = [r for r in results if r.get('position', '').upper() == pos_upper]
+
+        else:
+            # Search local index
+            results = search_index(
+                name=args.name,
+                team=args.team,
+                level=args.level,
+                position=args.position
+            )
+
+        # Deduplicate by mlbId
+        seen = set()
+        unique_results = []
+        for player in results:
+            pid = player.get('mlbId', player.get('fangraphsId', ''))
+            if pid and pid not in seen:
+                seen.add(pid)
+                unique_results.append(player)
+        results = unique_results
+
+        count('players_found', len(results))
+        logger.info(f"Found {len(results)} players")
+
+        # Output results
+        if args.format == 'json':
+            output = json.dumps(results, indent=2)
+        else:
+            # Table format
+            if results:
+                header = ['mlbId', 'name', 'team', 'level', 'position']
+                lines = ['\t'.join(header)]
+                for p in results:
+                    lines.append('\t'.join([str(p.get(h, '')) for h in header]))
+                output = '\n'.join(lines)
+            else:
+                output = "No players found"
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output)
+            logger.info(f"Results written to {args.output}")
         else:
-            output = "No players found"
-
-    if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output)
-        logger.info(f"Results written to {args.output}")
-    else:
-        print(output)
+            print(output)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Columnar archive of raw Statcast pitch rows, so monthly aggregates can be rebuilt offline.
+
+Rows fetched from Baseball Savant are kept per month, level and player type:
+  data/statcast/raw/{year}/{month}/{level}-{player_type}.bin.gz
+
+Each partition stores one typed array per column. Numeric columns are float64
+with NaN for missing values, ids are int32 with 0 for missing, and text columns
+(pitch types, descriptions, names, ...) are dictionary-encoded as uint16/uint32
+codes into a per-partition list of distinct values.
+
+File layout (gzip-compressed):
+  4-byte little-endian header length, JSON header, then each column's bytes in
+  header order.
+
+The archive is a local working set, not published data: it is ignored by git,
+left out of the Pages deploy, and carried between workflow runs in an Actions
+cache.
+"""
+
+import gzip
+import json
+import logging
+import math
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Paths
+DATA_DIR = Path(__file__).parent.parent / 'data'
+ARCHIVE_DIR = DATA_DIR / 'statcast' / 'raw'
+
+ARCHIVE_VERSION = 1
+
+# Archived columns: name -> kind ('int', 'float' or 'dict')
+ARCHIVE_COLUMNS = {
+    # Identity
+    'game_date': 'dict',
+    'game_pk': 'int',
+    'batter': 'int',
+    'pitcher': 'int',
+    'player_name': 'dict',
+    'stand': 'dict',
+    'p_throws': 'dict',
+    'home_team': 'dict',
+    'away_team': 'dict',
+    'inning': 'float',
+    'at_bat_number': 'float',
+    'pitch_number': 'float',
+    'balls': 'float',
+    'strikes': 'float',
+    # Pitch result
+    'description': 'dict',
+    'events': 'dict',
+    'type': 'dict',
+    'zone': 'float',
+    # Pitch characteristics
+    'pitch_type': 'dict',
+    'release_speed': 'float',
+    'release_spin_rate': 'float',
+    'release_extension': 'float',
+    'pfx_x': 'float',
+    'pfx_z': 'float',
+    'plate_x': 'float',
+    'plate_z': 'float',
+    'sz_top': 'float',
+    'sz_bot': 'float',
+    # Batted ball
+    'bb_type': 'dict',
+    'launch_speed': 'float',
+    'launch_angle': 'float',
+    'hit_distance_sc': 'float',
+    'hc_x': 'float',
+    'hc_y': 'float',
+    'estimated_ba_using_speedangle': 'float',
+    'estimated_slg_using_speedangle': 'float',
+    'estimated_woba_using_speedangle': 'float',
+    'woba_value': 'float',
+    'woba_denom': 'float',
+}
+
+TYPECODES = {'int': 'i', 'float': 'd'}
+
+
+def _to_float(val) -> float:
+    """Convert a CSV value to float, NaN when missing or unparseable."""
+    if val is None or val == '' or val == 'null':
+        return math.nan
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def _to_int(val) -> int:
+    """Convert a CSV id value to int, 0 when missing or unparseable."""
+    if val is None or val == '' or val == 'null':
+        return 0
+    try:
+        return int(float(val))
+    except (ValueError, TypeError):
+        return 0
+
+
+class StatcastColumns:
+    """Typed, dictionary-encoded column buffers for a set of Statcast pitch rows."""
+
+    def __init__(self):
+        self.columns: dict[str, array] = {}
+        self.dictionaries: dict[str, list[str]] = {}
+        self._codes: dict[str, dict[str, int]] = {}
+        for name, kind in ARCHIVE_COLUMNS.items():
+            if kind == 'dict':
+                self.columns[name] = array('I')
+                self.dictionaries[name] = []
+                self._codes[name] = {}
+            else:
+                self.columns[name] = array(TYPECODES[kind])
+
+    def __len__(self) -> int:
+        return len(self.columns['game_date'])
+
+    def _code(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.dictionaries[name])
+            self.dictionaries[name].append(value)
+        return code
+
+    def append(self, rec: dict) -> None:
+        """Append one CSV row (column name -> string value)."""
+        for name, kind in ARCHIVE_COLUMNS.items():
+            val = rec.get(name)
+            if kind == 'dict':
+                self.columns[name].append(self._code(name, val or ''))
+            elif kind == 'int':
+                self.columns[name].append(_to_int(val))
+            else:
+                self.columns[name].append(_to_float(val))
+
+    def extend(self, other: 'StatcastColumns') -> None:
+        """Append all rows of another buffer, re-mapping its dictionary codes."""
+        for name, kind in ARCHIVE_COLUMNS.items():
+            if kind == 'dict':
+                remap = [self._code(name, value) for value in other.dictionaries[name]]
+                self.columns[name].extend(remap[code] for code in other.columns[name])
+            else:
+                self.columns[name].extend(other.columns[name])
+
+    def take(self, rows: list[int]) -> 'StatcastColumns':
+        """Copy of the given rows, in the given order."""
+        data = StatcastColumns()
+        for name, column in self.columns.items():
+            data.columns[name] = array(column.typecode, (column[i] for i in rows))
+        for name, values in self.dictionaries.items():
+            data.dictionaries[name] = list(values)
+            data._codes[name] = dict(self._codes[name])
+        return data
+
+    def without_dates(self, dates: set[str]) -> 'StatcastColumns':
+        """Copy of the rows whose game_date is not in `dates`."""
+        drop = {code for code, value in enumerate(self.dictionaries['game_date']) if value in dates}
+        return self.take([i for i, code in enumerate(self.columns['game_date']) if code not in drop])
+
+    def sorted_by_date(self) -> 'StatcastColumns':
+        """Copy with rows in game_date order (rows within a date keep their order)."""
+        values = self.dictionaries['game_date']
+        codes = self.columns['game_date']
+        return self.take(sorted(range(len(codes)), key=lambda i: values[codes[i]]))
+
+    def records(self, names: Optional[list[str]] = None) -> Iterator[dict]:
+        """
+        Yield rows as dicts shaped like parsed CSV rows.
+
+        Ids are strings, missing numbers are None and text columns are strings.
+
+        Args:
+            names: Columns to include (default: all archived columns)
+        """
+        names = [name for name in (names or ARCHIVE_COLUMNS) if name in ARCHIVE_COLUMNS]
+        decoders = []
+        for name in names:
+            kind = ARCHIVE_COLUMNS[name]
+            if kind == 'dict':
+                decoders.append(self.dictionaries[name].__getitem__)
+            elif kind == 'int':
+                decoders.append(lambda v: str(v) if v else '')
+            else:
+                decoders.append(lambda v: None if v != v else v)
+
+        for values in zip(*(self.columns[name] for name in names)):
+            yield {name: decode(v) for name, decode, v in zip(names, decoders, values)}
+
+
+def get_partition_path(year: int, month: int, level: str, player_type: str) -> Path:
+    """Path of the archive partition for a month, level and player type."""
+    return ARCHIVE_DIR / str(year) / f'{month:02d}' / f'{level}-{player_type}.bin.gz'
+
+
+def write_partition(year: int, month: int, level: str, player_type: str, data: StatcastColumns) -> Path:
+    """Write a month/level/player type partition, replacing any existing one."""
+    path = get_partition_path(year, month, level, player_type)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    header = {
+        'version': ARCHIVE_VERSION,
+        'year': year,
+        'month': month,
+        'level': level,
+        'playerType': player_type,
+        'rows': len(data),
+        'byteorder': sys.byteorder,
+        'columns': [],
+    }
+    blobs = []
+    for name, kind in ARCHIVE_COLUMNS.items():
+        column = data.columns[name]
+        entry = {'name': name, 'kind': kind}
+        if kind == 'dict':
+            values = data.dictionaries[name]
+            # Most dictionaries are small - store their codes in two bytes
+            if len(values) <= 0xFFFF:
+                column = array('H', column)
+            entry['values'] = values
+        entry['typecode'] = column.typecode
+        blob = column.tobytes()
+        entry['bytes'] = len(blob)
+        header['columns'].append(entry)
+        blobs.append(blob)
+
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    tmp_path = path.with_suffix('.tmp')
+    # No mtime or file name in the gzip header, so unchanged rows give identical bytes
+    with open(tmp_path, 'wb') as raw, gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as f:
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+    tmp_path.replace(path)
+
+    logger.debug(f"Archived {len(data)} rows to {path}")
+    return path
+
+
+def update_partition(year: int, month: int, level: str, player_type: str,
+                     data: StatcastColumns, dates: set[str]) -> Path:
+    """
+    Replace the rows for `dates` in a partition with `data`, keeping rows for other dates.
+
+    Rows are always stored in game_date order (download order within a date), the
+    same order in which day files are merged into month aggregates.
+    """
+    existing = read_partition(year, month, level, player_type)
+    if existing is None and not len(data):
+        return get_partition_path(year, month, level, player_type)
+    if existing is not None:
+        kept = existing.without_dates(dates)
+        kept.extend(data)
+        data = kept
+    return write_partition(year, month, level, player_type, data.sorted_by_date())
+
+
+def read_partition(year: int, month: int, level: str, player_type: str) -> Optional[StatcastColumns]:
+    """Read an archive partition, or None if it doesn't exist or is unreadable."""
+    path = get_partition_path(year, month, level, player_type)
+    if not path.exists():
+        return None
+
+    try:
+        with gzip.open(path, 'rb') as f:
+            (header_len,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_len))
+            data = StatcastColumns()
+            for entry in header['columns']:
+                column = array(entry['typecode'])
+                column.frombytes(f.read(entry['bytes']))
+                if header['byteorder'] != sys.byteorder:
+                    column.byteswap()
+
+                name = entry['name']
+                if name not in data.columns:
+                    continue
+                if entry['kind'] == 'dict':
+                    data.columns[name] = array('I', column)
+                    data.dictionaries[name] = entry['values']
+                    data._codes[name] = {value: code for code, value in enumerate(entry['values'])}
+                else:
+                    data.columns[name] = column
+    except (OSError, EOFError, ValueError, KeyError, struct.error) as e:
+        logger.warning(f"Failed to read {path}: {e}")
+        return None
+
+    # Columns added after the partition was written are filled as missing
+    rows = header['rows']
+    for name, kind in ARCHIVE_COLUMNS.items():
+        if len(data.columns[name]) == rows:
+            continue
+        if kind == 'dict':
+            data.columns[name] = array('I', [data._code(name, '')]) * rows
+        elif kind == 'int':
+            data.columns[name] = array('i', [0]) * rows
+        else:
+            data.columns[name] = array('d', [math.nan]) * rows
+
+    return data
+
+
+def list_archived_months(year: int) -> list[int]:
+    """Months of a season that have at least one archive partition."""
+    year_dir = ARCHIVE_DIR / str(year)
+    if not year_dir.exists():
+        return []
+    return sorted(
+        int(month_dir.name) for month_dir in year_dir.iterdir()
+        if month_dir.is_dir() and month_dir.name.isdigit() and any(month_dir.glob('*.bin.gz'))
+    )
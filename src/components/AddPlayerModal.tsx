@@ -5,10 +5,10 @@ import { useUIStore } from '../stores/useUIStore';
 import { useTeamPlayers } from '../hooks/useTeamPlayers';
 import type { PlayerIndex, IndexedPlayer } from '../types';
 import { getPlayerId } from '../types';
+import { fetchData } from '../utils/dataFetch';
 
 async function fetchPlayerIndex(): Promise<PlayerIndex> {
-  const basePath = import.meta.env.VITE_BASE_PATH || '';
-  const response = await fetch(`${basePath}/data/player-index.json`);
+  const response = await fetchData('player-index.json');
   if (!response.ok) {
     // Return empty index if not found
     return { players: [], year: new Date().getFullYear(), lastUpdated: '', count: 0 };
@@ -2,10 +2,10 @@
 import { useState } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import type { MetaData } from '../types';
+import { fetchData } from '../utils/dataFetch';
 
 async function fetchMeta(): Promise<MetaData> {
-  const basePath = import.meta.env.VITE_BASE_PATH || '';
-  const response = await fetch(`${basePath}/data/meta.json`);
+  const response = await fetchData('meta.json');
   if (!response.ok) throw new Error('Failed to fetch metadata');
   return response.json();
 }
@@ -25,10 +25,10 @@ import {
 } from '../utils/statsService';
 import { exportToCSV, downloadCSV, generateExportFilename } from '../utils/csvExport';
 import type { MiLBLevel, StatsByLevel, PlayersRegistry } from '../types';
+import { fetchData } from '../utils/dataFetch';
 
 async function fetchPlayers(): Promise<PlayersRegistry> {
-  const basePath = import.meta.env.VITE_BASE_PATH || '';
-  const response = await fetch(`${basePath}/data/players.json`);
+  const response = await fetchData('players.json');
   if (!response.ok) {
     // Return empty registry if not found
     return { players: [], lastUpdated: '' };
@@ -37,8 +37,7 @@ async function fetchPlayers(): Promise<PlayersRegistry> {
 }
 
 async function fetchPlayerIndex(): Promise<PlayerIndex> {
-  const basePath = import.meta.env.VITE_BASE_PATH || '';
-  const response = await fetch(`${basePath}/data/player-index.json`);
+  const response = await fetchData('player-index.json');
   if (!response.ok) {
     // Return empty index if not found
     return { players: [], year: new Date().getFullYear(), lastUpdated: '', count: 0 };
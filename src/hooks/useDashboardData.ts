@@ -34,10 +34,10 @@ import {
   calculateScorelessStreaks,
   calculateLevelDebuts,
 } from '../utils/dashboardCalculations';
+import { fetchData } from '../utils/dataFetch';
 
 async function fetchPlayerIndex(): Promise<PlayerIndex> {
-  const basePath = import.meta.env.VITE_BASE_PATH || '';
-  const response = await fetch(`${basePath}/data/player-index.json`);
+  const response = await fetchData('player-index.json');
   if (!response.ok) {
     return { players: [], year: new Date().getFullYear(), lastUpdated: '', count: 0 };
   }
@@ -0,0 +1,63 @@
+// utils/dataFetch.ts
+// Fetch data files, using the pre-compressed brotli sibling when the browser can decode it
+
+const basePath = import.meta.env.VITE_BASE_PATH || '';
+
+// scripts/compress_data.py writes a .br sibling next to each published file at
+// deploy time. GitHub Pages already serves the plain .json gzip-encoded, which
+// is what most browsers get; brotli is only a further saving where
+// DecompressionStream supports it, and the only variant worth an extra decode.
+const BROTLI_SUFFIX = '.br';
+
+let brotliSupported: boolean | null = null;
+
+// Whether this browser's DecompressionStream supports brotli
+function canDecompressBrotli(): boolean {
+  if (brotliSupported === null) {
+    brotliSupported = false;
+    if (typeof DecompressionStream !== 'undefined') {
+      try {
+        new DecompressionStream('brotli' as CompressionFormat);
+        brotliSupported = true;
+      } catch {
+        // Format not supported
+      }
+    }
+  }
+  return brotliSupported;
+}
+
+// Paths without a usable sibling (too small to compress, or not published),
+// so they're only probed once per session
+const missingSiblings = new Set<string>();
+
+async function fetchBrotli(url: string): Promise<Response | null> {
+  try {
+    const response = await fetch(`${url}${BROTLI_SUFFIX}`);
+    if (!response.ok || !response.body) {
+      missingSiblings.add(url);
+      return null;
+    }
+    const stream = response.body.pipeThrough(new DecompressionStream('brotli' as CompressionFormat));
+    const text = await new Response(stream).text();
+    return new Response(text, { status: 200, headers: { 'Content-Type': 'application/json' } });
+  } catch {
+    missingSiblings.add(url);
+    return null;
+  }
+}
+
+// Fetch a file under data/ (e.g. 'stats/2025/06.json'). Falls back to the
+// plain file when brotli is unsupported, the sibling is missing or decoding fails.
+export async function fetchData(path: string): Promise<Response> {
+  const url = `${basePath}/data/${path}`;
+
+  if (canDecompressBrotli() && !missingSiblings.has(url)) {
+    const response = await fetchBrotli(url);
+    if (response) {
+      return response;
+    }
+  }
+
+  return fetch(url);
+}
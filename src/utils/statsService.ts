@@ -2,8 +2,7 @@
 // Service for fetching and merging monthly stats files
 
 import type { StatsFile, PlayerStatsData, GameLogEntry, BattingStats, PitchingStats, StatcastBatterData, StatcastPitcherData } from '../types';
-
-const basePath = import.meta.env.VITE_BASE_PATH || '';
+import { fetchData } from './dataFetch';
 
 // Cache for loaded monthly data
 const monthlyStatsCache: Map<string, StatsFile> = new Map();
@@ -13,6 +12,8 @@ interface MonthlyManifest {
   year: number;
   updated: string;
   months: number[];
+  // Months whose Statcast blocks are in a {MM}.statcast.json sidecar
+  statcastMonths?: number[];
 }
 
 interface MonthlyStatsFile {
@@ -22,6 +23,13 @@ interface MonthlyStatsFile {
   players: StatsFile;
 }
 
+interface StatcastSidecarFile {
+  year: number;
+  month: number;
+  updated: string;
+  players: Record<string, NonNullable<PlayerStatsData['statcast']>>;
+}
+
 // Get manifest for a year
 async function fetchManifest(year: number): Promise<MonthlyManifest | null> {
   // Check cache first
@@ -30,7 +38,7 @@ async function fetchManifest(year: number): Promise<MonthlyManifest | null> {
   }
 
   try {
-    const response = await fetch(`${basePath}/data/stats/${year}/manifest.json`);
+    const response = await fetchData(`stats/${year}/manifest.json`);
     if (!response.ok) {
       return null;
     }
@@ -42,6 +50,20 @@ async function fetchManifest(year: number): Promise<MonthlyManifest | null> {
   }
 }
 
+// Fetch a month's Statcast sidecar (players -> statcast block)
+async function fetchStatcastSidecar(year: number, month: number): Promise<StatcastSidecarFile['players']> {
+  try {
+    const response = await fetchData(`stats/${year}/${month.toString().padStart(2, '0')}.statcast.json`);
+    if (!response.ok) {
+      return {};
+    }
+    const data = await response.json() as StatcastSidecarFile;
+    return data.players || {};
+  } catch {
+    return {};
+  }
+}
+
 // Fetch a single month's stats
 async function fetchMonthStats(year: number, month: number): Promise<StatsFile> {
   const cacheKey = `${year}-${month.toString().padStart(2, '0')}`;
@@ -52,12 +74,27 @@ async function fetchMonthStats(year: number, month: number): Promise<StatsFile>
   }
 
   try {
-    const response = await fetch(`${basePath}/data/stats/${year}/${month.toString().padStart(2, '0')}.json`);
+    // Only months listed in the manifest have a sidecar to join
+    const manifest = await fetchManifest(year);
+    const hasSidecar = manifest?.statcastMonths?.includes(month) ?? false;
+
+    const [response, statcast] = await Promise.all([
+      fetchData(`stats/${year}/${month.toString().padStart(2, '0')}.json`),
+      hasSidecar ? fetchStatcastSidecar(year, month) : Promise.resolve({} as StatcastSidecarFile['players']),
+    ]);
     if (!response.ok) {
       return {};
     }
     const data = await response.json() as MonthlyStatsFile;
     const stats = data.players || {};
+
+    // Join the sidecar's blocks onto the month's players
+    for (const [playerId, block] of Object.entries(statcast)) {
+      if (stats[playerId]) {
+        stats[playerId].statcast = block;
+      }
+    }
+
     monthlyStatsCache.set(cacheKey, stats);
     return stats;
   } catch {
@@ -68,7 +105,7 @@ async function fetchMonthStats(year: number, month: number): Promise<StatsFile>
 // Try to fetch legacy single-file stats (fallback for old data structure)
 async function fetchLegacyStats(year: number): Promise<StatsFile | null> {
   try {
-    const response = await fetch(`${basePath}/data/stats/${year}.json`);
+    const response = await fetchData(`stats/${year}.json`);
     if (!response.ok) {
       return null;
     }